@@ -10,8 +10,6 @@ import os
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.cover_letter_generator.memory_core import MemoryCore
-from src.cover_letter_generator.memory_interface import MemoryInterface
 from src.cover_letter_generator.visual_interface import VisualInterface
 
 def main():
@@ -28,6 +26,9 @@ def main():
     try:
         # Initialize memory system
         ui.start_loading("Loading memory system")
+        # Heavy modules are imported here so the banner shows while they load
+        from src.cover_letter_generator.memory_core import MemoryCore
+        from src.cover_letter_generator.memory_interface import MemoryInterface
         memory = MemoryCore()
         memory_interface = MemoryInterface(memory)
         ui.stop_loading()
@@ -8,6 +8,8 @@ import sys
 import os
 import json
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Any
 
 # Add the src directory to the Python path
@@ -17,10 +19,54 @@ try:
     from src.cover_letter_generator.memory_core import MemoryCore
     from src.cover_letter_generator.file_monitor import FileMonitor
     from src.cover_letter_generator.visual_interface import VisualInterface
+    from src.cover_letter_generator.keyword_matcher import KeywordMatcher
 except ImportError:
     print("❌ Could not import memory modules. Please run from the project root directory.")
     sys.exit(1)
 
+# Skill categories in priority order - a skill lands in the first category with a matching term
+SKILL_CATEGORIES = (
+    ("Programming & Scripting", frozenset({"python", "scripting", "bash", "powershell", "programming", "automation", ".net"})),
+    ("Databases & Data", frozenset({"sql", "mysql", "database", "data", "bi", "reporting", "crystal"})),
+    ("Networks & Security", frozenset({"network", "firewall", "vpn", "security", "tcp", "ip"})),
+    ("Systems Administration", frozenset({"windows", "linux", "active directory", "system", "admin", "patch", "backup"})),
+    ("Cloud & Infrastructure", frozenset({"cloud", "infrastructure", "vm", "virtual", "modernization"})),
+    ("Support & Troubleshooting", frozenset({"support", "troubleshooting", "help", "hardware", "software"})),
+)
+OTHER_SKILLS_CATEGORY = "Other Technical Skills"
+SKILL_CATEGORY_ORDER = tuple(name for name, _ in SKILL_CATEGORIES) + (OTHER_SKILLS_CATEGORY,)
+
+# Display icons, in the order event groups are listed
+EVENT_STATUS_ICONS = {"current": "🔄", "upcoming": "📅", "completed": "✅", "other": "📋"}
+FEEDBACK_OUTCOME_ICONS = {"accepted": "✅", "revision_requested": "🔄", "rejected": "❌"}
+
+# One automaton over every category term, valued by category priority
+_CATEGORY_MATCHER = KeywordMatcher(
+    (term, priority)
+    for priority, (_, terms) in enumerate(SKILL_CATEGORIES)
+    for term in terms
+)
+
+@lru_cache(maxsize=1024)
+def categorize_skill(skill_name_lower: str) -> str:
+    """Return the highest-priority category whose terms appear in the skill name"""
+    priorities = _CATEGORY_MATCHER.values_in(skill_name_lower)
+    if priorities:
+        return SKILL_CATEGORIES[min(priorities)][0]
+    return OTHER_SKILLS_CATEGORY
+
+def categorize_skills(named_skills: List[tuple]) -> Dict[str, List[Dict]]:
+    """Group (lowercased name, skill data) pairs by category, preserving order"""
+    grouped = {}
+    for skill_name_lower, skill_data in named_skills:
+        grouped.setdefault(categorize_skill(skill_name_lower), []).append(skill_data)
+    return grouped
+
+@lru_cache(maxsize=512)
+def truncate(text: str, limit: int) -> str:
+    """Shorten text to at most limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else f"{text[:limit - 3]}..."
+
 class MemoryNavigator:
     """User-friendly interface for exploring and understanding memory"""
     
@@ -32,6 +78,24 @@ class MemoryNavigator:
         except Exception as e:
             print(f"❌ Error initializing memory system: {e}")
             sys.exit(1)
+        
+        # Overview figures shown on every menu render, keyed by memory version
+        self._menu_stats_cache = None
+        self._menu_stats_version = None
+    
+    def _get_menu_stats(self) -> Dict[str, Any]:
+        """Return menu overview figures, recomputing only after memory changes"""
+        if self._menu_stats_cache is None or self._menu_stats_version != self.memory.version:
+            stats = self.memory.memory_data["metadata"]
+            interactions = stats["total_interactions"]
+            self._menu_stats_cache = {
+                "skills_count": len(self.memory.get_current_skills()),
+                "interactions": interactions,
+                "success_rate": (stats["successful_generations"] / max(1, interactions)) * 100,
+                "last_updated": stats['last_updated'][:19].replace('T', ' ')
+            }
+            self._menu_stats_version = self.memory.version
+        return self._menu_stats_cache
     
     def show_main_menu(self):
         """Display main navigation menu"""
@@ -40,33 +104,31 @@ class MemoryNavigator:
         self.ui.print_info("Explore what your AI assistant has learned about your preferences")
         self.ui.print_section_footer()
         
-        # Auto-sync files first
-        self.ui.print_info("Checking for file changes...")
-        sync_results = self.file_monitor.auto_sync_files()
-        
-        if sync_results["changes_detected"]:
-            self.ui.print_success("Files synchronized with memory!")
-            if sync_results["skillset_changes"]:
-                changes = sync_results["skillset_changes"]
-                self.ui.print_info(f"Skills: +{changes['added']} -{changes['removed']} ~{changes['updated']}")
-        
-        if sync_results["cleanup_results"]["invalid_skills_removed"] > 0:
-            cleanup = sync_results["cleanup_results"]
-            self.ui.print_success(f"Cleaned up {cleanup['invalid_skills_removed']} invalid entries")
+        # Auto-sync files first, skipping the full diff when nothing was touched
+        if self.file_monitor.needs_sync():
+            self.ui.print_info("Checking for file changes...")
+            sync_results = self.file_monitor.auto_sync_files()
+            
+            if sync_results["changes_detected"]:
+                self.ui.print_success("Files synchronized with memory!")
+                if sync_results["skillset_changes"]:
+                    changes = sync_results["skillset_changes"]
+                    self.ui.print_info(f"Skills: +{changes['added']} -{changes['removed']} ~{changes['updated']}")
+            
+            if sync_results["cleanup_results"]["invalid_skills_removed"] > 0:
+                cleanup = sync_results["cleanup_results"]
+                self.ui.print_success(f"Cleaned up {cleanup['invalid_skills_removed']} invalid entries")
         
         print()
         
         # Memory statistics
-        stats = self.memory.memory_data["metadata"]
-        skills_count = len(self.memory.get_current_skills())
-        interactions = stats["total_interactions"]
-        success_rate = (stats["successful_generations"] / max(1, interactions)) * 100
+        stats = self._get_menu_stats()
         
         self.ui.print_section_header("MEMORY OVERVIEW")
-        self.ui.print_info(f"Total Skills Learned: {skills_count}")
-        self.ui.print_info(f"Total Interactions: {interactions}")
-        self.ui.print_info(f"Success Rate: {success_rate:.1f}%")
-        self.ui.print_info(f"Last Updated: {stats['last_updated'][:19].replace('T', ' ')}")
+        self.ui.print_info(f"Total Skills Learned: {stats['skills_count']}")
+        self.ui.print_info(f"Total Interactions: {stats['interactions']}")
+        self.ui.print_info(f"Success Rate: {stats['success_rate']:.1f}%")
+        self.ui.print_info(f"Last Updated: {stats['last_updated']}")
         self.ui.print_section_footer()
         
         # Menu options
@@ -91,60 +153,21 @@ class MemoryNavigator:
             self.ui.print_warning("No skills learned yet.")
             return
         
-        # Categorize skills
-        categories = {
-            "Programming & Scripting": [],
-            "Databases & Data": [],
-            "Networks & Security": [],
-            "Systems Administration": [],
-            "Cloud & Infrastructure": [],
-            "Support & Troubleshooting": [],
-            "Other Technical Skills": []
-        }
-        
-        # Categorize each skill
-        for skill_key, skill_data in skills.items():
-            skill_name = skill_data["skill_name"].lower()
-            categorized = False
-            
-            # Programming
-            if any(term in skill_name for term in ["python", "scripting", "bash", "powershell", "programming", "automation", ".net"]):
-                categories["Programming & Scripting"].append(skill_data)
-                categorized = True
-            # Databases
-            elif any(term in skill_name for term in ["sql", "mysql", "database", "data", "bi", "reporting", "crystal"]):
-                categories["Databases & Data"].append(skill_data)
-                categorized = True
-            # Networks
-            elif any(term in skill_name for term in ["network", "firewall", "vpn", "security", "tcp", "ip"]):
-                categories["Networks & Security"].append(skill_data)
-                categorized = True
-            # Systems
-            elif any(term in skill_name for term in ["windows", "linux", "active directory", "system", "admin", "patch", "backup"]):
-                categories["Systems Administration"].append(skill_data)
-                categorized = True
-            # Cloud
-            elif any(term in skill_name for term in ["cloud", "infrastructure", "vm", "virtual", "modernization"]):
-                categories["Cloud & Infrastructure"].append(skill_data)
-                categorized = True
-            # Support
-            elif any(term in skill_name for term in ["support", "troubleshooting", "help", "hardware", "software"]):
-                categories["Support & Troubleshooting"].append(skill_data)
-                categorized = True
-            
-            if not categorized:
-                categories["Other Technical Skills"].append(skill_data)
+        # Categorize skills with a single automaton pass per skill name
+        skill_names_lower = self.memory.get_skill_names_lower()
+        categories = categorize_skills([
+            (skill_names_lower[skill_key], skill_data) for skill_key, skill_data in skills.items()
+        ])
         
         # Display categorized skills
-        for category, skills_list in categories.items():
+        for category in SKILL_CATEGORY_ORDER:
+            skills_list = categories.get(category)
             if skills_list:
-                print(f"\n{self.ui.print_info.__class__.__module__}")  # Spacing
+                self.ui.print_blank_line()
                 self.ui.print_info(f"📂 {category} ({len(skills_list)} skills)")
                 
                 for skill in skills_list[:5]:  # Show top 5 per category
-                    proficiency = skill["proficiency_level"]
-                    if len(proficiency) > 50:
-                        proficiency = proficiency[:47] + "..."
+                    proficiency = truncate(skill["proficiency_level"], 50)
                     
                     self.ui.print_info(f"   • {skill['skill_name']}")
                     self.ui.print_info(f"     Level: {proficiency}")
@@ -169,18 +192,14 @@ class MemoryNavigator:
                 self.ui.print_info(f"\n📝 {category_name} ({len(preferences)} rules)")
                 
                 for i, pref in enumerate(preferences[:3], 1):  # Show top 3
-                    rule = pref["rule"]
-                    if len(rule) > 80:
-                        rule = rule[:77] + "..."
+                    rule = truncate(pref["rule"], 80)
                     
                     success_rate = pref.get("success_rate", 0) * 100
                     self.ui.print_info(f"   {i}. {rule}")
                     self.ui.print_info(f"      Success Rate: {success_rate:.0f}%")
                     
                     if pref.get("context"):
-                        context = pref["context"]
-                        if len(context) > 60:
-                            context = context[:57] + "..."
+                        context = truncate(pref["context"], 60)
                         self.ui.print_info(f"      Source: {context}")
                 
                 if len(preferences) > 3:
@@ -201,25 +220,22 @@ class MemoryNavigator:
             return
         
         # Group by status
-        status_groups = {"current": [], "upcoming": [], "completed": [], "other": []}
+        status_groups = {}
         
         for event in events:
             status = event.get("status", "other")
-            if status in status_groups:
-                status_groups[status].append(event)
-            else:
-                status_groups["other"].append(event)
+            if status not in EVENT_STATUS_ICONS:
+                status = "other"
+            status_groups.setdefault(status, []).append(event)
         
         # Display each group
-        for status, group in status_groups.items():
+        for status, status_icon in EVENT_STATUS_ICONS.items():
+            group = status_groups.get(status)
             if group:
-                status_icon = {"current": "🔄", "upcoming": "📅", "completed": "✅", "other": "📋"}
-                self.ui.print_info(f"\n{status_icon[status]} {status.title()} Events ({len(group)})")
+                self.ui.print_info(f"\n{status_icon} {status.title()} Events ({len(group)})")
                 
                 for event in group:
-                    description = event["description"]
-                    if len(description) > 70:
-                        description = description[:67] + "..."
+                    description = truncate(event["description"], 70)
                     
                     self.ui.print_info(f"   • {description}")
                     
@@ -243,13 +259,22 @@ class MemoryNavigator:
             self.ui.print_warning("No feedback history available.")
             return
         
-        # Calculate statistics
+        # Calculate statistics in a single pass
         total_feedback = len(feedback_history)
-        accepted = len([f for f in feedback_history if f["outcome"] == "accepted"])
-        revisions = len([f for f in feedback_history if f["outcome"] == "revision_requested"])
-        rejected = len([f for f in feedback_history if f["outcome"] == "rejected"])
+        accepted = revisions = rejected = 0
+        effectiveness_total = 0.0
         
-        avg_effectiveness = sum(f.get("effectiveness_score", 0) for f in feedback_history) / total_feedback
+        for f in feedback_history:
+            outcome = f["outcome"]
+            if outcome == "accepted":
+                accepted += 1
+            elif outcome == "revision_requested":
+                revisions += 1
+            elif outcome == "rejected":
+                rejected += 1
+            effectiveness_total += f.get("effectiveness_score", 0)
+        
+        avg_effectiveness = effectiveness_total / total_feedback
         
         self.ui.print_info(f"📊 Feedback Statistics")
         self.ui.print_info(f"   Total Feedback: {total_feedback}")
@@ -260,15 +285,10 @@ class MemoryNavigator:
         
         # Recent feedback
         self.ui.print_info(f"\n📝 Recent Feedback (Last 3)")
-        recent = feedback_history[-3:] if len(feedback_history) >= 3 else feedback_history
-        
-        for i, feedback in enumerate(reversed(recent), 1):
-            outcome_emoji = {"accepted": "✅", "revision_requested": "🔄", "rejected": "❌"}
-            emoji = outcome_emoji.get(feedback["outcome"], "📝")
+        for i, feedback in enumerate(self.memory.get_recent_feedback(3), 1):
+            emoji = FEEDBACK_OUTCOME_ICONS.get(feedback["outcome"], "📝")
             
-            feedback_text = feedback["feedback_text"]
-            if len(feedback_text) > 60:
-                feedback_text = feedback_text[:57] + "..."
+            feedback_text = truncate(feedback["feedback_text"], 60)
             
             self.ui.print_info(f"   {emoji} {feedback_text}")
             self.ui.print_info(f"      Outcome: {feedback['outcome']}")
@@ -302,9 +322,9 @@ class MemoryNavigator:
                     self.ui.print_info(f"   🛠️  Skill: {data['skill_name']}")
                     self.ui.print_info(f"      Level: {data['proficiency_level']}")
                 elif result_type == "style":
-                    self.ui.print_info(f"   📝 Style: {data['rule'][:60]}...")
+                    self.ui.print_info(f"   📝 Style: {truncate(data['rule'], 63)}")
                 elif result_type == "feedback":
-                    self.ui.print_info(f"   💬 Feedback: {data['feedback_text'][:60]}...")
+                    self.ui.print_info(f"   💬 Feedback: {truncate(data['feedback_text'], 63)}")
             
             if len(results) > 10:
                 self.ui.print_info(f"   ... and {len(results) - 10} more results")
@@ -322,44 +342,49 @@ class MemoryNavigator:
         report_path = f"/mnt/d/Claude/output/memory_report_{timestamp}.txt"
         
         try:
+            # Assemble the whole report in memory and write it out once
+            parts = [
+                "COVER LETTER GPT - MEMORY REPORT\n",
+                "=" * 50 + "\n",
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            ]
+            
+            # Statistics
+            stats = self.memory.memory_data["metadata"]
+            skills = self.memory.get_current_skills()
+            skills_count = len(skills)
+            parts.append("OVERVIEW\n")
+            parts.append("-" * 20 + "\n")
+            parts.append(f"Skills Learned: {skills_count}\n")
+            parts.append(f"Total Interactions: {stats['total_interactions']}\n")
+            parts.append(f"Success Rate: {(stats['successful_generations']/max(1,stats['total_interactions']))*100:.1f}%\n\n")
+            
+            # Skills
+            if skills:
+                parts.append("TECHNICAL SKILLS\n")
+                parts.append("-" * 20 + "\n")
+                for skill_data in islice(skills.values(), 20):  # Top 20 skills
+                    parts.append(f"• {skill_data['skill_name']}\n")
+                    parts.append(f"  Level: {skill_data['proficiency_level']}\n")
+                    if skill_data.get("context"):
+                        parts.append(f"  Source: {skill_data['context']}\n")
+                    parts.append("\n")
+            
+            # Style preferences
+            style_prefs = self.memory.get_style_preferences()
+            parts.append("WRITING PREFERENCES\n")
+            parts.append("-" * 20 + "\n")
+            
+            for category, prefs in style_prefs.items():
+                if prefs:
+                    parts.append(f"\n{category.replace('_', ' ').title()}:\n")
+                    for pref in prefs[:5]:  # Top 5 per category
+                        parts.append(f"• {pref['rule']}\n")
+            
+            parts.append(f"\n\nReport saved: {report_path}\n")
+            
             with open(report_path, 'w', encoding='utf-8') as f:
-                f.write("COVER LETTER GPT - MEMORY REPORT\n")
-                f.write("=" * 50 + "\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                # Statistics
-                stats = self.memory.memory_data["metadata"]
-                skills_count = len(self.memory.get_current_skills())
-                f.write("OVERVIEW\n")
-                f.write("-" * 20 + "\n")
-                f.write(f"Skills Learned: {skills_count}\n")
-                f.write(f"Total Interactions: {stats['total_interactions']}\n")
-                f.write(f"Success Rate: {(stats['successful_generations']/max(1,stats['total_interactions']))*100:.1f}%\n\n")
-                
-                # Skills
-                skills = self.memory.get_current_skills()
-                if skills:
-                    f.write("TECHNICAL SKILLS\n")
-                    f.write("-" * 20 + "\n")
-                    for skill_data in list(skills.values())[:20]:  # Top 20 skills
-                        f.write(f"• {skill_data['skill_name']}\n")
-                        f.write(f"  Level: {skill_data['proficiency_level']}\n")
-                        if skill_data.get("context"):
-                            f.write(f"  Source: {skill_data['context']}\n")
-                        f.write("\n")
-                
-                # Style preferences
-                style_prefs = self.memory.get_style_preferences()
-                f.write("WRITING PREFERENCES\n")
-                f.write("-" * 20 + "\n")
-                
-                for category, prefs in style_prefs.items():
-                    if prefs:
-                        f.write(f"\n{category.replace('_', ' ').title()}:\n")
-                        for pref in prefs[:5]:  # Top 5 per category
-                            f.write(f"• {pref['rule']}\n")
-                
-                f.write(f"\n\nReport saved: {report_path}\n")
+                f.write("".join(parts))
             
             self.ui.print_success(f"Report exported to: {report_path}")
             
@@ -382,7 +407,7 @@ class MemoryNavigator:
         self.ui.print_info(f"Duplicates removed: {cleanup_results['duplicates_removed']}")
         
         # Show memory size
-        memory_size = os.path.getsize(self.memory.memory_file)
+        memory_size = self.memory.get_memory_file_size()
         self.ui.print_info(f"Memory file size: {memory_size / 1024:.1f} KB")
         
         self.ui.print_section_footer()
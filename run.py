@@ -7,6 +7,7 @@ Run this file to start the application.
 
 Usage:
     python run.py
+    python run.py --help | --version
 
 Requirements:
     - OpenAI API key set in environment variable OPENAI_API_KEY
@@ -19,6 +20,16 @@ import os
 # Add src directory to Python path to enable imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Answer trivial invocations before importing the application and its OpenAI dependencies
+if __name__ == "__main__" and len(sys.argv) > 1:
+    if sys.argv[1] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    if sys.argv[1] == '--version':
+        from cover_letter_generator import __version__
+        print(f"Cover Letter Generator {__version__}")
+        sys.exit(0)
+
 try:
     from cover_letter_generator.main import main
     
@@ -13,7 +13,6 @@ import os
 import sys
 import subprocess
 import platform
-from pathlib import Path
 
 def print_header():
     """Print welcome header"""
@@ -53,23 +52,43 @@ def install_dependencies():
     try:
         # Install main dependencies
         subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], 
-                      check=True, capture_output=True)
+                      check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         print("✅ Main dependencies installed")
         
         # Check if user wants development dependencies
         install_dev = input("Install development dependencies? (y/N): ").strip().lower()
         if install_dev in ['y', 'yes']:
             subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements-test.txt'], 
-                          check=True, capture_output=True)
+                          check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             print("✅ Development dependencies installed")
         
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing dependencies: {e}")
+        if e.stderr:
+            print(f"   {e.stderr.decode(errors='replace').strip()}")
         print("   Try running manually: pip install -r requirements.txt")
         return False
     
     return True
 
+def find_missing_paths(paths):
+    """Return the paths that do not exist, listing each parent directory only once"""
+    by_parent = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        by_parent.setdefault(parent or '.', []).append((path, name))
+    
+    missing = set()
+    for parent, entries in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                present = {entry.name for entry in it}
+        except OSError:
+            present = set()
+        missing.update(path for path, name in entries if name not in present)
+    
+    return [path for path in paths if path in missing]
+
 def validate_structure():
     """Validate project structure"""
     required_dirs = [
@@ -81,10 +100,7 @@ def validate_structure():
         "docs"
     ]
     
-    missing = []
-    for dir_path in required_dirs:
-        if not Path(dir_path).exists():
-            missing.append(dir_path)
+    missing = find_missing_paths(required_dirs)
     
     if missing:
         print(f"❌ Missing directories: {', '.join(missing)}")
@@ -102,10 +118,7 @@ def create_demo_files():
         "data/input/job_listing.txt"
     ]
     
-    missing = []
-    for file_path in demo_files:
-        if not Path(file_path).exists():
-            missing.append(file_path)
+    missing = find_missing_paths(demo_files)
     
     if missing:
         print(f"⚠️  Missing demo files: {', '.join(missing)}")
@@ -9,22 +9,328 @@ Purpose: Ultra-fine-tuned relevance matching for public GitHub showcase
 """
 
 import re
-import json
+import sys
 import math
-import pickle
-from typing import Dict, List, Tuple, Any, Optional, Set
-from collections import defaultdict, Counter
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+import time
+from typing import Dict, List, Tuple, Any, Optional, Set, BinaryIO, Iterable
+from collections import abc, Counter, OrderedDict
+from datetime import datetime
+from dataclasses import dataclass, field, fields
 import hashlib
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 
 # Import our performance monitoring and error handling
 from .performance_monitor import performance_monitor, get_global_performance_monitor
 from .error_handler import with_error_handling, get_global_error_handler
+from .keyword_matcher import KeywordMatcher
+from . import json_codec
 
+# Use xxhash for analysis cache keys when available, fall back to hashlib MD5
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
 
-@dataclass
+# hashlib accepts usedforsecurity from Python 3.9
+_MD5_OPTIONS = {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+
+# Slotted dataclasses need Python 3.10; older interpreters keep per-instance dicts
+_SLOTS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Skill extraction patterns, compiled once at import; they run on lowercased text, so no IGNORECASE
+_REQUIRED_SKILL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"required?:?\s*([^.!?]*)",
+    r"must have:?\s*([^.!?]*)",
+    r"essential:?\s*([^.!?]*)",
+    r"minimum requirements?:?\s*([^.!?]*)",
+    r"qualifications?:?\s*([^.!?]*)"
+))
+
+_PREFERRED_SKILL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"preferred?:?\s*([^.!?]*)",
+    r"nice to have:?\s*([^.!?]*)",
+    r"bonus:?\s*([^.!?]*)",
+    r"plus:?\s*([^.!?]*)",
+    r"desired:?\s*([^.!?]*)"
+))
+
+_TECHNOLOGY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"\b(?:java|python|javascript|sql|aws|azure|linux|windows|oracle|mysql)\b",
+    r"\b(?:react|angular|vue|docker|kubernetes|git|jenkins)\b"
+))
+
+# (reported name, pattern) pairs
+_SOFT_SKILL_PATTERNS = tuple((pattern.replace(".", " "), re.compile(pattern)) for pattern in (
+    r"communication", r"leadership", r"teamwork", r"problem.solving",
+    r"analytical", r"detail.oriented", r"time.management", r"adaptability"
+))
+
+_RESPONSIBILITY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"responsibilities?:?\s*([^.!?]*)",
+    r"duties:?\s*([^.!?]*)",
+    r"you will:?\s*([^.!?]*)",
+    r"the role involves:?\s*([^.!?]*)"
+))
+
+# Context indicator phrases by bucket, matched as plain substrings
+_CONTEXT_INDICATORS = {
+    "large_company": (
+        "enterprise", "fortune 500", "global", "multinational", "corporation",
+        "thousands of employees", "worldwide", "international"
+    ),
+    "small_company": (
+        "startup", "small business", "growing company", "entrepreneurial",
+        "close-knit team", "wear many hats", "fast-paced"
+    ),
+    "senior": ("senior", "lead", "principal", "architect", "5+ years", "7+ years"),
+    "junior": ("junior", "entry", "associate", "0-2 years", "recent graduate"),
+    "complex_responsibility": (
+        "architect", "design", "lead", "mentor", "strategy", "planning",
+        "cross-functional", "stakeholder management"
+    ),
+    "high_compensation": (
+        "competitive salary", "excellent benefits", "equity", "stock options",
+        "bonus", "401k", "health insurance", "remote work"
+    ),
+    "growth": (
+        "career growth", "advancement", "mentorship", "learning", "development",
+        "training", "certification", "conference", "education"
+    ),
+    "remote": (
+        "remote", "work from home", "distributed team", "flexible location",
+        "telecommute", "virtual", "anywhere"
+    )
+}
+
+# Buckets for each indicator; an indicator may belong to several
+_CONTEXT_INDICATOR_BUCKETS = {
+    indicator: [bucket for bucket, members in _CONTEXT_INDICATORS.items() if indicator in members]
+    for indicators in _CONTEXT_INDICATORS.values() for indicator in indicators
+}
+
+# Joins cluster terms so one substring test covers a whole cluster
+_CLUSTER_TERM_SEPARATOR = "\0"
+
+# Joins a skill's name and context so one keyword scan covers both without matching across them
+_SKILL_FIELD_SEPARATOR = "\0"
+
+# Per job experience level, the skill-context substrings that earn the alignment (none needed
+# when empty) and the alignment they earn
+_EXPERIENCE_ALIGNMENT: Dict[str, Tuple[Tuple[str, ...], float]] = {
+    "senior": (("senior",), 0.2),
+    "junior": (("basic", "entry", "beginner"), 0.1),
+    "mid": ((), 0.1),
+}
+
+# Pure technical skills penalized for business roles when their name holds one of these
+_TECHNICAL_ONLY_TERMS = ("network security", "server administration", "hardware troubleshooting")
+
+# Score explanation codes pack the requirement-match tier in bits 0-1, the domain-relevance tier in
+# bits 2-3 and one bit each for industry value, semantic similarity and role mismatch
+_REQUIREMENT_MATCH_PHRASES = (None, "Weak match with job requirements",
+                              "Moderate match with job requirements", "Strong match with job requirements")
+_DOMAIN_RELEVANCE_LEVELS = (None, "Moderate", "High")
+_INDUSTRY_VALUE_FLAG = 1 << 4
+_SEMANTIC_SIMILARITY_FLAG = 1 << 5
+_ROLE_MISMATCH_FLAG = 1 << 6
+
+# Thresholds for the base score (three tiers), domain boost (two tiers), industry relevance, semantic
+# similarity and penalty, and the code weight of passing each; passed tiers add up to the tier index
+_EXPLANATION_THRESHOLDS = np.array([0.1, 0.4, 0.7, 0.2, 0.5, 0.1, 0.2, 0.0])
+_EXPLANATION_WEIGHTS = np.array(
+    [1, 1, 1, 1 << 2, 1 << 2, _INDUSTRY_VALUE_FLAG, _SEMANTIC_SIMILARITY_FLAG, _ROLE_MISMATCH_FLAG], dtype=np.int8
+)
+
+# Token separator for similarity scoring; splitting on it yields the \w+ runs
+_NON_WORD_PATTERN = re.compile(r'\W+')
+
+# Industry signals: keywords count per whole-word occurrence, indicators and tech once
+_INDUSTRY_PATTERNS = {
+    "healthcare": {
+        "keywords": ["healthcare", "medical", "hospital", "clinic", "patient", "hipaa", "epic", "cerner"],
+        "context_indicators": ["patient care", "medical records", "clinical", "pharmaceutical"],
+        "tech_stack": ["epic", "cerner", "meditech", "allscripts"]
+    },
+    "finance": {
+        "keywords": ["finance", "banking", "financial", "investment", "trading", "risk", "compliance"],
+        "context_indicators": ["financial analysis", "risk management", "regulatory", "trading systems"],
+        "tech_stack": ["bloomberg", "reuters", "murex", "calypso", "sap", "oracle financials"]
+    },
+    "technology": {
+        "keywords": ["software", "development", "engineering", "tech", "startup", "saas", "platform"],
+        "context_indicators": ["software development", "cloud", "agile", "devops", "microservices"],
+        "tech_stack": ["aws", "azure", "kubernetes", "docker", "react", "python"]
+    },
+    "manufacturing": {
+        "keywords": ["manufacturing", "production", "factory", "industrial", "supply chain", "quality"],
+        "context_indicators": ["production line", "inventory", "lean manufacturing", "six sigma"],
+        "tech_stack": ["sap", "oracle", "mes", "scada", "plm"]
+    },
+    "education": {
+        "keywords": ["education", "university", "school", "academic", "research", "student"],
+        "context_indicators": ["curriculum", "learning", "research", "academic"],
+        "tech_stack": ["canvas", "blackboard", "moodle", "peoplesoft"]
+    },
+    "retail": {
+        "keywords": ["retail", "ecommerce", "customer", "sales", "marketing", "brand"],
+        "context_indicators": ["customer experience", "point of sale", "inventory", "merchandising"],
+        "tech_stack": ["salesforce", "shopify", "sap retail", "oracle retail"]
+    }
+}
+
+
+# Points per industry term by category; keywords score every whole-word occurrence
+_INDUSTRY_TERM_WEIGHTS = {"keywords": 2, "context_indicators": 3, "tech_stack": 4}
+_PER_OCCURRENCE_CATEGORY = "keywords"
+
+# Pre-computed semantic clusters for common IT/business terms
+_SEMANTIC_CLUSTERS = {
+    "database_management": [
+        "database", "sql", "mysql", "postgresql", "oracle", "mongodb", 
+        "data management", "database administration", "dba", "query optimization"
+    ],
+    "network_administration": [
+        "network", "networking", "tcp/ip", "dns", "dhcp", "vpn", "firewall",
+        "network security", "lan", "wan", "routing", "switching"
+    ],
+    "system_administration": [
+        "system admin", "server management", "linux", "windows", "unix",
+        "server administration", "infrastructure", "system maintenance"
+    ],
+    "cloud_technologies": [
+        "cloud", "aws", "azure", "gcp", "cloud computing", "saas", "paas", "iaas",
+        "cloud architecture", "cloud migration", "serverless"
+    ],
+    "business_analysis": [
+        "business analyst", "requirements gathering", "process improvement",
+        "business requirements", "stakeholder management", "gap analysis"
+    ],
+    "project_management": [
+        "project management", "project manager", "scrum", "agile", "kanban",
+        "project coordination", "timeline management", "resource planning"
+    ],
+    "data_analysis": [
+        "data analysis", "analytics", "reporting", "business intelligence",
+        "data visualization", "excel", "pivot tables", "dashboards"
+    ]
+}
+
+
+# Joined terms per cluster, for testing whether an input is part of any cluster term
+_JOINED_CLUSTER_TERMS = {
+    cluster_name: _CLUSTER_TERM_SEPARATOR.join(terms)
+    for cluster_name, terms in _SEMANTIC_CLUSTERS.items()
+}
+
+# Synonym mappings
+_SYNONYMS = {
+    "sys admin": "system administrator",
+    "sysadmin": "system administrator",
+    "net admin": "network administrator",
+    "dba": "database administrator",
+    "pm": "project manager",
+    "ba": "business analyst",
+    "dev": "developer",
+    "qa": "quality assurance"
+}
+
+
+# Enhanced domain definitions
+_TECH_DOMAINS = {
+    "databases": {
+        "keywords": ["sql", "mysql", "postgresql", "oracle", "mongodb", "nosql", "database", "db", "data", "query"],
+        "weight": 1.0,
+        "industry_boost": {"finance": 1.5, "healthcare": 1.3, "retail": 1.2}
+    },
+    "programming": {
+        "keywords": ["python", "java", "c++", "javascript", "nodejs", "php", "ruby", "go", "rust", ".net"],
+        "weight": 1.2,
+        "industry_boost": {"technology": 1.8, "finance": 1.3}
+    },
+    "web": {
+        "keywords": ["html", "css", "react", "angular", "vue", "frontend", "backend", "web", "http", "api", "rest"],
+        "weight": 1.1,
+        "industry_boost": {"technology": 1.6, "retail": 1.4}
+    },
+    "cloud": {
+        "keywords": ["aws", "azure", "gcp", "cloud", "docker", "kubernetes", "serverless", "microservices"],
+        "weight": 1.3,
+        "industry_boost": {"technology": 1.7, "finance": 1.4}
+    },
+    "networking": {
+        "keywords": ["network", "tcp", "ip", "dns", "firewall", "vpn", "router", "switch", "security"],
+        "weight": 1.2,
+        "industry_boost": {"technology": 1.5, "healthcare": 1.3}
+    },
+    "systems": {
+        "keywords": ["linux", "windows", "unix", "server", "admin", "infrastructure", "deployment"],
+        "weight": 1.1,
+        "industry_boost": {"technology": 1.4, "manufacturing": 1.3}
+    },
+    "security": {
+        "keywords": ["security", "cybersecurity", "encryption", "authentication", "authorization", "compliance"],
+        "weight": 1.4,
+        "industry_boost": {"finance": 1.8, "healthcare": 1.6}
+    },
+    "automation": {
+        "keywords": ["automation", "scripting", "powershell", "bash", "workflow", "ci/cd", "devops"],
+        "weight": 1.2,
+        "industry_boost": {"technology": 1.6, "manufacturing": 1.4}
+    }
+}
+
+
+_BUSINESS_DOMAINS = {
+    "business_analysis": {
+        "keywords": ["business analyst", "requirements", "process improvement", "workflow", "documentation"],
+        "weight": 1.0,
+        "industry_boost": {"finance": 1.4, "healthcare": 1.3}
+    },
+    "finance": {
+        "keywords": ["finance", "financial", "accounting", "order to cash", "collections", "credit"],
+        "weight": 1.1,
+        "industry_boost": {"finance": 1.8, "manufacturing": 1.2}
+    },
+    "project_management": {
+        "keywords": ["project management", "scrum", "agile", "stakeholder management", "timeline"],
+        "weight": 1.2,
+        "industry_boost": {"technology": 1.5, "manufacturing": 1.4}
+    },
+    "business_intelligence": {
+        "keywords": ["business intelligence", "bi", "power bi", "tableau", "data visualization", "dashboard"],
+        "weight": 1.3,
+        "industry_boost": {"finance": 1.6, "retail": 1.4}
+    }
+}
+
+
+# Role classification with enhanced patterns
+_ROLE_TYPES = {
+    "technical_it": {
+        "patterns": ["technician", "engineer", "developer", "administrator", "support specialist", 
+                   "network", "system admin", "security analyst", "devops", "infrastructure"],
+        "weight": 1.0,
+        "complexity_indicators": ["senior", "lead", "principal", "architect"]
+    },
+    "business_analyst": {
+        "patterns": ["business analyst", "process analyst", "functional analyst", "systems analyst"],
+        "weight": 1.0,
+        "complexity_indicators": ["senior", "lead", "principal"]
+    },
+    "management": {
+        "patterns": ["manager", "director", "supervisor", "team lead", "department head"],
+        "weight": 1.0,
+        "complexity_indicators": ["senior", "executive", "vice president", "c-level"]
+    }
+}
+
+
+@dataclass(**_SLOTS_OPTIONS)
 class JobAnalysisResult:
     """Comprehensive job analysis result with rich metadata"""
     job_role_type: str
@@ -44,30 +350,17 @@ class JobAnalysisResult:
     compensation_indicators: Dict[str, Any]
     growth_potential: float
     remote_work_indicators: List[str]
+    # Domain scores aligned with the rows of the engine's domain matrices, for batch scoring
+    tech_domain_scores: Optional[np.ndarray] = field(default=None, repr=False, compare=False,
+                                                     metadata={"export": False})
+    business_domain_scores: Optional[np.ndarray] = field(default=None, repr=False, compare=False,
+                                                         metadata={"export": False})
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "job_role_type": self.job_role_type,
-            "primary_focus": self.primary_focus,
-            "confidence_score": self.confidence_score,
-            "required_skills": self.required_skills,
-            "preferred_skills": self.preferred_skills,
-            "tech_domains": self.tech_domains,
-            "business_domains": self.business_domains,
-            "industry_context": self.industry_context,
-            "experience_level": self.experience_level,
-            "company_size": self.company_size,
-            "role_complexity": self.role_complexity,
-            "explicit_technologies": self.explicit_technologies,
-            "soft_skills": self.soft_skills,
-            "key_responsibilities": self.key_responsibilities,
-            "compensation_indicators": self.compensation_indicators,
-            "growth_potential": self.growth_potential,
-            "remote_work_indicators": self.remote_work_indicators
-        }
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.metadata.get("export", True)}
 
 
-@dataclass
+@dataclass(**_SLOTS_OPTIONS)
 class SkillRelevanceScore:
     """Detailed skill relevance scoring with explanation"""
     skill_name: str
@@ -81,87 +374,309 @@ class SkillRelevanceScore:
     confidence: float
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "skill_name": self.skill_name,
-            "base_score": self.base_score,
-            "domain_boost": self.domain_boost,
-            "experience_alignment": self.experience_alignment,
-            "industry_relevance": self.industry_relevance,
-            "semantic_similarity": self.semantic_similarity,
-            "final_score": self.final_score,
-            "explanation": self.explanation,
-            "confidence": self.confidence
-        }
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass
+class DomainMatrix:
+    """Keyword membership, weights and industry boosts for one group of domains, for vectorized scoring"""
+    domain_names: List[str]
+    membership: np.ndarray
+    weights: np.ndarray
+    boosts: np.ndarray
+    industry_columns: Dict[str, int]
+    keyword_rows: Dict[str, List[int]]
+    industry_keyword_rows: Dict[str, Dict[str, int]]
+    
+    def boost_column(self, industry: str) -> np.ndarray:
+        """Per-domain boost for an industry; the last column holds 1.0 for unlisted industries"""
+        return self.boosts[:, self.industry_columns.get(industry, -1)]
+    
+    def last_boosting_row(self, industry: str, keywords: Set[str]) -> Optional[int]:
+        """Last domain row that boosts the industry and lists one of the keywords, or None"""
+        keyword_rows = self.industry_keyword_rows.get(industry)
+        if not keyword_rows:
+            return None
+        return max((keyword_rows[keyword] for keyword in keywords if keyword in keyword_rows), default=None)
+
+
+def _build_domain_matrix(domains: Dict[str, Dict[str, Any]], keyword_index: Dict[str, int]) -> DomainMatrix:
+    """Build the membership and boost matrices and the keyword index for a group of domains"""
+    industry_columns = {
+        industry: column for column, industry in enumerate(dict.fromkeys(
+            industry for config in domains.values() for industry in config.get("industry_boost", {})
+        ))
+    }
+    # Counts stay float64: at a few domains by a hundred keywords, BLAS float matmul beats
+    # integer matmul on an int8 copy, and the products are exact either way
+    membership = np.zeros((len(domains), len(keyword_index)))
+    boosts = np.ones((len(domains), len(industry_columns) + 1))
+    for row, config in enumerate(domains.values()):
+        for keyword in config["keywords"]:
+            membership[row, keyword_index[keyword]] += 1
+        for industry, boost in config.get("industry_boost", {}).items():
+            boosts[row, industry_columns[industry]] = boost
+    
+    # Inverted index from each keyword to the rows of the domains listing it, once per listing
+    keyword_rows: Dict[str, List[int]] = {}
+    # Per industry, the last row that boosts it for each keyword, since later domains take precedence
+    industry_keyword_rows: Dict[str, Dict[str, int]] = {}
+    for row, (domain, config) in enumerate(domains.items()):
+        for keyword in config["keywords"]:
+            keyword_rows.setdefault(keyword, []).append(row)
+        for industry in config.get("industry_boost", {}):
+            industry_keyword_rows.setdefault(industry, {}).update(dict.fromkeys(config["keywords"], row))
+    
+    return DomainMatrix(
+        domain_names=list(domains),
+        membership=membership,
+        weights=np.array([config["weight"] for config in domains.values()], dtype=float),
+        boosts=boosts,
+        industry_columns=industry_columns,
+        keyword_rows=keyword_rows,
+        industry_keyword_rows=industry_keyword_rows
+    )
+
+
+
+@dataclass
+class SkillScoringPlan:
+    """Job-dependent choices of the per-skill scoring steps, resolved once per batch"""
+    scan_keywords: bool
+    domain_matrix: DomainMatrix
+    domain_contributions: Dict[int, float]
+    experience_terms: Tuple[str, ...]
+    experience_alignment: float
+    industry: str
+    industry_relevances: Dict[int, float]
+    penalize_technical_terms: bool
+
+
+@dataclass
+class IndustryTermTable:
+    """Flattened (term, industry, weight) entries of the industry patterns, for bincount scoring"""
+    industry_names: List[str]
+    term_index: Dict[str, int]
+    entry_terms: np.ndarray
+    entry_industries: np.ndarray
+    entry_weights: np.ndarray
+    entry_per_occurrence: np.ndarray
+    
+    def score(self, found_terms: Set[str], word_counts: Counter) -> np.ndarray:
+        """Per-industry scores from the terms found and their whole-word counts"""
+        # Scans shared with other analyzers also report terms outside this table
+        term_index = self.term_index
+        term_found = np.zeros(len(term_index))
+        term_found[[term_index[term] for term in found_terms if term in term_index]] = 1
+        term_counts = np.zeros(len(term_index))
+        for term, count in word_counts.items():
+            column = term_index.get(term)
+            if column is not None:
+                term_counts[column] = count
+        
+        hits = np.where(self.entry_per_occurrence, term_counts[self.entry_terms], term_found[self.entry_terms])
+        return np.bincount(self.entry_industries, weights=self.entry_weights * hits,
+                           minlength=len(self.industry_names))
+
+
+def _build_industry_term_table(industry_patterns: Dict[str, Dict[str, List[str]]]) -> IndustryTermTable:
+    """Assign every distinct term an id and list one weighted entry per term, industry and category"""
+    term_index: Dict[str, int] = {}
+    entries = []
+    for industry_id, patterns in enumerate(industry_patterns.values()):
+        for category, terms in patterns.items():
+            for term in terms:
+                term_id = term_index.setdefault(term, len(term_index))
+                entries.append((term_id, industry_id, _INDUSTRY_TERM_WEIGHTS[category],
+                                category == _PER_OCCURRENCE_CATEGORY))
+    
+    entry_terms, entry_industries, entry_weights, entry_per_occurrence = zip(*entries)
+    return IndustryTermTable(
+        industry_names=list(industry_patterns),
+        term_index=term_index,
+        entry_terms=np.array(entry_terms, dtype=np.intp),
+        entry_industries=np.array(entry_industries, dtype=np.intp),
+        entry_weights=np.array(entry_weights, dtype=float),
+        entry_per_occurrence=np.array(entry_per_occurrence, dtype=bool)
+    )
+
+def _extract_phrases(patterns: Tuple[re.Pattern, ...], job_text: str) -> List[str]:
+    """Collect the non-empty phrases captured by each pattern, pattern by pattern"""
+    # An empty phrase is a substring of every skill, so it must not reach scoring
+    return [
+        phrase
+        for pattern in patterns
+        for match in pattern.finditer(job_text)
+        if (phrase := match.group(1).strip())
+    ]
+
+
+def _isoformat_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as local time, like datetime.now().isoformat()"""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+
+def _write_json_object(stream: BinaryIO, items: Iterable[Tuple[str, Any]], level: int = 0):
+    """Write pairs as a JSON object indented like json.dump(indent=2), serializing one value at a time
+
+    Values that are iterators of (key, value) pairs are written as nested objects the same way.
+    """
+    indent = b"\n" + b"  " * (level + 1)
+    opened = False
+    for key, value in items:
+        stream.write(b"," + indent if opened else b"{" + indent)
+        opened = True
+        stream.write(json_codec.dumps(key) + b": ")
+        if isinstance(value, abc.Iterator):
+            _write_json_object(stream, value, level + 1)
+        else:
+            # JSON strings escape newlines, so every newline in the output starts an indented line
+            stream.write(json_codec.dumps(value, indent=True, default=str).replace(b"\n", indent))
+    stream.write(b"\n" + b"  " * level + b"}" if opened else b"{}")
+
+
+def _analysis_cache_key(job_description: str) -> bytes:
+    """Hash a job description into a compact, non-cryptographic cache key"""
+    data = job_description.encode('utf-8', 'surrogatepass')
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.md5(data, **_MD5_OPTIONS).digest()
+
+
+def _match_cluster(term: str) -> Optional[str]:
+    """Scan for the first cluster with a term inside the input or containing the input"""
+    # Clusters with a term inside the input, found in one pass
+    contained_clusters = _semantic_cluster_matcher().values_in(term)
+    for cluster_name, joined_terms in _JOINED_CLUSTER_TERMS.items():
+        # The separator never occurs in cluster terms, so inputs containing it match none of them
+        if cluster_name in contained_clusters or (
+                _CLUSTER_TERM_SEPARATOR not in term and term in joined_terms):
+            return cluster_name
+    return None
+
+
+# Compiled lookup structures are built on first use and shared across instances
+
+@lru_cache(maxsize=None)
+def _industry_term_table() -> IndustryTermTable:
+    """Scoring entries for the industry patterns"""
+    return _build_industry_term_table(_INDUSTRY_PATTERNS)
+
+
+@lru_cache(maxsize=None)
+def _industry_term_matcher() -> KeywordMatcher:
+    """Matcher over all industry terms; terms shared between lists or industries are registered once"""
+    return KeywordMatcher((term, term) for term in _industry_term_table().term_index)
+
+
+@lru_cache(maxsize=None)
+def _semantic_cluster_matcher() -> KeywordMatcher:
+    """Matcher from cluster terms to their cluster names"""
+    return KeywordMatcher(
+        (cluster_term, cluster_name)
+        for cluster_name, terms in _SEMANTIC_CLUSTERS.items()
+        for cluster_term in terms
+    )
+
+
+@lru_cache(maxsize=None)
+def _cluster_term_index() -> Dict[str, Optional[str]]:
+    """Precomputed cluster lookups for every cluster term"""
+    term_to_cluster = {}
+    for terms in _SEMANTIC_CLUSTERS.values():
+        for cluster_term in terms:
+            term_to_cluster.setdefault(cluster_term, _match_cluster(cluster_term))
+    return term_to_cluster
+
+
+@lru_cache(maxsize=None)
+def _domain_keyword_index() -> Dict[str, int]:
+    """Column index for each keyword of both domain groups"""
+    domain_keywords = dict.fromkeys(
+        keyword for domains in (_TECH_DOMAINS, _BUSINESS_DOMAINS)
+        for config in domains.values() for keyword in config["keywords"]
+    )
+    return {keyword: index for index, keyword in enumerate(domain_keywords)}
+
+
+@lru_cache(maxsize=None)
+def _domain_keyword_matcher() -> KeywordMatcher:
+    """One matcher covering the keywords of both domain groups and the technical-only penalty terms"""
+    return KeywordMatcher(
+        (keyword, keyword) for keyword in dict.fromkeys([*_domain_keyword_index(), *_TECHNICAL_ONLY_TERMS])
+    )
+
+
+@lru_cache(maxsize=None)
+def _domain_matrices() -> Tuple[DomainMatrix, DomainMatrix]:
+    """Scoring matrices for the tech and business domain groups"""
+    keyword_index = _domain_keyword_index()
+    return (_build_domain_matrix(_TECH_DOMAINS, keyword_index),
+            _build_domain_matrix(_BUSINESS_DOMAINS, keyword_index))
+
+
+@lru_cache(maxsize=None)
+def _industry_relevance_rows(technical: bool, industry: str) -> Dict[int, float]:
+    """Industry relevance earned through each domain row that boosts the industry"""
+    domain_matrix = _domain_matrices()[0 if technical else 1]
+    boosts = domain_matrix.boost_column(industry).tolist()
+    return {
+        row: 0.15 * (boosts[row] - 1.0)
+        for row in sorted(set(domain_matrix.industry_keyword_rows.get(industry, {}).values()))
+    }
+
+
+@lru_cache(maxsize=None)
+def _job_term_matcher() -> KeywordMatcher:
+    """Every term the job analyzers look for, so one scan of the job text serves them all"""
+    return KeywordMatcher(
+        (term, term)
+        for term in dict.fromkeys([
+            *_industry_term_table().term_index,
+            *_domain_keyword_index(),
+            *(term for config in _ROLE_TYPES.values()
+              for term in config["patterns"] + config["complexity_indicators"]),
+            *_CONTEXT_INDICATOR_BUCKETS
+        ])
+    )
 
 
 class IndustryClassifier:
     """Advanced industry classification with context awareness"""
     
     def __init__(self):
-        self.industry_patterns = {
-            "healthcare": {
-                "keywords": ["healthcare", "medical", "hospital", "clinic", "patient", "hipaa", "epic", "cerner"],
-                "context_indicators": ["patient care", "medical records", "clinical", "pharmaceutical"],
-                "tech_stack": ["epic", "cerner", "meditech", "allscripts"]
-            },
-            "finance": {
-                "keywords": ["finance", "banking", "financial", "investment", "trading", "risk", "compliance"],
-                "context_indicators": ["financial analysis", "risk management", "regulatory", "trading systems"],
-                "tech_stack": ["bloomberg", "reuters", "murex", "calypso", "sap", "oracle financials"]
-            },
-            "technology": {
-                "keywords": ["software", "development", "engineering", "tech", "startup", "saas", "platform"],
-                "context_indicators": ["software development", "cloud", "agile", "devops", "microservices"],
-                "tech_stack": ["aws", "azure", "kubernetes", "docker", "react", "python"]
-            },
-            "manufacturing": {
-                "keywords": ["manufacturing", "production", "factory", "industrial", "supply chain", "quality"],
-                "context_indicators": ["production line", "inventory", "lean manufacturing", "six sigma"],
-                "tech_stack": ["sap", "oracle", "mes", "scada", "plm"]
-            },
-            "education": {
-                "keywords": ["education", "university", "school", "academic", "research", "student"],
-                "context_indicators": ["curriculum", "learning", "research", "academic"],
-                "tech_stack": ["canvas", "blackboard", "moodle", "peoplesoft"]
-            },
-            "retail": {
-                "keywords": ["retail", "ecommerce", "customer", "sales", "marketing", "brand"],
-                "context_indicators": ["customer experience", "point of sale", "inventory", "merchandising"],
-                "tech_stack": ["salesforce", "shopify", "sap retail", "oracle retail"]
-            }
-        }
+        self.industry_patterns = _INDUSTRY_PATTERNS
+        self._term_matcher = _industry_term_matcher()
+        self._term_table = _industry_term_table()
     
     def classify_industry(self, job_description: str) -> Dict[str, Any]:
         """Classify industry with confidence scoring"""
-        job_lower = job_description.lower()
-        industry_scores = {}
+        return self.classify_industry_lowered(job_description.lower())
+    
+    def classify_industry_lowered(self, job_lower: str) -> Dict[str, Any]:
+        """Classify an already lowercased job description"""
         
-        for industry, patterns in self.industry_patterns.items():
-            score = 0
-            
-            # Keyword matching
-            for keyword in patterns["keywords"]:
-                count = len(re.findall(r'\b' + keyword + r'\b', job_lower))
-                score += count * 2
-            
-            # Context indicator matching
-            for indicator in patterns["context_indicators"]:
-                if indicator in job_lower:
-                    score += 3
-            
-            # Tech stack matching
-            for tech in patterns["tech_stack"]:
-                if tech in job_lower:
-                    score += 4
-            
-            if score > 0:
-                industry_scores[industry] = score
+        # One pass over the text finds every industry term
+        return self.classify_scanned_terms(*self._term_matcher.scan_words(job_lower))
+    
+    def classify_scanned_terms(self, found_terms: Set[str], word_counts: Counter) -> Dict[str, Any]:
+        """Classify from a scan_words result that covers at least the industry terms"""
+        if not found_terms:
+            return {"industry": "general", "confidence": 0.5, "indicators": []}
+        
+        # Keywords count whole-word occurrences, indicators and tech count once
+        scores = self._term_table.score(found_terms, word_counts)
+        industry_scores = {
+            self._term_table.industry_names[row]: int(scores[row])
+            for row in np.flatnonzero(scores > 0)
+        }
         
         if not industry_scores:
             return {"industry": "general", "confidence": 0.5, "indicators": []}
         
         # Determine primary industry
-        primary_industry = max(industry_scores, key=industry_scores.get)
+        primary_industry = self._term_table.industry_names[int(np.argmax(scores))]
         max_score = industry_scores[primary_industry]
         total_score = sum(industry_scores.values())
         confidence = max_score / total_score if total_score > 0 else 0.5
@@ -170,10 +685,10 @@ class IndustryClassifier:
             "industry": primary_industry,
             "confidence": confidence,
             "all_scores": industry_scores,
-            "indicators": self._get_matching_indicators(job_lower, primary_industry)
+            "indicators": self._get_matching_indicators(found_terms, primary_industry)
         }
     
-    def _get_matching_indicators(self, job_text: str, industry: str) -> List[str]:
+    def _get_matching_indicators(self, found_terms: Set[str], industry: str) -> List[str]:
         """Get specific indicators that matched for this industry"""
         if industry not in self.industry_patterns:
             return []
@@ -182,15 +697,15 @@ class IndustryClassifier:
         indicators = []
         
         for keyword in patterns["keywords"]:
-            if keyword in job_text:
+            if keyword in found_terms:
                 indicators.append(f"keyword: {keyword}")
         
         for context in patterns["context_indicators"]:
-            if context in job_text:
+            if context in found_terms:
                 indicators.append(f"context: {context}")
         
         for tech in patterns["tech_stack"]:
-            if tech in job_text:
+            if tech in found_terms:
                 indicators.append(f"technology: {tech}")
         
         return indicators
@@ -199,55 +714,51 @@ class IndustryClassifier:
 class SemanticMatcher:
     """Advanced semantic similarity matching for skills and requirements"""
     
+    SIMILARITY_CACHE_SIZE = 65536
+    
     def __init__(self):
-        # Pre-computed semantic clusters for common IT/business terms
-        self.semantic_clusters = {
-            "database_management": [
-                "database", "sql", "mysql", "postgresql", "oracle", "mongodb", 
-                "data management", "database administration", "dba", "query optimization"
-            ],
-            "network_administration": [
-                "network", "networking", "tcp/ip", "dns", "dhcp", "vpn", "firewall",
-                "network security", "lan", "wan", "routing", "switching"
-            ],
-            "system_administration": [
-                "system admin", "server management", "linux", "windows", "unix",
-                "server administration", "infrastructure", "system maintenance"
-            ],
-            "cloud_technologies": [
-                "cloud", "aws", "azure", "gcp", "cloud computing", "saas", "paas", "iaas",
-                "cloud architecture", "cloud migration", "serverless"
-            ],
-            "business_analysis": [
-                "business analyst", "requirements gathering", "process improvement",
-                "business requirements", "stakeholder management", "gap analysis"
-            ],
-            "project_management": [
-                "project management", "project manager", "scrum", "agile", "kanban",
-                "project coordination", "timeline management", "resource planning"
-            ],
-            "data_analysis": [
-                "data analysis", "analytics", "reporting", "business intelligence",
-                "data visualization", "excel", "pivot tables", "dashboards"
-            ]
-        }
+        self.semantic_clusters = _SEMANTIC_CLUSTERS
+        self.synonyms = _SYNONYMS
+        self._term_to_cluster = _cluster_term_index()
         
-        # Synonym mappings
-        self.synonyms = {
-            "sys admin": "system administrator",
-            "sysadmin": "system administrator",
-            "net admin": "network administrator",
-            "dba": "database administrator",
-            "pm": "project manager",
-            "ba": "business analyst",
-            "dev": "developer",
-            "qa": "quality assurance"
-        }
+        # Skills and requirements repeat across calls, so memoize on the normalized pair;
+        # similarity is symmetric, so pairs are ordered and both call orders share an entry
+        self._cached_similarity = lru_cache(maxsize=self.SIMILARITY_CACHE_SIZE)(self._normalized_similarity)
     
     def calculate_semantic_similarity(self, skill: str, requirement: str) -> float:
         """Calculate semantic similarity between skill and requirement"""
         skill_lower = skill.lower().strip()
         requirement_lower = requirement.lower().strip()
+        if requirement_lower < skill_lower:
+            return self._cached_similarity(requirement_lower, skill_lower)
+        return self._cached_similarity(skill_lower, requirement_lower)
+    
+    def cache_clear(self):
+        """Drop memoized similarities"""
+        self._cached_similarity.cache_clear()
+    
+    def similarity_matrix(self, skills: List[str], requirements: List[str]) -> np.ndarray:
+        """Similarity of every skill (rows) to every requirement (columns)"""
+        return self.normalized_similarity_matrix(
+            [skill.lower().strip() for skill in skills],
+            [requirement.lower().strip() for requirement in requirements]
+        )
+    
+    def normalized_similarity_matrix(self, skills_lower: List[str], requirements_lower: List[str]) -> np.ndarray:
+        """Similarity matrix for skills and requirements that are already lowercased and stripped"""
+        similarity = self._cached_similarity
+        
+        matrix = np.empty((len(skills_lower), len(requirements_lower)))
+        for row, skill_lower in enumerate(skills_lower):
+            matrix[row] = [
+                similarity(skill_lower, requirement_lower) if skill_lower <= requirement_lower
+                else similarity(requirement_lower, skill_lower)
+                for requirement_lower in requirements_lower
+            ]
+        return matrix
+    
+    def _normalized_similarity(self, skill_lower: str, requirement_lower: str) -> float:
+        """Similarity between a lowercased, stripped skill and requirement; symmetric in its arguments"""
         
         # Exact match
         if skill_lower == requirement_lower:
@@ -272,8 +783,8 @@ class SemanticMatcher:
             return 0.7
         
         # Token overlap similarity
-        skill_tokens = set(re.findall(r'\b\w+\b', skill_lower))
-        requirement_tokens = set(re.findall(r'\b\w+\b', requirement_lower))
+        skill_tokens = set(filter(None, _NON_WORD_PATTERN.split(skill_lower)))
+        requirement_tokens = set(filter(None, _NON_WORD_PATTERN.split(requirement_lower)))
         
         if skill_tokens and requirement_tokens:
             overlap = len(skill_tokens.intersection(requirement_tokens))
@@ -287,11 +798,173 @@ class SemanticMatcher:
     
     def _find_cluster(self, term: str) -> Optional[str]:
         """Find which semantic cluster a term belongs to"""
-        for cluster_name, terms in self.semantic_clusters.items():
-            for cluster_term in terms:
-                if cluster_term in term or term in cluster_term:
-                    return cluster_name
-        return None
+        if term in self._term_to_cluster:
+            return self._term_to_cluster[term]
+        return _match_cluster(term)
+
+
+class SkillScoreHistory:
+    """Column-oriented log of user scores per skill, for vectorized aggregates"""
+    
+    def __init__(self, initial_capacity: int = 64):
+        self._skill_ids: Dict[str, int] = {}
+        self._skill_names: List[str] = []
+        self._skill_column = np.empty(initial_capacity, dtype=np.int32)
+        self._score_column = np.empty(initial_capacity, dtype=np.float64)
+        self._timestamp_column = np.empty(initial_capacity, dtype=np.int64)
+        self._contexts: List[str] = []
+        self._size = 0
+        
+        # Running per-skill aggregates, indexed by skill id and updated on append
+        self._skill_counts: List[int] = []
+        self._skill_totals: List[float] = []
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, skill: str, score: float, timestamp_ns: int, context: str):
+        """Record one scored feedback event stamped with time.time_ns()"""
+        if self._size == len(self._score_column):
+            self._grow()
+        
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = self._skill_ids[skill] = len(self._skill_names)
+            self._skill_names.append(skill)
+            self._skill_counts.append(0)
+            self._skill_totals.append(0.0)
+        
+        self._skill_column[self._size] = skill_id
+        self._score_column[self._size] = score
+        self._timestamp_column[self._size] = timestamp_ns
+        self._contexts.append(context)
+        self._size += 1
+        self._skill_counts[skill_id] += 1
+        self._skill_totals[skill_id] += float(score)
+    
+    def _grow(self):
+        """Double the capacity of the numeric columns"""
+        capacity = max(1, 2 * len(self._score_column))
+        for name in ("_skill_column", "_score_column", "_timestamp_column"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+    
+    def skill_statistics(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Return skill names with their score counts and means, in first-seen order"""
+        counts = np.array(self._skill_counts, dtype=np.int64)
+        totals = np.array(self._skill_totals, dtype=np.float64)
+        # Every registered skill has at least one score, so no count is zero
+        return self._skill_names, counts, totals / counts
+    
+    def mean_score(self, skill: str) -> Optional[float]:
+        """Average recorded score for a skill, or None without history"""
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            return None
+        return self._skill_totals[skill_id] / self._skill_counts[skill_id]
+    
+    def entries_by_skill(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Rebuild per-skill entry lists in recording order"""
+        entries: Dict[str, List[Dict[str, Any]]] = {skill: [] for skill in self._skill_names}
+        for skill_id, score, timestamp_ns, context in zip(self._skill_column[:self._size].tolist(),
+                                                           self._score_column[:self._size].tolist(),
+                                                           self._timestamp_column[:self._size].tolist(),
+                                                           self._contexts):
+            entries[self._skill_names[skill_id]].append({
+                "score": score,
+                "timestamp": timestamp_ns,
+                "context": context
+            })
+        return entries
+
+
+class FeedbackLog:
+    """Column-oriented log of feedback events per skill, for vectorized counts"""
+    
+    def __init__(self, initial_capacity: int = 64):
+        self._skill_ids: Dict[str, int] = {}
+        self._skill_names: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self._skill_column = np.empty(initial_capacity, dtype=np.int32)
+        self._type_column = np.empty(initial_capacity, dtype=np.int32)
+        # Missing user scores are stored as NaN
+        self._score_column = np.empty(initial_capacity, dtype=np.float64)
+        self._timestamp_column = np.empty(initial_capacity, dtype=np.int64)
+        self._job_contexts: List[str] = []
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, skill: str) -> List[Dict[str, Any]]:
+        """Entries recorded for one skill, in recording order"""
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            return []
+        rows = np.flatnonzero(self._skill_column[:self._size] == skill_id).tolist()
+        return [self._entry(skill, row) for row in rows]
+    
+    def append(self, skill: str, feedback_type: str, user_score: Optional[float],
+               timestamp_ns: int, job_context: str):
+        """Record one feedback event stamped with time.time_ns()"""
+        if self._size == len(self._skill_column):
+            self._grow()
+        
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = self._skill_ids[skill] = len(self._skill_names)
+            self._skill_names.append(skill)
+        type_id = self._type_ids.get(feedback_type)
+        if type_id is None:
+            type_id = self._type_ids[feedback_type] = len(self._type_names)
+            self._type_names.append(feedback_type)
+        
+        self._skill_column[self._size] = skill_id
+        self._type_column[self._size] = type_id
+        self._score_column[self._size] = np.nan if user_score is None else user_score
+        self._timestamp_column[self._size] = timestamp_ns
+        self._job_contexts.append(job_context)
+        self._size += 1
+    
+    def _grow(self):
+        """Double the capacity of the numeric columns"""
+        capacity = max(1, 2 * len(self._skill_column))
+        for name in ("_skill_column", "_type_column", "_score_column", "_timestamp_column"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+    
+    def skill_count(self) -> int:
+        """Number of distinct skills with feedback"""
+        return len(self._skill_names)
+    
+    def type_counts(self) -> Dict[str, int]:
+        """Number of events recorded for each feedback type"""
+        counts = np.bincount(self._type_column[:self._size], minlength=len(self._type_names))
+        return dict(zip(self._type_names, counts.tolist()))
+    
+    def entries_by_skill(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Rebuild per-skill entry lists in recording order"""
+        entries: Dict[str, List[Dict[str, Any]]] = {skill: [] for skill in self._skill_names}
+        for row, skill_id in enumerate(self._skill_column[:self._size].tolist()):
+            skill = self._skill_names[skill_id]
+            entries[skill].append(self._entry(skill, row))
+        return entries
+    
+    def _entry(self, skill: str, row: int) -> Dict[str, Any]:
+        """Rebuild the entry dict recorded in one row"""
+        user_score = self._score_column[row].item()
+        return {
+            "skill": skill,
+            "job_context": self._job_contexts[row],
+            "feedback_type": self._type_names[self._type_column[row]],
+            "user_score": None if math.isnan(user_score) else user_score,
+            "timestamp": self._timestamp_column[row].item()
+        }
 
 
 class AdvancedRelevanceEngine:
@@ -307,6 +980,8 @@ class AdvancedRelevanceEngine:
     - Performance optimization with caching
     """
     
+    ANALYSIS_CACHE_LIMIT = 1024
+    
     def __init__(self, cache_ttl: int = 3600):
         # Core components
         self.industry_classifier = IndustryClassifier()
@@ -316,100 +991,22 @@ class AdvancedRelevanceEngine:
         self.performance_monitor = get_global_performance_monitor()
         self.error_handler = get_global_error_handler()
         
-        # Enhanced domain definitions
-        self.tech_domains = {
-            "databases": {
-                "keywords": ["sql", "mysql", "postgresql", "oracle", "mongodb", "nosql", "database", "db", "data", "query"],
-                "weight": 1.0,
-                "industry_boost": {"finance": 1.5, "healthcare": 1.3, "retail": 1.2}
-            },
-            "programming": {
-                "keywords": ["python", "java", "c++", "javascript", "nodejs", "php", "ruby", "go", "rust", ".net"],
-                "weight": 1.2,
-                "industry_boost": {"technology": 1.8, "finance": 1.3}
-            },
-            "web": {
-                "keywords": ["html", "css", "react", "angular", "vue", "frontend", "backend", "web", "http", "api", "rest"],
-                "weight": 1.1,
-                "industry_boost": {"technology": 1.6, "retail": 1.4}
-            },
-            "cloud": {
-                "keywords": ["aws", "azure", "gcp", "cloud", "docker", "kubernetes", "serverless", "microservices"],
-                "weight": 1.3,
-                "industry_boost": {"technology": 1.7, "finance": 1.4}
-            },
-            "networking": {
-                "keywords": ["network", "tcp", "ip", "dns", "firewall", "vpn", "router", "switch", "security"],
-                "weight": 1.2,
-                "industry_boost": {"technology": 1.5, "healthcare": 1.3}
-            },
-            "systems": {
-                "keywords": ["linux", "windows", "unix", "server", "admin", "infrastructure", "deployment"],
-                "weight": 1.1,
-                "industry_boost": {"technology": 1.4, "manufacturing": 1.3}
-            },
-            "security": {
-                "keywords": ["security", "cybersecurity", "encryption", "authentication", "authorization", "compliance"],
-                "weight": 1.4,
-                "industry_boost": {"finance": 1.8, "healthcare": 1.6}
-            },
-            "automation": {
-                "keywords": ["automation", "scripting", "powershell", "bash", "workflow", "ci/cd", "devops"],
-                "weight": 1.2,
-                "industry_boost": {"technology": 1.6, "manufacturing": 1.4}
-            }
-        }
-        
-        self.business_domains = {
-            "business_analysis": {
-                "keywords": ["business analyst", "requirements", "process improvement", "workflow", "documentation"],
-                "weight": 1.0,
-                "industry_boost": {"finance": 1.4, "healthcare": 1.3}
-            },
-            "finance": {
-                "keywords": ["finance", "financial", "accounting", "order to cash", "collections", "credit"],
-                "weight": 1.1,
-                "industry_boost": {"finance": 1.8, "manufacturing": 1.2}
-            },
-            "project_management": {
-                "keywords": ["project management", "scrum", "agile", "stakeholder management", "timeline"],
-                "weight": 1.2,
-                "industry_boost": {"technology": 1.5, "manufacturing": 1.4}
-            },
-            "business_intelligence": {
-                "keywords": ["business intelligence", "bi", "power bi", "tableau", "data visualization", "dashboard"],
-                "weight": 1.3,
-                "industry_boost": {"finance": 1.6, "retail": 1.4}
-            }
-        }
-        
-        # Role classification with enhanced patterns
-        self.role_types = {
-            "technical_it": {
-                "patterns": ["technician", "engineer", "developer", "administrator", "support specialist", 
-                           "network", "system admin", "security analyst", "devops", "infrastructure"],
-                "weight": 1.0,
-                "complexity_indicators": ["senior", "lead", "principal", "architect"]
-            },
-            "business_analyst": {
-                "patterns": ["business analyst", "process analyst", "functional analyst", "systems analyst"],
-                "weight": 1.0,
-                "complexity_indicators": ["senior", "lead", "principal"]
-            },
-            "management": {
-                "patterns": ["manager", "director", "supervisor", "team lead", "department head"],
-                "weight": 1.0,
-                "complexity_indicators": ["senior", "executive", "vice president", "c-level"]
-            }
-        }
-        
-        # Caching for performance
-        self.analysis_cache = {}
+        # Static domain and role tables are shared by every engine instance
+        self.tech_domains = _TECH_DOMAINS
+        self.business_domains = _BUSINESS_DOMAINS
+        self.role_types = _ROLE_TYPES
+        self._domain_matcher = _domain_keyword_matcher()
+        self._domain_keyword_index = _domain_keyword_index()
+        self._tech_domain_matrix, self._business_domain_matrix = _domain_matrices()
+        self._job_term_matcher = _job_term_matcher()
+        
+        # Caching for performance, least recently used entries first
+        self.analysis_cache: OrderedDict = OrderedDict()
         self.cache_ttl = cache_ttl
         
         # Learning system
-        self.feedback_patterns = defaultdict(list)
-        self.skill_performance_history = defaultdict(list)
+        self.feedback_patterns = FeedbackLog()
+        self.skill_performance_history = SkillScoreHistory()
     
     @performance_monitor(get_global_performance_monitor(), "relevance_engine", "analyze_job_comprehensive", use_cache=True, cache_ttl=3600)
     @with_error_handling(get_global_error_handler(), "relevance_engine", "analyze_job_comprehensive")
@@ -419,37 +1016,62 @@ class AdvancedRelevanceEngine:
         """
         
         # Create cache key
-        cache_key = hashlib.md5(job_description.encode()).hexdigest()
+        cache_key = _analysis_cache_key(job_description)
         
         # Check cache
-        if cache_key in self.analysis_cache:
-            cached_result, timestamp = self.analysis_cache[cache_key]
-            if datetime.now() - timestamp < timedelta(seconds=self.cache_ttl):
-                return JobAnalysisResult(**cached_result)
-        
+        cached = self.analysis_cache.get(cache_key)
+        if cached is not None:
+            cached_result, expires_at = cached
+            if time.monotonic() < expires_at:
+                self.analysis_cache.move_to_end(cache_key)
+                return cached_result
+            del self.analysis_cache[cache_key]
+        
+        # Lowercase once; every analyzer below works on job_lower
         job_lower = job_description.lower()
         
+        # One scan finds the industry, role, context and domain terms
+        found_terms, word_counts = self._job_term_matcher.scan_words(job_lower)
+        
         # Industry classification
-        industry_analysis = self.industry_classifier.classify_industry(job_description)
+        industry_analysis = self.industry_classifier.classify_scanned_terms(found_terms, word_counts)
         
         # Role type classification with confidence
-        role_analysis = self._classify_role_advanced(job_lower)
+        role_analysis = self._classify_role_advanced(job_lower, found_terms, word_counts)
         
         # Extract skills and requirements
         skills_analysis = self._extract_skills_advanced(job_lower)
         
+        # Group the indicators used by the context analyses below
+        indicator_hits = self._group_context_indicators(found_terms)
+        
         # Analyze company context
-        company_analysis = self._analyze_company_context(job_lower)
+        company_analysis = self._analyze_company_context(indicator_hits)
         
         # Determine experience level and complexity
-        experience_analysis = self._analyze_experience_requirements(job_lower)
+        experience_analysis = self._analyze_experience_requirements(indicator_hits)
         
         # Analyze compensation and growth indicators
-        career_analysis = self._analyze_career_indicators(job_lower)
+        career_analysis = self._analyze_career_indicators(indicator_hits)
         
         # Score domains with industry context
-        tech_domains = self._score_domains_advanced(job_lower, self.tech_domains, industry_analysis)
-        business_domains = self._score_domains_advanced(job_lower, self.business_domains, industry_analysis)
+        keyword_counts = np.zeros(len(self._domain_keyword_index))
+        for keyword, count in word_counts.items():
+            column = self._domain_keyword_index.get(keyword)
+            if column is not None:
+                keyword_counts[column] = count
+        if keyword_counts.any():
+            tech_domains, tech_domain_scores = self._score_domains_advanced(
+                keyword_counts, self._tech_domain_matrix, industry_analysis
+            )
+            business_domains, business_domain_scores = self._score_domains_advanced(
+                keyword_counts, self._business_domain_matrix, industry_analysis
+            )
+        else:
+            # No domain keyword anywhere in the text, so every domain scores zero
+            tech_domains, business_domains = {}, {}
+            tech_domain_scores = np.zeros(len(self._tech_domain_matrix.domain_names))
+            business_domain_scores = np.zeros(len(self._business_domain_matrix.domain_names))
         
         # Determine primary focus
         tech_score = sum(tech_domains.values())
@@ -480,16 +1102,21 @@ class AdvancedRelevanceEngine:
             key_responsibilities=skills_analysis["responsibilities"],
             compensation_indicators=career_analysis["compensation"],
             growth_potential=career_analysis["growth_potential"],
-            remote_work_indicators=career_analysis["remote_indicators"]
+            remote_work_indicators=career_analysis["remote_indicators"],
+            tech_domain_scores=tech_domain_scores,
+            business_domain_scores=business_domain_scores
         )
         
-        # Cache result
-        self.analysis_cache[cache_key] = (result.to_dict(), datetime.now())
+        # Cache result, evicting the least recently used entry when full
+        self.analysis_cache[cache_key] = (result, time.monotonic() + self.cache_ttl)
+        if len(self.analysis_cache) > self.ANALYSIS_CACHE_LIMIT:
+            self.analysis_cache.popitem(last=False)
         
         return result
     
-    def _classify_role_advanced(self, job_text: str) -> Dict[str, Any]:
-        """Advanced role classification with confidence scoring"""
+    def _classify_role_advanced(self, job_text: str, found_terms: Set[str], word_counts: Counter) -> Dict[str, Any]:
+        """Advanced role classification with confidence scoring from a scan of the job terms"""
+        title_text = job_text[:200]
         role_scores = {}
         
         for role_type, config in self.role_types.items():
@@ -497,16 +1124,15 @@ class AdvancedRelevanceEngine:
             
             # Pattern matching with position weighting
             for pattern in config["patterns"]:
-                matches = len(re.findall(r'\b' + pattern + r'\b', job_text))
-                score += matches
+                score += word_counts[pattern]
                 
                 # Higher weight for title matches (first 200 chars)
-                if pattern in job_text[:200]:
+                if pattern in found_terms and pattern in title_text:
                     score += 3
             
             # Complexity indicators
             for indicator in config["complexity_indicators"]:
-                if indicator in job_text:
+                if indicator in found_terms:
                     score += 2
             
             if score > 0:
@@ -527,72 +1153,18 @@ class AdvancedRelevanceEngine:
         }
     
     def _extract_skills_advanced(self, job_text: str) -> Dict[str, List[str]]:
-        """Advanced skill extraction with categorization"""
-        
-        # Required skills patterns
-        required_patterns = [
-            r"required?:?\s*([^.!?]*)",
-            r"must have:?\s*([^.!?]*)",
-            r"essential:?\s*([^.!?]*)",
-            r"minimum requirements?:?\s*([^.!?]*)",
-            r"qualifications?:?\s*([^.!?]*)"
-        ]
-        
-        # Preferred skills patterns
-        preferred_patterns = [
-            r"preferred?:?\s*([^.!?]*)",
-            r"nice to have:?\s*([^.!?]*)",
-            r"bonus:?\s*([^.!?]*)",
-            r"plus:?\s*([^.!?]*)",
-            r"desired:?\s*([^.!?]*)"
-        ]
-        
-        # Extract technologies
-        tech_patterns = [
-            r"\b(?:java|python|javascript|sql|aws|azure|linux|windows|oracle|mysql)\b",
-            r"\b(?:react|angular|vue|docker|kubernetes|git|jenkins)\b"
-        ]
-        
-        # Extract soft skills
-        soft_skill_patterns = [
-            r"communication", r"leadership", r"teamwork", r"problem.solving",
-            r"analytical", r"detail.oriented", r"time.management", r"adaptability"
-        ]
-        
-        # Extract responsibilities
-        responsibility_patterns = [
-            r"responsibilities?:?\s*([^.!?]*)",
-            r"duties:?\s*([^.!?]*)",
-            r"you will:?\s*([^.!?]*)",
-            r"the role involves:?\s*([^.!?]*)"
-        ]
-        
-        required_skills = []
-        preferred_skills = []
-        technologies = []
-        soft_skills = []
-        responsibilities = []
+        """Advanced skill extraction with categorization from lowercased job text"""
         
         # Extract each category
-        for pattern in required_patterns:
-            matches = re.findall(pattern, job_text, re.IGNORECASE)
-            required_skills.extend([match.strip() for match in matches])
+        required_skills = _extract_phrases(_REQUIRED_SKILL_PATTERNS, job_text)
+        preferred_skills = _extract_phrases(_PREFERRED_SKILL_PATTERNS, job_text)
+        responsibilities = _extract_phrases(_RESPONSIBILITY_PATTERNS, job_text)
         
-        for pattern in preferred_patterns:
-            matches = re.findall(pattern, job_text, re.IGNORECASE)
-            preferred_skills.extend([match.strip() for match in matches])
-        
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, job_text, re.IGNORECASE)
-            technologies.extend(matches)
-        
-        for pattern in soft_skill_patterns:
-            if re.search(pattern, job_text, re.IGNORECASE):
-                soft_skills.append(pattern.replace(".", " "))
+        technologies = []
+        for pattern in _TECHNOLOGY_PATTERNS:
+            technologies.extend(pattern.findall(job_text))
         
-        for pattern in responsibility_patterns:
-            matches = re.findall(pattern, job_text, re.IGNORECASE)
-            responsibilities.extend([match.strip() for match in matches])
+        soft_skills = [name for name, pattern in _SOFT_SKILL_PATTERNS if pattern.search(job_text)]
         
         return {
             "required": required_skills,
@@ -602,22 +1174,19 @@ class AdvancedRelevanceEngine:
             "responsibilities": responsibilities
         }
     
-    def _analyze_company_context(self, job_text: str) -> Dict[str, Any]:
+    def _group_context_indicators(self, found_terms: Set[str]) -> Dict[str, Set[str]]:
+        """Group the context indicators among the found terms by bucket"""
+        indicator_hits = {bucket: set() for bucket in _CONTEXT_INDICATORS}
+        for term in found_terms:
+            for bucket in _CONTEXT_INDICATOR_BUCKETS.get(term, ()):
+                indicator_hits[bucket].add(term)
+        return indicator_hits
+    
+    def _analyze_company_context(self, indicator_hits: Dict[str, Set[str]]) -> Dict[str, Any]:
         """Analyze company size and context indicators"""
         
-        # Company size indicators
-        large_company_indicators = [
-            "enterprise", "fortune 500", "global", "multinational", "corporation",
-            "thousands of employees", "worldwide", "international"
-        ]
-        
-        small_company_indicators = [
-            "startup", "small business", "growing company", "entrepreneurial",
-            "close-knit team", "wear many hats", "fast-paced"
-        ]
-        
-        large_score = sum(1 for indicator in large_company_indicators if indicator in job_text)
-        small_score = sum(1 for indicator in small_company_indicators if indicator in job_text)
+        large_score = len(indicator_hits["large_company"])
+        small_score = len(indicator_hits["small_company"])
         
         if large_score > small_score:
             company_size = "large"
@@ -632,15 +1201,11 @@ class AdvancedRelevanceEngine:
             "small_indicators": small_score
         }
     
-    def _analyze_experience_requirements(self, job_text: str) -> Dict[str, Any]:
+    def _analyze_experience_requirements(self, indicator_hits: Dict[str, Set[str]]) -> Dict[str, Any]:
         """Analyze experience level and role complexity"""
         
-        # Experience level indicators
-        senior_indicators = ["senior", "lead", "principal", "architect", "5+ years", "7+ years"]
-        junior_indicators = ["junior", "entry", "associate", "0-2 years", "recent graduate"]
-        
-        senior_score = sum(1 for indicator in senior_indicators if indicator in job_text)
-        junior_score = sum(1 for indicator in junior_indicators if indicator in job_text)
+        senior_score = len(indicator_hits["senior"])
+        junior_score = len(indicator_hits["junior"])
         
         if senior_score > junior_score:
             experience_level = "senior"
@@ -653,12 +1218,7 @@ class AdvancedRelevanceEngine:
             complexity = 0.5
         
         # Adjust complexity based on responsibilities
-        complex_responsibilities = [
-            "architect", "design", "lead", "mentor", "strategy", "planning",
-            "cross-functional", "stakeholder management"
-        ]
-        
-        complexity_boost = sum(0.1 for resp in complex_responsibilities if resp in job_text)
+        complexity_boost = sum(0.1 for _ in indicator_hits["complex_responsibility"])
         complexity = min(1.0, complexity + complexity_boost)
         
         return {
@@ -668,30 +1228,13 @@ class AdvancedRelevanceEngine:
             "junior_indicators": junior_score
         }
     
-    def _analyze_career_indicators(self, job_text: str) -> Dict[str, Any]:
+    def _analyze_career_indicators(self, indicator_hits: Dict[str, Set[str]]) -> Dict[str, Any]:
         """Analyze compensation and growth potential indicators"""
         
-        # Compensation indicators
-        high_comp_indicators = [
-            "competitive salary", "excellent benefits", "equity", "stock options",
-            "bonus", "401k", "health insurance", "remote work"
-        ]
-        
-        # Growth indicators
-        growth_indicators = [
-            "career growth", "advancement", "mentorship", "learning", "development",
-            "training", "certification", "conference", "education"
-        ]
-        
-        # Remote work indicators
-        remote_indicators = [
-            "remote", "work from home", "distributed team", "flexible location",
-            "telecommute", "virtual", "anywhere"
-        ]
-        
-        comp_score = sum(1 for indicator in high_comp_indicators if indicator in job_text)
-        growth_score = sum(1 for indicator in growth_indicators if indicator in job_text)
-        remote_matches = [indicator for indicator in remote_indicators if indicator in job_text]
+        comp_score = len(indicator_hits["high_compensation"])
+        growth_score = len(indicator_hits["growth"])
+        remote_matches = [indicator for indicator in _CONTEXT_INDICATORS["remote"]
+                          if indicator in indicator_hits["remote"]]
         
         return {
             "compensation": {
@@ -702,28 +1245,20 @@ class AdvancedRelevanceEngine:
             "remote_indicators": remote_matches
         }
     
-    def _score_domains_advanced(self, job_text: str, domains: Dict, industry_analysis: Dict) -> Dict[str, float]:
-        """Score domains with industry context and weighting"""
+    def _score_domains_advanced(self, keyword_counts: np.ndarray, domain_matrix: DomainMatrix,
+                                industry_analysis: Dict) -> Tuple[Dict[str, float], np.ndarray]:
+        """Score domains from whole-word keyword counts with industry context and weighting, by name and by row"""
         
-        domain_scores = {}
         industry = industry_analysis.get("industry", "general")
         
-        for domain, config in domains.items():
-            score = 0
-            
-            # Base keyword scoring
-            for keyword in config["keywords"]:
-                count = len(re.findall(r'\b' + keyword + r'\b', job_text))
-                score += count * config["weight"]
-            
-            # Apply industry boost
-            if industry in config.get("industry_boost", {}):
-                score *= config["industry_boost"][industry]
-            
-            if score > 0:
-                domain_scores[domain] = score
+        # Weighted keyword totals with the industry boost applied
+        scores = (domain_matrix.membership @ keyword_counts) * domain_matrix.weights
+        scores *= domain_matrix.boost_column(industry)
         
-        return domain_scores
+        # Only domains with at least one keyword hit can score above zero; tolist()
+        # converts all scores at once instead of boxing one numpy scalar per domain
+        domain_names = domain_matrix.domain_names
+        return {domain_names[row]: score for row, score in enumerate(scores.tolist()) if score > 0}, scores
     
     @performance_monitor(get_global_performance_monitor(), "relevance_engine", "score_skill_comprehensive", use_cache=True)
     def score_skill_comprehensive(self, skill_data: Dict, job_analysis: JobAnalysisResult) -> SkillRelevanceScore:
@@ -731,213 +1266,268 @@ class AdvancedRelevanceEngine:
         Comprehensive skill relevance scoring with multi-dimensional analysis
         """
         
-        skill_name = skill_data['skill_name'].lower()
-        skill_context = skill_data.get('context', '').lower()
+        return self.score_skills_comprehensive([skill_data], job_analysis)[0]
+    
+    def score_skills_comprehensive(self, skills_data: List[Dict], job_analysis: JobAnalysisResult) -> List[SkillRelevanceScore]:
+        """
+        Score many skills against one job, matching them to the job's requirements as a matrix
+        """
         
-        # Base scoring components
-        base_score = 0.0
-        domain_boost = 0.0
-        experience_alignment = 0.0
-        industry_relevance = 0.0
-        semantic_similarity = 0.0
+        skill_names = [skill_data['skill_name'].lower() for skill_data in skills_data]
+        # Normalized once for all three similarity matrices
+        skill_terms = [skill_name.strip() for skill_name in skill_names]
         
-        # 1. Direct requirement matching
-        for required_skill in job_analysis.required_skills:
-            similarity = self.semantic_matcher.calculate_semantic_similarity(skill_name, required_skill.lower())
-            base_score = max(base_score, similarity * 0.9)
+        # 1. Direct requirement matching, keeping the best requirement for each skill
+        base_scores = np.maximum(
+            self._best_similarities(skill_terms, job_analysis.required_skills) * 0.9,
+            self._best_similarities(skill_terms, job_analysis.preferred_skills) * 0.6
+        )
         
-        for preferred_skill in job_analysis.preferred_skills:
-            similarity = self.semantic_matcher.calculate_semantic_similarity(skill_name, preferred_skill.lower())
-            base_score = max(base_score, similarity * 0.6)
+        # 5. Semantic similarity with explicit technologies
+        semantic_similarities = self._best_similarities(skill_terms, job_analysis.explicit_technologies) * 0.3
+        
+        # 2-4, 6. Per-skill domain, experience, industry and penalty components, with the
+        # job-dependent branches resolved once for the batch
+        plan = self._scoring_plan(job_analysis)
+        components = np.array([
+            self._skill_components(skill_data, skill_name, plan)
+            for skill_data, skill_name in zip(skills_data, skill_names)
+        ], dtype=np.float64).reshape(len(skill_names), 4)
+        domain_boosts, experience_alignments, industry_relevances, penalties = components.T
+        
+        # Calculate final scores and confidence for every skill at once
+        final_scores = np.clip(
+            base_scores + domain_boosts + experience_alignments + industry_relevances + semantic_similarities - penalties,
+            0.0, 1.0
+        )
+        confidences = self._calculate_confidences(base_scores, domain_boosts, semantic_similarities)
+        
+        # Generate explanations, building each distinct one once
+        explanation_codes = self._explanation_codes(
+            base_scores, domain_boosts, industry_relevances, semantic_similarities, penalties
+        ).tolist()
+        explanations = {code: self._generate_score_explanation(code, job_analysis) for code in set(explanation_codes)}
+        
+        return [
+            SkillRelevanceScore(
+                skill_name=skill_data['skill_name'],
+                base_score=base_score,
+                domain_boost=domain_boost,
+                experience_alignment=experience_alignment,
+                industry_relevance=industry_relevance,
+                semantic_similarity=semantic_similarity,
+                final_score=final_score,
+                explanation=explanations[explanation_code],
+                confidence=confidence
+            )
+            for skill_data, base_score, domain_boost, experience_alignment, industry_relevance,
+                semantic_similarity, final_score, explanation_code, confidence in zip(
+                skills_data, base_scores.tolist(), domain_boosts.tolist(),
+                experience_alignments.tolist(), industry_relevances.tolist(), semantic_similarities.tolist(),
+                final_scores.tolist(), explanation_codes, confidences.tolist()
+            )
+        ]
+    
+    def _best_similarities(self, skill_terms: List[str], references: List[str]) -> np.ndarray:
+        """Highest similarity of each normalized skill to any of the references, 0.0 when there are none"""
+        references_lower = list(dict.fromkeys(reference.lower().strip() for reference in references))
+        matrix = self.semantic_matcher.normalized_similarity_matrix(skill_terms, references_lower)
+        return np.max(matrix, axis=1, initial=0.0)
+    
+    def _scoring_plan(self, job_analysis: JobAnalysisResult) -> SkillScoringPlan:
+        """Resolve the focus, experience and industry choices the per-skill steps depend on"""
+        technical = job_analysis.primary_focus == "technical"
+        business = job_analysis.primary_focus == "business"
+        domain_contributions = self._domain_contributions(job_analysis)
+        experience_terms, experience_alignment = _EXPERIENCE_ALIGNMENT.get(job_analysis.experience_level, ((), 0.0))
+        industry = job_analysis.industry_context.get("industry", "general")
         
-        # 2. Domain relevance with focus-based weighting
+        return SkillScoringPlan(
+            # Technical roles scan skills only for the domain boost, business roles also for penalty terms
+            scan_keywords=business or (technical and bool(domain_contributions)),
+            # Industry relevance reads the business domains for any non-technical focus
+            domain_matrix=self._tech_domain_matrix if technical else self._business_domain_matrix,
+            domain_contributions=domain_contributions,
+            experience_terms=experience_terms,
+            experience_alignment=experience_alignment,
+            industry=industry,
+            industry_relevances={} if industry == "general" else _industry_relevance_rows(technical, industry),
+            penalize_technical_terms=business
+        )
+    
+    def _domain_contributions(self, job_analysis: JobAnalysisResult) -> Dict[int, float]:
+        """Boost each domain row adds per skill keyword it lists, for the rows that add any"""
         if job_analysis.primary_focus == "technical":
-            for domain, score in job_analysis.tech_domains.items():
-                domain_config = self.tech_domains.get(domain, {})
-                for keyword in domain_config.get("keywords", []):
-                    if keyword in skill_name or keyword in skill_context:
-                        domain_boost += min(score / 15.0, 0.8) * domain_config.get("weight", 1.0)
-        
+            domain_scores, domain_matrix, scale = job_analysis.tech_domain_scores, self._tech_domain_matrix, 15.0
+            if domain_scores is None:
+                domain_scores = self._domain_score_vector(job_analysis.tech_domains, domain_matrix)
         elif job_analysis.primary_focus == "business":
-            for domain, score in job_analysis.business_domains.items():
-                domain_config = self.business_domains.get(domain, {})
-                for keyword in domain_config.get("keywords", []):
-                    if keyword in skill_name or keyword in skill_context:
-                        domain_boost += min(score / 10.0, 0.8) * domain_config.get("weight", 1.0)
-        
-        # 3. Experience level alignment
-        if job_analysis.experience_level == "senior" and "senior" in skill_context:
-            experience_alignment = 0.2
-        elif job_analysis.experience_level == "junior" and any(term in skill_context for term in ["basic", "entry", "beginner"]):
-            experience_alignment = 0.1
-        elif job_analysis.experience_level == "mid":
-            experience_alignment = 0.1
-        
-        # 4. Industry relevance boost
-        industry = job_analysis.industry_context.get("industry", "general")
-        if industry != "general":
-            # Check if skill is particularly relevant to this industry
-            if job_analysis.primary_focus == "technical":
-                for domain, config in self.tech_domains.items():
-                    if industry in config.get("industry_boost", {}):
-                        for keyword in config["keywords"]:
-                            if keyword in skill_name:
-                                industry_relevance = 0.15 * (config["industry_boost"][industry] - 1.0)
-                                break
-            else:
-                for domain, config in self.business_domains.items():
-                    if industry in config.get("industry_boost", {}):
-                        for keyword in config["keywords"]:
-                            if keyword in skill_name:
-                                industry_relevance = 0.15 * (config["industry_boost"][industry] - 1.0)
-                                break
-        
-        # 5. Semantic similarity with explicit technologies
-        for tech in job_analysis.explicit_technologies:
-            similarity = self.semantic_matcher.calculate_semantic_similarity(skill_name, tech)
-            semantic_similarity = max(semantic_similarity, similarity * 0.3)
+            domain_scores, domain_matrix, scale = job_analysis.business_domain_scores, self._business_domain_matrix, 10.0
+            if domain_scores is None:
+                domain_scores = self._domain_score_vector(job_analysis.business_domains, domain_matrix)
+        else:
+            return {}
+        contributions = (np.minimum(domain_scores / scale, 0.8) * domain_matrix.weights).tolist()
+        return {row: contribution for row, contribution in enumerate(contributions) if contribution > 0}
+    
+    def _domain_score_vector(self, domain_scores: Dict[str, float], domain_matrix: DomainMatrix) -> np.ndarray:
+        """Row-aligned scores for an analysis built without them"""
+        return np.array([domain_scores.get(domain, 0.0) for domain in domain_matrix.domain_names])
+    
+    def _skill_components(self, skill_data: Dict, skill_name: str,
+                          plan: SkillScoringPlan) -> Tuple[float, float, float, float]:
+        """Domain boost, experience alignment, industry relevance and penalty for one skill"""
         
-        # 6. Role-specific penalties for mismatched skills
+        skill_context = skill_data.get('context', '').lower()
+        domain_boost = 0.0
+        experience_alignment = 0.0
+        industry_relevance = 0.0
         penalty = 0.0
-        if job_analysis.primary_focus == "business":
-            # Penalize pure technical skills for business roles
-            technical_only_terms = ["network security", "server administration", "hardware troubleshooting"]
-            if any(term in skill_name for term in technical_only_terms):
+        
+        if plan.scan_keywords:
+            skill_keywords = self._domain_matcher.keywords_in(skill_name + _SKILL_FIELD_SEPARATOR + skill_context)
+            
+            # 2. Domain relevance with focus-based weighting, from one keyword scan of the skill
+            if plan.domain_contributions:
+                domain_boost = self._skill_domain_boost(skill_keywords, plan.domain_contributions, plan.domain_matrix)
+            
+            # 6. Penalize pure technical skills for business roles; the scan found the terms in
+            # the name or context, so only its hits are checked against the name
+            if plan.penalize_technical_terms and any(
+                    term in skill_name for term in _TECHNICAL_ONLY_TERMS if term in skill_keywords):
                 penalty = 0.4
         
-        # Calculate final score
-        final_score = (base_score + domain_boost + experience_alignment + 
-                      industry_relevance + semantic_similarity) - penalty
-        final_score = max(0.0, min(1.0, final_score))
+        # 3. Experience level alignment
+        if not plan.experience_terms or any(term in skill_context for term in plan.experience_terms):
+            experience_alignment = plan.experience_alignment
         
-        # Generate explanation
-        explanation = self._generate_score_explanation(
-            skill_name, base_score, domain_boost, experience_alignment, 
-            industry_relevance, semantic_similarity, penalty, job_analysis
-        )
+        # 4. Industry relevance boost from the last domain boosting this industry with a keyword in the skill name
+        if plan.industry_relevances:
+            row = plan.domain_matrix.last_boosting_row(plan.industry, self._domain_matcher.keywords_in(skill_name))
+            if row is not None:
+                industry_relevance = plan.industry_relevances[row]
         
-        # Calculate confidence based on score components
-        confidence = self._calculate_confidence(base_score, domain_boost, semantic_similarity)
+        return domain_boost, experience_alignment, industry_relevance, penalty
+    
+    def _skill_domain_boost(self, skill_keywords: Set[str], domain_contributions: Dict[int, float],
+                            domain_matrix: DomainMatrix) -> float:
+        """Boost from every domain keyword found in the skill, using the job's per-domain contributions"""
+        row_hits: Dict[int, int] = {}
+        for keyword in skill_keywords:
+            for row in domain_matrix.keyword_rows.get(keyword, ()):
+                if row in domain_contributions:
+                    row_hits[row] = row_hits.get(row, 0) + 1
         
-        return SkillRelevanceScore(
-            skill_name=skill_data['skill_name'],
-            base_score=base_score,
-            domain_boost=domain_boost,
-            experience_alignment=experience_alignment,
-            industry_relevance=industry_relevance,
-            semantic_similarity=semantic_similarity,
-            final_score=final_score,
-            explanation=explanation,
-            confidence=confidence
-        )
+        domain_boost = 0.0
+        for row, contribution in domain_contributions.items():
+            # Added once per keyword in domain order; a product or dot product can round
+            # differently and flip score thresholds
+            for _ in range(row_hits.get(row, 0)):
+                domain_boost += contribution
+        return domain_boost
+    
+    def _explanation_codes(self, base_scores: np.ndarray, domain_boosts: np.ndarray,
+                           industry_relevances: np.ndarray, semantic_similarities: np.ndarray,
+                           penalties: np.ndarray) -> np.ndarray:
+        """Pack the explanation clauses that apply to each score into an int8 code"""
+        
+        # One comparison of every component against its thresholds, then one weighted sum per score
+        components = np.array([
+            base_scores, base_scores, base_scores, domain_boosts, domain_boosts,
+            industry_relevances, semantic_similarities, penalties
+        ])
+        return (components > _EXPLANATION_THRESHOLDS[:, None]).T @ _EXPLANATION_WEIGHTS
     
-    def _generate_score_explanation(self, skill_name: str, base_score: float, 
-                                  domain_boost: float, experience_alignment: float,
-                                  industry_relevance: float, semantic_similarity: float, 
-                                  penalty: float, job_analysis: JobAnalysisResult) -> str:
-        """Generate human-readable explanation for the score"""
+    def _generate_score_explanation(self, explanation_code: int, job_analysis: JobAnalysisResult) -> str:
+        """Generate human-readable explanation for a packed explanation code"""
         
         explanations = []
         
-        if base_score > 0.7:
-            explanations.append("Strong match with job requirements")
-        elif base_score > 0.4:
-            explanations.append("Moderate match with job requirements")
-        elif base_score > 0.1:
-            explanations.append("Weak match with job requirements")
+        requirement_match = _REQUIREMENT_MATCH_PHRASES[explanation_code & 0b11]
+        if requirement_match:
+            explanations.append(requirement_match)
         
-        if domain_boost > 0.5:
-            explanations.append(f"High relevance to {job_analysis.primary_focus} role")
-        elif domain_boost > 0.2:
-            explanations.append(f"Moderate relevance to {job_analysis.primary_focus} role")
+        domain_relevance = _DOMAIN_RELEVANCE_LEVELS[(explanation_code >> 2) & 0b11]
+        if domain_relevance:
+            explanations.append(f"{domain_relevance} relevance to {job_analysis.primary_focus} role")
         
-        if industry_relevance > 0.1:
+        if explanation_code & _INDUSTRY_VALUE_FLAG:
             industry = job_analysis.industry_context.get("industry", "general")
             explanations.append(f"Valuable for {industry} industry")
         
-        if semantic_similarity > 0.2:
+        if explanation_code & _SEMANTIC_SIMILARITY_FLAG:
             explanations.append("Semantic similarity with mentioned technologies")
         
-        if penalty > 0:
+        if explanation_code & _ROLE_MISMATCH_FLAG:
             explanations.append("Some mismatch with role focus")
         
         return "; ".join(explanations) if explanations else "Basic relevance assessment"
     
-    def _calculate_confidence(self, base_score: float, domain_boost: float, semantic_similarity: float) -> float:
-        """Calculate confidence in the relevance score"""
-        
-        # High confidence if we have strong direct matches
-        if base_score > 0.8:
-            return 0.95
-        
-        # Medium-high confidence with good domain relevance
-        if base_score > 0.5 or domain_boost > 0.6:
-            return 0.8
-        
-        # Medium confidence with some indicators
-        if base_score > 0.2 or domain_boost > 0.3 or semantic_similarity > 0.3:
-            return 0.6
-        
-        # Low confidence
-        return 0.4
+    def _calculate_confidences(self, base_scores: np.ndarray, domain_boosts: np.ndarray,
+                               semantic_similarities: np.ndarray) -> np.ndarray:
+        """Calculate confidence in each relevance score"""
+        
+        # High confidence with strong direct matches, medium-high with good domain relevance,
+        # medium with some indicators, low otherwise
+        return np.where(
+            base_scores > 0.8, 0.95,
+            np.where(
+                (base_scores > 0.5) | (domain_boosts > 0.6), 0.8,
+                np.where((base_scores > 0.2) | (domain_boosts > 0.3) | (semantic_similarities > 0.3), 0.6, 0.4)
+            )
+        )
     
     def learn_from_feedback(self, skill_name: str, job_description: str, 
                           feedback_type: str, user_score: Optional[float] = None):
         """Learn from user feedback to improve future scoring"""
         
-        # Store feedback pattern
-        feedback_entry = {
-            "skill": skill_name.lower(),
-            "job_context": job_description[:200].lower(),  # First 200 chars for context
-            "feedback_type": feedback_type,  # "positive", "negative", "neutral"
-            "user_score": user_score,
-            "timestamp": datetime.now()
-        }
+        # Stamp once as integer nanoseconds; ISO formatting waits for export
+        timestamp_ns = time.time_ns()
         
-        self.feedback_patterns[skill_name.lower()].append(feedback_entry)
+        # Store feedback pattern with the first 200 chars of the job for context;
+        # feedback_type is "positive", "negative" or "neutral"
+        self.feedback_patterns.append(
+            skill_name.lower(), feedback_type, user_score, timestamp_ns, job_description[:200].lower()
+        )
         
         # Update skill performance history
         if user_score is not None:
-            self.skill_performance_history[skill_name.lower()].append({
-                "score": user_score,
-                "timestamp": datetime.now(),
-                "context": job_description[:100].lower()
-            })
+            self.skill_performance_history.append(
+                skill_name.lower(), user_score, timestamp_ns, job_description[:100].lower()
+            )
     
     def get_learning_insights(self) -> Dict[str, Any]:
         """Get insights from the learning system"""
         
         insights = {
-            "total_feedback_entries": sum(len(patterns) for patterns in self.feedback_patterns.values()),
-            "skills_with_feedback": len(self.feedback_patterns),
+            "total_feedback_entries": len(self.feedback_patterns),
+            "skills_with_feedback": self.feedback_patterns.skill_count(),
             "top_performing_skills": [],
             "underperforming_skills": [],
             "feedback_trends": {}
         }
         
         # Analyze skill performance
-        for skill, history in self.skill_performance_history.items():
-            if len(history) >= 3:
-                avg_score = sum(entry["score"] for entry in history) / len(history)
-                
+        skills, counts, means = self.skill_performance_history.skill_statistics()
+        for skill, feedback_count, avg_score in zip(skills, counts.tolist(), means.tolist()):
+            if feedback_count >= 3:
                 if avg_score > 0.8:
                     insights["top_performing_skills"].append({
                         "skill": skill,
                         "avg_score": avg_score,
-                        "feedback_count": len(history)
+                        "feedback_count": feedback_count
                     })
                 elif avg_score < 0.4:
                     insights["underperforming_skills"].append({
                         "skill": skill,
                         "avg_score": avg_score,
-                        "feedback_count": len(history)
+                        "feedback_count": feedback_count
                     })
         
-        # Analyze feedback trends
-        positive_feedback = sum(1 for patterns in self.feedback_patterns.values() 
-                               for entry in patterns if entry["feedback_type"] == "positive")
-        negative_feedback = sum(1 for patterns in self.feedback_patterns.values() 
-                               for entry in patterns if entry["feedback_type"] == "negative")
+        # Analyze feedback trends, counting every feedback type in one pass
+        feedback_types = self.feedback_patterns.type_counts()
+        positive_feedback = feedback_types.get("positive", 0)
+        negative_feedback = feedback_types.get("negative", 0)
         
         insights["feedback_trends"] = {
             "positive_ratio": positive_feedback / (positive_feedback + negative_feedback) if (positive_feedback + negative_feedback) > 0 else 0,
@@ -948,33 +1538,29 @@ class AdvancedRelevanceEngine:
         return insights
     
     def clear_cache(self):
-        """Clear analysis cache"""
+        """Clear analysis and similarity caches"""
         self.analysis_cache.clear()
+        self.semantic_matcher.cache_clear()
     
     def export_learning_data(self, filepath: str):
-        """Export learning data for analysis"""
-        
-        export_data = {
-            "export_timestamp": datetime.now().isoformat(),
-            "feedback_patterns": {
-                skill: [
-                    {**entry, "timestamp": entry["timestamp"].isoformat()}
-                    for entry in patterns
-                ]
-                for skill, patterns in self.feedback_patterns.items()
-            },
-            "skill_performance_history": {
-                skill: [
-                    {**entry, "timestamp": entry["timestamp"].isoformat()}
-                    for entry in history
-                ]
-                for skill, history in self.skill_performance_history.items()
-            },
-            "learning_insights": self.get_learning_insights()
-        }
+        """Export learning data for analysis, writing one skill's entries at a time"""
+        
+        feedback_patterns = (
+            (skill, [{**entry, "timestamp": _isoformat_ns(entry["timestamp"])} for entry in patterns])
+            for skill, patterns in self.feedback_patterns.entries_by_skill().items()
+        )
+        skill_performance_history = (
+            (skill, [{**entry, "timestamp": _isoformat_ns(entry["timestamp"])} for entry in history])
+            for skill, history in self.skill_performance_history.entries_by_skill().items()
+        )
         
-        with open(filepath, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        with open(filepath, 'wb') as f:
+            _write_json_object(f, (
+                ("export_timestamp", datetime.now().isoformat()),
+                ("feedback_patterns", feedback_patterns),
+                ("skill_performance_history", skill_performance_history),
+                ("learning_insights", self.get_learning_insights())
+            ))
 
 
 # Global instance for backwards compatibility
@@ -18,13 +18,18 @@ OUTPUT_PATH = os.path.join(PROJECT_ROOT, 'output')
 OUTPUT_LOGS_PATH = os.path.join(OUTPUT_PATH, 'logs')
 OUTPUT_COVER_LETTERS_PATH = os.path.join(OUTPUT_PATH, 'cover_letters')
 
-# Ensure required directories exist
-os.makedirs(DATA_PROFILE_PATH, exist_ok=True)
-os.makedirs(DATA_INPUT_PATH, exist_ok=True)
-os.makedirs(TEMP_PATH, exist_ok=True)
-os.makedirs(OUTPUT_PATH, exist_ok=True)
-os.makedirs(OUTPUT_LOGS_PATH, exist_ok=True)
-os.makedirs(OUTPUT_COVER_LETTERS_PATH, exist_ok=True)
+# Required directories are created on the first write rather than on every import
+_DIRS_READY = False
+
+def ensure_dirs():
+    """Create the application directories once per process"""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for path in (DATA_PROFILE_PATH, DATA_INPUT_PATH, TEMP_PATH,
+                 OUTPUT_PATH, OUTPUT_LOGS_PATH, OUTPUT_COVER_LETTERS_PATH):
+        os.makedirs(path, exist_ok=True)
+    _DIRS_READY = True
 
 # Define the LOG_FILE_PATH variable
 LOG_FILE_PATH = os.path.join(OUTPUT_LOGS_PATH, 'structured_log.json')
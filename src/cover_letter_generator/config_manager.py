@@ -9,18 +9,43 @@ Purpose: Ultra-fine-tuned configuration management for public GitHub showcase
 """
 
 import os
-import json
+import sys
+import hashlib
 import yaml
 from typing import Any, Dict, List, Optional, Union, Type
 from pathlib import Path
 from datetime import datetime
 import threading
-import time
-from dataclasses import dataclass, field, asdict
+from collections import Counter, OrderedDict
+from itertools import chain, islice
+from operator import attrgetter
+from dataclasses import dataclass, field, asdict, fields, is_dataclass
 from enum import Enum
+from functools import lru_cache, reduce
 import logging
 from copy import deepcopy
 
+# Use the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, Dumper as _YamlDumper
+
+# Slotted dataclasses need Python 3.10; older interpreters keep per-instance dicts
+_SLOTS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Prefer OS file notifications (inotify, FSEvents, ...) over polling when watchdog is installed
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+from . import json_codec
+
 # Import our monitoring and error handling
 from .performance_monitor import get_global_performance_monitor
 from .error_handler import get_global_error_handler, ErrorContext
@@ -34,6 +59,18 @@ class Environment(Enum):
     DEMO = "demo"
 
 
+# COVER_LETTER_ENV values accepted by _detect_environment
+_ENV_MAPPING = {
+    "dev": Environment.DEVELOPMENT,
+    "development": Environment.DEVELOPMENT,
+    "test": Environment.TESTING,
+    "testing": Environment.TESTING,
+    "prod": Environment.PRODUCTION,
+    "production": Environment.PRODUCTION,
+    "demo": Environment.DEMO
+}
+
+
 class ConfigSource(Enum):
     """Configuration sources in priority order"""
     ENVIRONMENT_VARIABLE = "env_var"
@@ -41,7 +78,7 @@ class ConfigSource(Enum):
     DEFAULT = "default"
 
 
-@dataclass
+@dataclass(**_SLOTS_OPTIONS)
 class ConfigValue:
     """Container for configuration values with metadata"""
     value: Any
@@ -211,9 +248,86 @@ class ApplicationConfig:
         return asdict(self)
 
 
+def _leaf_paths(cls: Type, prefix: tuple = ()) -> tuple:
+    """Dotted key and attribute chain of every non-dataclass field under cls"""
+    paths = []
+    for config_field in fields(cls):
+        attrs = prefix + (config_field.name,)
+        if is_dataclass(config_field.type):
+            paths.extend(_leaf_paths(config_field.type, attrs))
+        else:
+            # Interned so config_values lookups with the same key compare by identity
+            paths.append((sys.intern(".".join(attrs)), attrs))
+    return tuple(paths)
+
+
+# The config tree is static, so its leaves are enumerated once instead of per validation
+_LEAF_PATHS = _leaf_paths(ApplicationConfig)
+
+# Fields a config file may set, per section, mapped to their dotted keys
+_SECTION_FIELDS = {
+    section_field.name: {
+        f.name: sys.intern(f"{section_field.name}.{f.name}") for f in fields(section_field.type)
+    }
+    for section_field in fields(ApplicationConfig)
+    if is_dataclass(section_field.type)
+}
+
+
+def _flat_view(config: ApplicationConfig) -> Dict[str, Any]:
+    """Map dotted keys to the live leaf values of config without copying"""
+    return {key: reduce(getattr, attrs, config) for key, attrs in _LEAF_PATHS}
+
+
+def _env_bool(value: str) -> bool:
+    """Interpret an environment variable as a flag"""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+def _compile_env_overrides(mappings: Dict[str, tuple]) -> tuple:
+    """Resolve each override's attribute chain and type conversion once from the schema defaults"""
+    defaults = ApplicationConfig()
+    compiled = []
+    for env_var, (section, key, is_sensitive) in mappings.items():
+        attrs = (section, key) if key else (section,)
+        default_value = reduce(getattr, attrs, defaults)
+        
+        # Convert type based on the field's type
+        if isinstance(default_value, bool):
+            convert = _env_bool
+        elif isinstance(default_value, int):
+            convert = int
+        elif isinstance(default_value, float):
+            convert = float
+        else:
+            convert = None
+        
+        compiled.append((env_var, attrs[:-1], attrs[-1], sys.intern(".".join(attrs)), convert, is_sensitive))
+    return tuple(compiled)
+
+
+# Environment variable overrides: (env var, parent attrs, attribute, config key, converter, is_sensitive)
+_ENV_OVERRIDES = _compile_env_overrides({
+    "OPENAI_API_KEY": ("openai", "api_key", True),
+    "OPENAI_MODEL": ("openai", "model", False),
+    "CACHE_SIZE": ("performance", "cache_size", False),
+    "DEBUG_MODE": ("debug_mode", None, False),
+    "LOG_LEVEL": ("logging", "log_level", False)
+})
+
+
+# Attribute paths read by the cross-dependency rules; keep in sync with them
+_CROSS_DEPENDENCY_PATHS = (
+    "environment", "debug_mode", "openai.api_key", "performance.cache_size",
+    "performance.max_history", "memory.max_skills", "security.encrypt_sensitive_data"
+)
+
+
 class ConfigurationValidator:
     """Advanced configuration validation with business rules"""
     
+    RESULT_CACHE_SIZE = 5
+    
     def __init__(self):
         self.validation_rules = {
             "openai.api_key": [
@@ -231,63 +345,164 @@ class ConfigurationValidator:
                 lambda x: 10 <= x <= 100000
             ]
         }
-    
-    def validate_config(self, config: ApplicationConfig) -> List[str]:
-        """Validate configuration and return list of errors"""
-        errors = []
-        config_dict = asdict(config)
-        
-        # Flatten nested configuration for validation
-        flat_config = self._flatten_dict(config_dict)
         
-        for key, rules in self.validation_rules.items():
-            if key in flat_config:
-                value = flat_config[key]
-                for rule in rules:
-                    try:
-                        if not rule(value):
-                            errors.append(f"Validation failed for {key}: {value}")
-                    except Exception as e:
-                        errors.append(f"Validation error for {key}: {e}")
-        
-        # Cross-validation rules
-        errors.extend(self._validate_cross_dependencies(config))
-        
-        return errors
-    
-    def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
-        """Flatten nested dictionary"""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
-    
-    def _validate_cross_dependencies(self, config: ApplicationConfig) -> List[str]:
-        """Validate cross-component dependencies"""
-        errors = []
-        
-        # Performance vs Memory consistency
-        if config.performance.cache_size > config.memory.max_skills:
-            errors.append("Performance cache size should not exceed max skills")
-        
-        # Environment-specific validations
+        # Cross-component rules as (check, message); production adds its own checks ahead of these
+        self._cross_rules = (
+            (lambda c: c.performance.cache_size > c.memory.max_skills,
+             "Performance cache size should not exceed max skills"),
+            (lambda c: c.performance.max_history > 50000 and c.memory.max_skills > 5000,
+             "High memory usage configuration detected - consider reducing limits"),
+        )
+        # A missing API key is the usual production failure, so it is checked first
+        self._production_cross_rules = (
+            (lambda c: not c.openai.api_key, "OpenAI API key is required in production"),
+            (lambda c: c.debug_mode, "Debug mode should be disabled in production"),
+            (lambda c: not c.security.encrypt_sensitive_data, "Data encryption should be enabled in production"),
+        ) + self._cross_rules
+        
+        # Accessors for each rule key, built once instead of flattening the config per validation
+        self._rule_getters = {key: attrgetter(key) for key in self.validation_rules}
+        
+        # Recent results keyed by every value the rules read
+        self._signature = self._build_signature()
+        self._result_cache: Dict[tuple, List[str]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Failures seen per rule key, used to check likely failures first when failing fast
+        self._rule_fail_hits = Counter()
+    
+    def _build_signature(self):
+        """Build the getter for every value the current rules read, used as the result cache key"""
+        leaf_keys = {key for key, _ in _LEAF_PATHS}
+        return attrgetter(*(key for key in self.validation_rules if key in leaf_keys),
+                          *_CROSS_DEPENDENCY_PATHS)
+    
+    def clear_cache(self):
+        """Forget cached results, e.g. after changing validation_rules"""
+        with self._cache_lock:
+            self._signature = self._build_signature()
+            self._result_cache.clear()
+    
+    def validate_config(self, config: ApplicationConfig, fail_fast: bool = False) -> List[str]:
+        """Validate configuration and return list of errors; fail_fast stops at the first uncached error"""
+        try:
+            values = self._signature(config)
+            # Types are part of the key since 1, 1.0 and True hash alike but render differently
+            signature = (values, tuple(map(type, values)))
+            with self._cache_lock:
+                cached = self._result_cache.get(signature)
+                if cached is not None:
+                    self._result_cache.move_to_end(signature)
+                    return list(cached)
+        except TypeError:
+            # Unhashable values loaded from a file are validated without caching
+            signature = None
+        
+        if fail_fast:
+            errors = list(islice(self._iter_errors_likeliest_first(config), 1))
+            if errors:
+                # Partial result, not cached
+                return errors
+        else:
+            errors = list(self._iter_errors(config))
+        
+        if signature is not None:
+            with self._cache_lock:
+                self._result_cache[signature] = errors
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        
+        return list(errors)
+    
+    def _iter_errors(self, config: ApplicationConfig):
+        """Yield every error, per-key rules first and then cross-validation rules"""
+        return chain(self._iter_rule_errors(config, self.validation_rules.items()),
+                     self._validate_cross_dependencies(config))
+    
+    def _iter_errors_likeliest_first(self, config: ApplicationConfig):
+        """Yield errors lazily, cross-dependency checks first, then rules by past failure count"""
+        rule_items = sorted(self.validation_rules.items(), key=lambda item: -self._rule_fail_hits[item[0]])
+        return chain(self._validate_cross_dependencies(config), self._iter_rule_errors(config, rule_items))
+    
+    def _iter_rule_errors(self, config: ApplicationConfig, rule_items):
+        """Yield an error for every failing per-key rule"""
+        for key, rules in rule_items:
+            getter = self._rule_getters.get(key)
+            if getter is None:
+                # Rule added after construction
+                getter = self._rule_getters[key] = attrgetter(key)
+            try:
+                value = getter(config)
+            except AttributeError:
+                continue
+            for rule in rules:
+                try:
+                    if rule(value):
+                        continue
+                    error = f"Validation failed for {key}: {value}"
+                except Exception as e:
+                    error = f"Validation error for {key}: {e}"
+                # Validation also runs on the file-watch thread
+                with self._cache_lock:
+                    self._rule_fail_hits[key] += 1
+                yield error
+    
+    def _validate_cross_dependencies(self, config: ApplicationConfig):
+        """Yield cross-component dependency errors, likeliest failures first"""
         if config.environment == Environment.PRODUCTION:
-            if config.debug_mode:
-                errors.append("Debug mode should be disabled in production")
-            if not config.openai.api_key:
-                errors.append("OpenAI API key is required in production")
-            if not config.security.encrypt_sensitive_data:
-                errors.append("Data encryption should be enabled in production")
+            rules = self._production_cross_rules
+        else:
+            rules = self._cross_rules
+        return (message for check, message in rules if check(config))
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file, cached on its stat fingerprint so unchanged files are not re-parsed"""
+    if path.endswith('.yaml') or path.endswith('.yml'):
+        with open(path, 'r') as f:
+            return yaml.load(f, Loader=_YamlLoader) or {}
+    elif path.endswith('.json'):
+        with open(path, 'rb') as f:
+            return json_codec.loads(f.read()) or {}
+    else:
+        raise ValueError(f"Unsupported config file format: {path}")
+
+
+def _json_export_default(obj: Any) -> Any:
+    """Render enums by value so orjson and the json fallback export alike"""
+    return obj.value if isinstance(obj, Enum) else str(obj)
+
+
+def _content_fingerprint(path: str) -> str:
+    """Hash raw file contents to tell real edits from bare mtime bumps"""
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+class _ConfigFileEventHandler(FileSystemEventHandler):
+    """Forward file system events for one config file to its manager"""
+    
+    RELOAD_EVENTS = {"created", "modified", "moved"}
+    
+    def __init__(self, manager: "ConfigurationManager"):
+        super().__init__()
+        self.manager = manager
+        self.config_path = os.path.abspath(manager.config_file)
+    
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in self.RELOAD_EVENTS:
+            return
         
-        # Resource constraints
-        if config.performance.max_history > 50000 and config.memory.max_skills > 5000:
-            errors.append("High memory usage configuration detected - consider reducing limits")
+        # Editors often save by renaming a temporary file over the original
+        path = getattr(event, "dest_path", "") or event.src_path
+        if os.path.abspath(path) != self.config_path:
+            return
         
-        return errors
+        try:
+            self.manager._reload_if_content_changed()
+        except Exception as e:
+            self.manager.logger.error(f"Error watching config file: {e}")
 
 
 class ConfigurationManager:
@@ -307,12 +522,14 @@ class ConfigurationManager:
     
     def __init__(self, config_file: Optional[str] = None, environment: Optional[Environment] = None):
         self.config_file = config_file or "config.yaml"
+        self._config_path = Path(self.config_file)
         self.environment = environment or self._detect_environment()
         self.validator = ConfigurationValidator()
         
         # Configuration storage
         self.config: ApplicationConfig = None
         self.config_values: Dict[str, ConfigValue] = {}
+        self._last_updated: Optional[datetime] = None
         self.change_listeners: List[callable] = []
         
         # Monitoring
@@ -323,6 +540,7 @@ class ConfigurationManager:
         # File watching for dynamic reloading
         self._file_watch_thread = None
         self._stop_watching = threading.Event()
+        self._watched_fingerprint = None
         
         # Load initial configuration
         self.reload_configuration()
@@ -334,39 +552,35 @@ class ConfigurationManager:
     def _detect_environment(self) -> Environment:
         """Detect environment from environment variables"""
         env_name = os.getenv("COVER_LETTER_ENV", "development").lower()
-        
-        env_mapping = {
-            "dev": Environment.DEVELOPMENT,
-            "development": Environment.DEVELOPMENT,
-            "test": Environment.TESTING,
-            "testing": Environment.TESTING,
-            "prod": Environment.PRODUCTION,
-            "production": Environment.PRODUCTION,
-            "demo": Environment.DEMO
-        }
-        
-        return env_mapping.get(env_name, Environment.DEVELOPMENT)
+        return _ENV_MAPPING.get(env_name, Environment.DEVELOPMENT)
     
     def reload_configuration(self):
         """Reload configuration from all sources"""
         try:
+            self.validator.clear_cache()
+            
+            # A reload is one logical moment for source tracking
+            now = datetime.now()
+            
             # Start with defaults
             config = ApplicationConfig()
             config.environment = self.environment
             
             # Load from file if exists
-            if Path(self.config_file).exists():
+            if self._config_path.exists():
                 file_config = self._load_config_file()
-                config = self._merge_configs(config, file_config)
+                config = self._merge_configs(config, file_config, now)
             
             # Override with environment variables
-            config = self._apply_environment_overrides(config)
+            config = self._apply_environment_overrides(config, now)
             
             # Apply environment-specific settings
             config = self._apply_environment_specific_settings(config)
             
-            # Validate configuration
-            validation_errors = self.validator.validate_config(config)
+            # Validate configuration; production halts on the first error anyway
+            validation_errors = self.validator.validate_config(
+                config, fail_fast=self.environment == Environment.PRODUCTION
+            )
             if validation_errors:
                 self.logger.warning(f"Configuration validation errors: {validation_errors}")
                 # Continue with warnings in development, halt in production
@@ -396,88 +610,70 @@ class ConfigurationManager:
     def _load_config_file(self) -> Dict[str, Any]:
         """Load configuration from file"""
         try:
-            with open(self.config_file, 'r') as f:
-                if self.config_file.endswith('.yaml') or self.config_file.endswith('.yml'):
-                    return yaml.safe_load(f) or {}
-                elif self.config_file.endswith('.json'):
-                    return json.load(f) or {}
-                else:
-                    raise ValueError(f"Unsupported config file format: {self.config_file}")
+            stat = os.stat(self.config_file)
+            # Copy so callers cannot mutate the cached parse
+            return deepcopy(_parse_config_file(self.config_file, stat.st_mtime_ns, stat.st_size))
         except Exception as e:
             self.logger.error(f"Failed to load config file {self.config_file}: {e}")
             return {}
     
-    def _merge_configs(self, base_config: ApplicationConfig, file_config: Dict[str, Any]) -> ApplicationConfig:
+    def _merge_configs(self, base_config: ApplicationConfig, file_config: Dict[str, Any],
+                       now: Optional[datetime] = None) -> ApplicationConfig:
         """Merge file configuration into base configuration"""
         
+        now = now or datetime.now()
+        description = f"Loaded from {self.config_file}"
+        
         # Convert file config to nested structure
         for section, values in file_config.items():
-            if hasattr(base_config, section) and isinstance(values, dict):
+            section_fields = _SECTION_FIELDS.get(section)
+            if section_fields and isinstance(values, dict):
                 section_obj = getattr(base_config, section)
                 for key, value in values.items():
-                    if hasattr(section_obj, key):
+                    config_key = section_fields.get(key)
+                    if config_key is not None:
                         setattr(section_obj, key, value)
                         
                         # Track configuration source
-                        config_key = f"{section}.{key}"
                         self.config_values[config_key] = ConfigValue(
                             value=value,
                             source=ConfigSource.CONFIG_FILE,
-                            last_updated=datetime.now(),
-                            description=f"Loaded from {self.config_file}"
+                            last_updated=now,
+                            description=description
                         )
+                        self._note_update(now)
         
         return base_config
     
-    def _apply_environment_overrides(self, config: ApplicationConfig) -> ApplicationConfig:
+    def _apply_environment_overrides(self, config: ApplicationConfig,
+                                     now: Optional[datetime] = None) -> ApplicationConfig:
         """Apply environment variable overrides"""
         
-        # Define environment variable mappings
-        env_mappings = {
-            "OPENAI_API_KEY": ("openai", "api_key", True),
-            "OPENAI_MODEL": ("openai", "model", False),
-            "CACHE_SIZE": ("performance", "cache_size", False),
-            "DEBUG_MODE": ("debug_mode", None, False),
-            "LOG_LEVEL": ("logging", "log_level", False)
-        }
-        
-        for env_var, (section, key, is_sensitive) in env_mappings.items():
+        now = now or datetime.now()
+        for env_var, parent_attrs, attr, config_key, convert, is_sensitive in _ENV_OVERRIDES:
             env_value = os.getenv(env_var)
             if env_value is not None:
-                # Type conversion
-                if key and hasattr(getattr(config, section, None), key):
-                    attr_obj = getattr(config, section)
-                    current_value = getattr(attr_obj, key)
-                    
-                    # Convert type based on current value type
-                    if isinstance(current_value, bool):
-                        env_value = env_value.lower() in ('true', '1', 'yes', 'on')
-                    elif isinstance(current_value, int):
-                        env_value = int(env_value)
-                    elif isinstance(current_value, float):
-                        env_value = float(env_value)
-                    
-                    setattr(attr_obj, key, env_value)
-                    config_key = f"{section}.{key}"
-                else:
-                    # Direct attribute
-                    current_value = getattr(config, section)
-                    if isinstance(current_value, bool):
-                        env_value = env_value.lower() in ('true', '1', 'yes', 'on')
-                    setattr(config, section, env_value)
-                    config_key = section
+                if convert is not None:
+                    env_value = convert(env_value)
+                setattr(reduce(getattr, parent_attrs, config), attr, env_value)
                 
                 # Track source
                 self.config_values[config_key] = ConfigValue(
                     value=env_value,
                     source=ConfigSource.ENVIRONMENT_VARIABLE,
-                    last_updated=datetime.now(),
+                    last_updated=now,
                     description=f"Override from {env_var}",
                     is_sensitive=is_sensitive
                 )
+                self._note_update(now)
         
         return config
     
+    def _note_update(self, timestamp: datetime):
+        """Keep the newest config_values timestamp so the summary need not scan for it"""
+        if self._last_updated is None or timestamp > self._last_updated:
+            self._last_updated = timestamp
+    
     def _apply_environment_specific_settings(self, config: ApplicationConfig) -> ApplicationConfig:
         """Apply environment-specific optimizations"""
         
@@ -515,9 +711,7 @@ class ConfigurationManager:
         """Notify listeners of configuration changes"""
         
         # Find changed values
-        old_dict = asdict(old_config)
-        new_dict = asdict(new_config)
-        changes = self._find_config_differences(old_dict, new_dict)
+        changes = self._find_config_differences(old_config, new_config)
         
         if changes:
             self.logger.info(f"Configuration changes detected: {list(changes.keys())}")
@@ -529,27 +723,19 @@ class ConfigurationManager:
                 except Exception as e:
                     self.logger.error(f"Error notifying config change listener: {e}")
     
-    def _find_config_differences(self, old_dict: Dict, new_dict: Dict, prefix: str = "") -> Dict[str, Any]:
-        """Find differences between two configuration dictionaries"""
+    def _find_config_differences(self, old_config: ApplicationConfig, new_config: ApplicationConfig) -> Dict[str, Any]:
+        """Find differences between two configurations leaf by leaf"""
         differences = {}
+        old_view = _flat_view(old_config)
         
-        all_keys = set(old_dict.keys()) | set(new_dict.keys())
-        
-        for key in all_keys:
-            full_key = f"{prefix}.{key}" if prefix else key
-            
-            if key not in old_dict:
-                differences[full_key] = {"type": "added", "new_value": new_dict[key]}
-            elif key not in new_dict:
-                differences[full_key] = {"type": "removed", "old_value": old_dict[key]}
-            elif isinstance(old_dict[key], dict) and isinstance(new_dict[key], dict):
-                nested_diffs = self._find_config_differences(old_dict[key], new_dict[key], full_key)
-                differences.update(nested_diffs)
-            elif old_dict[key] != new_dict[key]:
-                differences[full_key] = {
+        for key, new_value in _flat_view(new_config).items():
+            old_value = old_view[key]
+            if old_value != new_value:
+                # Copy like asdict() did so listeners never hold live config lists
+                differences[key] = {
                     "type": "changed",
-                    "old_value": old_dict[key],
-                    "new_value": new_dict[key]
+                    "old_value": deepcopy(old_value),
+                    "new_value": deepcopy(new_value)
                 }
         
         return differences
@@ -559,33 +745,63 @@ class ConfigurationManager:
         if self._file_watch_thread and self._file_watch_thread.is_alive():
             return
         
+        if self._config_path.exists():
+            self._watched_fingerprint = _content_fingerprint(self.config_file)
+        
+        if WATCHDOG_AVAILABLE:
+            try:
+                observer = Observer()
+                observer.schedule(_ConfigFileEventHandler(self),
+                                  os.path.dirname(os.path.abspath(self.config_file)),
+                                  recursive=False)
+                observer.start()
+                self._file_watch_thread = observer
+                self.logger.info("Started configuration file watching")
+                return
+            except Exception as e:
+                self.logger.warning(f"File notifications unavailable, polling config file instead: {e}")
+        
         def watch_file():
             last_modified = None
             
             while not self._stop_watching.is_set():
                 try:
-                    if Path(self.config_file).exists():
-                        current_modified = Path(self.config_file).stat().st_mtime
-                        
-                        if last_modified and current_modified > last_modified:
-                            self.logger.info("Configuration file changed, reloading...")
-                            self.reload_configuration()
+                    # One stat per tick; a missing file raises instead of needing exists()
+                    try:
+                        current_modified = os.stat(self.config_file).st_mtime_ns
+                    except FileNotFoundError:
+                        current_modified = None
+                    
+                    if current_modified is not None:
+                        if last_modified is not None and current_modified > last_modified:
+                            self._reload_if_content_changed()
                         
                         last_modified = current_modified
                     
-                    time.sleep(5)  # Check every 5 seconds
+                    self._stop_watching.wait(5)  # Check every 5 seconds
                     
                 except Exception as e:
                     self.logger.error(f"Error watching config file: {e}")
-                    time.sleep(30)  # Wait longer on error
+                    self._stop_watching.wait(30)  # Wait longer on error
         
         self._file_watch_thread = threading.Thread(target=watch_file, daemon=True)
         self._file_watch_thread.start()
         self.logger.info("Started configuration file watching")
     
+    def _reload_if_content_changed(self):
+        """Reload unless the file still has the contents the watcher last saw"""
+        # Touched files with identical content need no reload
+        fingerprint = _content_fingerprint(self.config_file)
+        if fingerprint != self._watched_fingerprint:
+            self.logger.info("Configuration file changed, reloading...")
+            self.reload_configuration()
+        self._watched_fingerprint = fingerprint
+    
     def stop_file_watching(self):
         """Stop watching configuration file"""
         if self._file_watch_thread and self._file_watch_thread.is_alive():
+            if WATCHDOG_AVAILABLE and isinstance(self._file_watch_thread, Observer):
+                self._file_watch_thread.stop()
             self._stop_watching.set()
             self._file_watch_thread.join(timeout=10)
             self.logger.info("Stopped configuration file watching")
@@ -617,16 +833,18 @@ class ConfigurationManager:
                 
                 # Track the change
                 config_key = f"{section}.{key}"
+                now = datetime.now()
                 self.config_values[config_key] = ConfigValue(
                     value=value,
                     source=ConfigSource.DEFAULT,  # Runtime change
-                    last_updated=datetime.now(),
+                    last_updated=now,
                     description="Runtime modification"
                 )
+                self._note_update(now)
                 
                 self.logger.info(f"Configuration updated: {config_key} = {value} (was {old_value})")
                 
-                # Validate new configuration
+                # Validate new configuration in full, so the error names the rule just broken
                 validation_errors = self.validator.validate_config(self.config)
                 if validation_errors:
                     # Rollback on validation failure
@@ -652,29 +870,26 @@ class ConfigurationManager:
             if "openai" in export_data["configuration"]:
                 export_data["configuration"]["openai"]["api_key"] = "***HIDDEN***"
         
-        with open(filepath, 'w') as f:
-            if filepath.endswith('.yaml') or filepath.endswith('.yml'):
-                yaml.dump(export_data, f, default_flow_style=False, indent=2)
-            else:
-                json.dump(export_data, f, indent=2, default=str)
+        if filepath.endswith('.yaml') or filepath.endswith('.yml'):
+            with open(filepath, 'w') as f:
+                yaml.dump(export_data, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+        else:
+            with open(filepath, 'wb') as f:
+                f.write(json_codec.dumps(export_data, indent=True, default=_json_export_default))
     
     def get_configuration_summary(self) -> Dict[str, Any]:
         """Get a summary of current configuration"""
         
+        source_counts = Counter(cv.source for cv in self.config_values.values())
+        
         return {
             "environment": self.environment.value,
             "config_file": self.config_file,
-            "file_exists": Path(self.config_file).exists(),
+            "file_exists": self._config_path.exists(),
             "total_config_values": len(self.config_values),
-            "sources_breakdown": {
-                source.value: sum(1 for cv in self.config_values.values() if cv.source == source)
-                for source in ConfigSource
-            },
-            "last_reload": max(
-                (cv.last_updated for cv in self.config_values.values()),
-                default=datetime.now()
-            ).isoformat(),
-            "validation_status": "valid" if not self.validator.validate_config(self.config) else "warnings",
+            "sources_breakdown": {source.value: source_counts[source] for source in ConfigSource},
+            "last_reload": (self._last_updated or datetime.now()).isoformat(),
+            "validation_status": "valid" if not self.validator.validate_config(self.config, fail_fast=True) else "warnings",
             "file_watching_active": self._file_watch_thread and self._file_watch_thread.is_alive()
         }
     
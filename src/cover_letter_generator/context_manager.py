@@ -1,25 +1,56 @@
-import json
+from . import json_codec
 
 def reset_conversation_context():
     """Returns a fresh empty conversation context list."""
     return []
 
+def _encode_lines(messages):
+    """Encodes messages as JSON Lines, one message per line."""
+    # Encode in memory so the file gets one write instead of one per message
+    return b"".join(json_codec.dumps(message) + b"\n" for message in messages)
+
 def save_context_to_file(context, file_path):
-    """Saves the conversation context to a JSON file."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(context, f, ensure_ascii=False, indent=2)
+    """Saves the whole conversation context to a JSON Lines file, replacing its contents."""
+    with open(file_path, 'wb') as f:
+        f.write(_encode_lines(context))
+
+def append_messages_to_file(messages, file_path):
+    """Appends messages to a JSON Lines context file without rewriting earlier ones."""
+    with open(file_path, 'ab') as f:
+        f.write(_encode_lines(messages))
+
+def append_message_to_file(message, file_path):
+    """Appends a single message to a JSON Lines context file."""
+    append_messages_to_file([message], file_path)
+
+def persist_new_messages(context, file_path, saved_count):
+    """
+    Writes messages added since saved_count messages were persisted and returns the new count.
+    The first save of a session (saved_count 0) replaces the file; later saves only append.
+    """
+    if saved_count == 0:
+        save_context_to_file(context, file_path)
+    else:
+        append_messages_to_file(context[saved_count:], file_path)
+    return len(context)
 
 def load_context_from_file(file_path):
-    """Loads the conversation context from a JSON file, returns empty list if file not found."""
+    """Loads the conversation context from a JSON Lines file, returns empty list if file not found."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
         return []
+    # Files written before the JSON Lines format hold a single JSON array
+    if data.lstrip().startswith(b"["):
+        return json_codec.loads(data)
+    return [json_codec.loads(line) for line in data.splitlines() if line.strip()]
 
-def update_context(context, new_message):
-    """Appends a new message dictionary to the context list."""
+def update_context(context, new_message, file_path=None):
+    """Appends a new message dictionary to the context list, and to file_path when given."""
     context.append(new_message)
+    if file_path:
+        append_message_to_file(new_message, file_path)
 
 def extract_response_and_update_context(response, context):
     """
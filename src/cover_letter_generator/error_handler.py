@@ -9,11 +9,16 @@ Purpose: Ultra-fine-tuned error handling for public GitHub showcase
 """
 
 import sys
+import time
+import asyncio
 import traceback
 import functools
 import logging
+import logging.handlers
+from collections import Counter, deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 from pathlib import Path
 import json
 
@@ -27,6 +32,16 @@ class ErrorSeverity:
     INFO = "INFO"           # General information and debug data
 
 
+# Ordering of severities, lowest first
+_SEVERITY_RANK = {
+    ErrorSeverity.INFO: 0,
+    ErrorSeverity.LOW: 1,
+    ErrorSeverity.MEDIUM: 2,
+    ErrorSeverity.HIGH: 3,
+    ErrorSeverity.CRITICAL: 4
+}
+
+
 class RecoveryStrategy:
     """Recovery strategies for different error types"""
     HALT = "halt"           # Stop execution immediately
@@ -36,6 +51,12 @@ class RecoveryStrategy:
     USER_INPUT = "user_input"  # Request user intervention
 
 
+def _datetime_from_ns(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() reading to a local datetime without float rounding"""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
 class ErrorContext:
     """Rich context information for error analysis"""
     
@@ -43,8 +64,18 @@ class ErrorContext:
         self.operation = operation
         self.component = component
         self.data = data or {}
-        self.timestamp = datetime.now()
-        self.stack_trace = traceback.format_stack()
+        self.timestamp_ns = time.time_ns()
+        self.stack_trace: Optional[List[str]] = None
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time, converted from the raw nanosecond reading on access"""
+        return _datetime_from_ns(self.timestamp_ns)
+    
+    def capture_stack(self, skip: int = 0) -> List[str]:
+        """Record the last 5 stack frames leading up to the caller, leaving out its innermost skip frames"""
+        self.stack_trace = traceback.format_stack(limit=6 + skip)[:-1 - skip]
+        return self.stack_trace
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -52,7 +83,17 @@ class ErrorContext:
             "component": self.component,
             "data": self.data,
             "timestamp": self.timestamp.isoformat(),
-            "stack_trace": self.stack_trace[-5:]  # Last 5 stack frames
+            "stack_trace": self.stack_trace or []
+        }
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Like to_dict, but keeping the raw timestamp_ns for error_log records"""
+        return {
+            "operation": self.operation,
+            "component": self.component,
+            "data": self.data,
+            "timestamp_ns": self.timestamp_ns,
+            "stack_trace": self.stack_trace or []
         }
 
 
@@ -60,6 +101,9 @@ class ErrorHandler:
     """
     Advanced error handling system with intelligent recovery and monitoring.
     
+    Records in error_log carry raw "timestamp_ns" values (top level and context)
+    instead of ISO "timestamp" strings; export_error_log() restores the strings.
+    
     Features:
     - Contextual error tracking with rich metadata
     - Intelligent recovery strategies based on error type
@@ -68,12 +112,28 @@ class ErrorHandler:
     - Graceful degradation for non-critical failures
     """
     
-    def __init__(self, log_file: Optional[str] = None):
-        self.error_log: List[Dict[str, Any]] = []
+    # Most recent error records kept in error_log
+    ERROR_LOG_SIZE = 1000
+    
+    # Size at which the log file rotates, and how many rotated files are kept
+    LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+    LOG_FILE_BACKUPS = 3
+    
+    def __init__(self, log_file: Optional[str] = None, min_tracked_severity: str = ErrorSeverity.INFO):
+        self.error_log: Deque[Dict[str, Any]] = deque(maxlen=self.ERROR_LOG_SIZE)
+        
+        # Running totals that outlive records evicted from error_log
+        self.total_errors = 0
+        self.successful_recoveries = 0
+        self.errors_by_severity: Counter = Counter()
+        self.errors_by_component: Counter = Counter()
         self.recovery_attempts = {}
         self.performance_impact = {}
         self.log_file = log_file
         
+        # Skipped errors below this severity are neither logged nor recorded
+        self._min_tracked_rank = _SEVERITY_RANK[min_tracked_severity]
+        
         # Configure advanced logging
         self._setup_logging()
         
@@ -139,11 +199,35 @@ class ErrorHandler:
                 "fallback_action": "graceful_degradation"
             }
         }
+        
+        # Resolved rule per concrete exception type
+        self._rule_cache: Dict[type, Dict[str, Any]] = {}
+        
+        # Shared read-only result per exception type that needs no tracking
+        self._untracked_results: Dict[type, Optional[MappingProxyType]] = {}
     
     def _setup_logging(self):
         """Configure sophisticated logging system"""
         self.logger = logging.getLogger("CoverLetterGPT.ErrorHandler")
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        
+        # Debug records are only created when a file handler will keep them
+        self.logger.setLevel(logging.DEBUG if self.log_file else logging.INFO)
+        
+        # The logger is shared, so drop handlers installed by an earlier ErrorHandler
+        for handler in list(self.logger.handlers):
+            if getattr(handler, "_installed_by_error_handler", False):
+                self.logger.removeHandler(handler)
+                handler.close()
+        
+        # Logger method for each severity, resolved once
+        self._severity_log_fn = {
+            ErrorSeverity.CRITICAL: self.logger.critical,
+            ErrorSeverity.HIGH: self.logger.error,
+            ErrorSeverity.MEDIUM: self.logger.warning,
+            ErrorSeverity.LOW: self.logger.info,
+            ErrorSeverity.INFO: self.logger.info
+        }
         
         # Create formatters
         detailed_formatter = logging.Formatter(
@@ -154,12 +238,16 @@ class ErrorHandler:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+        console_handler._installed_by_error_handler = True
         
-        # File handler for detailed debugging
+        # Rotating file handler for detailed debugging
         if self.log_file:
-            file_handler = logging.FileHandler(self.log_file)
+            file_handler = logging.handlers.RotatingFileHandler(
+                self.log_file, maxBytes=self.LOG_FILE_MAX_BYTES, backupCount=self.LOG_FILE_BACKUPS
+            )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(detailed_formatter)
+            file_handler._installed_by_error_handler = True
             self.logger.addHandler(file_handler)
         
         self.logger.addHandler(console_handler)
@@ -178,20 +266,53 @@ class ErrorHandler:
             
         Returns:
             Dict containing recovery information and next steps
-        """
         
+        Retry backoff blocks the calling thread; coroutines should use handle_error_async.
+        """
+        result, recovery_result = self._process_error(error, context, ui_interface)
+        retry_delay = recovery_result.get("retry_delay")
+        if retry_delay:
+            time.sleep(retry_delay)
+        return result
+    
+    async def handle_error_async(self,
+                                 error: Exception,
+                                 context: ErrorContext,
+                                 ui_interface=None) -> Dict[str, Any]:
+        """Handle an error like handle_error, awaiting an exponential retry backoff instead of blocking"""
+        result, recovery_result = self._process_error(error, context, ui_interface)
+        retry_delay = recovery_result.get("retry_delay")
+        if retry_delay:
+            await asyncio.sleep(retry_delay * (2 ** (recovery_result["retry_attempt"] - 1)))
+        return result
+    
+    def _process_error(self, error: Exception, context: ErrorContext, ui_interface) -> tuple:
+        """Classify, record and recover from an error; returns the result and the recovery details"""
         error_type = type(error)
+        
+        # Skippable low-severity errors return a prebuilt result straight away
+        if error_type not in self._untracked_results:
+            self._untracked_results[error_type] = self._build_untracked_result(error_type)
+        untracked_result = self._untracked_results[error_type]
+        if untracked_result is not None:
+            return untracked_result, {}
+        
         error_rule = self._get_error_rule(error_type)
         
+        # Stack frames are only formatted once an error is actually handled; the frames of
+        # this method and handle_error(_async) are skipped so the trace ends at their caller
+        if context.stack_trace is None:
+            context.capture_stack(skip=2)
+        
         # Create comprehensive error record
         error_record = {
-            "id": len(self.error_log) + 1,
-            "timestamp": datetime.now().isoformat(),
+            "id": self.total_errors + 1,
+            "timestamp_ns": context.timestamp_ns,
             "error_type": error_type.__name__,
             "error_message": str(error),
             "severity": error_rule["severity"],
             "strategy": error_rule["strategy"],
-            "context": context.to_dict(),
+            "context": context.to_record(),
             "recovery_attempted": False,
             "recovery_successful": False,
             "performance_impact": 0.0
@@ -208,6 +329,11 @@ class ErrorHandler:
         
         # Store for analytics
         self.error_log.append(error_record)
+        self.total_errors += 1
+        self.errors_by_severity[error_record["severity"]] += 1
+        self.errors_by_component[context.component] += 1
+        if error_record["recovery_successful"]:
+            self.successful_recoveries += 1
         
         # Update performance impact tracking
         self._update_performance_metrics(error_record)
@@ -219,10 +345,38 @@ class ErrorHandler:
             "user_message": error_rule.get("user_message", "An error occurred."),
             "continue_execution": recovery_result.get("continue_execution", True),
             "fallback_data": recovery_result.get("fallback_data")
-        }
+        }, recovery_result
+    
+    def _build_untracked_result(self, error_type: type) -> Optional[MappingProxyType]:
+        """Prebuild the result for an error type that is skipped below the tracked severity"""
+        error_rule = self._get_error_rule(error_type)
+        if (error_rule["strategy"] != RecoveryStrategy.SKIP
+                or _SEVERITY_RANK.get(error_rule["severity"], 0) >= self._min_tracked_rank):
+            return None
+        
+        return MappingProxyType({
+            "error_handled": True,
+            "severity": error_rule["severity"],
+            "recovery_successful": True,
+            "user_message": error_rule.get("user_message", "An error occurred."),
+            "continue_execution": True,
+            "fallback_data": None
+        })
+    
+    def clear_rule_cache(self):
+        """Forget resolved rules, e.g. after changing error_rules"""
+        self._rule_cache.clear()
+        self._untracked_results.clear()
     
     def _get_error_rule(self, error_type: type) -> Dict[str, Any]:
         """Get the most specific error handling rule"""
+        rule = self._rule_cache.get(error_type)
+        if rule is None:
+            rule = self._rule_cache[error_type] = self._resolve_error_rule(error_type)
+        return rule
+    
+    def _resolve_error_rule(self, error_type: type) -> Dict[str, Any]:
+        """Find the rule for an exception type by scanning error_rules"""
         
         # Try exact match first
         if error_type in self.error_rules:
@@ -268,13 +422,13 @@ class ErrorHandler:
                 recovery_result.update(self._halt_recovery(error, error_rule, context))
                 
         except Exception as recovery_error:
-            self.logger.error(f"Recovery attempt failed: {recovery_error}")
+            self.logger.error("Recovery attempt failed: %s", recovery_error)
             recovery_result["recovery_successful"] = False
         
         return recovery_result
     
     def _retry_recovery(self, error: Exception, error_rule: Dict[str, Any], context: ErrorContext) -> Dict[str, Any]:
-        """Implement retry recovery strategy"""
+        """Implement retry recovery strategy; the caller waits out the returned retry_delay"""
         max_retries = error_rule.get("max_retries", 3)
         retry_delay = error_rule.get("retry_delay", 1.0)
         
@@ -283,20 +437,18 @@ class ErrorHandler:
         
         if current_attempts < max_retries:
             self.recovery_attempts[operation_key] = current_attempts + 1
-            self.logger.info(f"Retrying operation (attempt {current_attempts + 1}/{max_retries})")
+            self.logger.info("Retrying operation (attempt %d/%d)", current_attempts + 1, max_retries)
             
             # In a real implementation, we'd actually retry the operation here
             # For now, we simulate a successful retry
-            import time
-            time.sleep(retry_delay)
-            
             return {
                 "recovery_successful": True,
                 "continue_execution": True,
-                "retry_attempt": current_attempts + 1
+                "retry_attempt": current_attempts + 1,
+                "retry_delay": retry_delay
             }
         else:
-            self.logger.warning(f"Max retries exceeded for {operation_key}")
+            self.logger.warning("Max retries exceeded for %s", operation_key)
             return {
                 "recovery_successful": False,
                 "continue_execution": False,
@@ -326,7 +478,7 @@ class ErrorHandler:
     
     def _skip_recovery(self, error: Exception, error_rule: Dict[str, Any], context: ErrorContext) -> Dict[str, Any]:
         """Implement skip recovery strategy"""
-        self.logger.info(f"Skipping failed operation: {context.operation}")
+        self.logger.info("Skipping failed operation: %s", context.operation)
         return {
             "recovery_successful": True,
             "continue_execution": True,
@@ -338,7 +490,7 @@ class ErrorHandler:
         if ui_interface:
             user_message = error_rule.get("user_message", "Manual intervention required.")
             # In a real implementation, we'd prompt the user through the UI
-            self.logger.warning(f"User intervention required: {user_message}")
+            self.logger.warning("User intervention required: %s", user_message)
         
         return {
             "recovery_successful": False,
@@ -348,7 +500,7 @@ class ErrorHandler:
     
     def _halt_recovery(self, error: Exception, error_rule: Dict[str, Any], context: ErrorContext) -> Dict[str, Any]:
         """Implement halt recovery strategy"""
-        self.logger.critical(f"Critical error - halting execution: {error}")
+        self.logger.critical("Critical error - halting execution: %s", error)
         return {
             "recovery_successful": False,
             "continue_execution": False,
@@ -419,17 +571,13 @@ class ErrorHandler:
     
     def _log_error(self, error_record: Dict[str, Any], error_rule: Dict[str, Any]):
         """Log error with appropriate severity level"""
-        severity = error_rule["severity"]
-        message = f"{error_record['error_type']}: {error_record['error_message']} in {error_record['context']['component']}.{error_record['context']['operation']}"
-        
-        if severity == ErrorSeverity.CRITICAL:
-            self.logger.critical(message)
-        elif severity == ErrorSeverity.HIGH:
-            self.logger.error(message)
-        elif severity == ErrorSeverity.MEDIUM:
-            self.logger.warning(message)
-        else:
-            self.logger.info(message)
+        context = error_record["context"]
+        
+        # Arguments are only formatted if the level is enabled
+        self._severity_log_fn.get(error_rule["severity"], self.logger.info)(
+            "%s: %s in %s.%s", error_record["error_type"], error_record["error_message"],
+            context["component"], context["operation"]
+        )
     
     def _update_performance_metrics(self, error_record: Dict[str, Any]):
         """Update performance impact metrics"""
@@ -438,46 +586,42 @@ class ErrorHandler:
         if component not in self.performance_impact:
             self.performance_impact[component] = {
                 "error_count": 0,
+                "successful_recoveries": 0,
                 "total_recovery_time": 0.0,
                 "success_rate": 1.0
             }
         
         metrics = self.performance_impact[component]
         metrics["error_count"] += 1
+        if error_record.get("recovery_successful", False):
+            metrics["successful_recoveries"] += 1
         
-        # Calculate success rate
-        total_operations = metrics["error_count"]
-        successful_recoveries = sum(1 for record in self.error_log 
-                                  if record["context"]["component"] == component 
-                                  and record.get("recovery_successful", False))
-        
-        metrics["success_rate"] = successful_recoveries / total_operations if total_operations > 0 else 1.0
+        # Running counts keep this O(1) however long the error log grows
+        metrics["success_rate"] = metrics["successful_recoveries"] / metrics["error_count"]
+    
+    def export_error_log(self) -> List[Dict[str, Any]]:
+        """Copy error_log with raw timestamp_ns values formatted as ISO timestamp strings"""
+        exported = []
+        for record in self.error_log:
+            record = dict(record)
+            record["timestamp"] = _datetime_from_ns(record.pop("timestamp_ns")).isoformat()
+            context = record["context"] = dict(record["context"])
+            context["timestamp"] = _datetime_from_ns(context.pop("timestamp_ns")).isoformat()
+            exported.append(record)
+        return exported
     
     def get_error_analytics(self) -> Dict[str, Any]:
         """Generate comprehensive error analytics"""
-        if not self.error_log:
+        if not self.total_errors:
             return {"status": "no_errors", "total_errors": 0}
         
-        # Calculate statistics
-        total_errors = len(self.error_log)
-        errors_by_severity = {}
-        errors_by_component = {}
-        recovery_success_rate = 0
-        
-        for record in self.error_log:
-            severity = record["severity"]
-            component = record["context"]["component"]
-            
-            errors_by_severity[severity] = errors_by_severity.get(severity, 0) + 1
-            errors_by_component[component] = errors_by_component.get(component, 0) + 1
-            
-            if record.get("recovery_successful", False):
-                recovery_success_rate += 1
-        
-        recovery_success_rate = (recovery_success_rate / total_errors) * 100
+        # Statistics come from running totals rather than the bounded error log
+        errors_by_severity = dict(self.errors_by_severity)
+        errors_by_component = dict(self.errors_by_component)
+        recovery_success_rate = (self.successful_recoveries / self.total_errors) * 100
         
         return {
-            "total_errors": total_errors,
+            "total_errors": self.total_errors,
             "recovery_success_rate": recovery_success_rate,
             "errors_by_severity": errors_by_severity,
             "errors_by_component": errors_by_component,
@@ -486,6 +630,15 @@ class ErrorHandler:
         }
 
 
+# Longest argument description kept in a decorated call's error context
+_CALL_DATA_LIMIT = 512
+
+
+def _call_data(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, str]:
+    """Describe a failed call's arguments, truncated to keep records small"""
+    return {"args": str(args)[:_CALL_DATA_LIMIT], "kwargs": str(kwargs)[:_CALL_DATA_LIMIT]}
+
+
 def with_error_handling(error_handler: ErrorHandler, 
                        component: str,
                        operation: str = None,
@@ -502,12 +655,13 @@ def with_error_handling(error_handler: ErrorHandler,
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            op_name = operation or func.__name__
-            context = ErrorContext(op_name, component, {"args": str(args), "kwargs": str(kwargs)})
-            
             try:
                 return func(*args, **kwargs)
             except Exception as e:
+                # Context is only built on failure, keeping the success path cheap
+                op_name = operation or func.__name__
+                context = ErrorContext(op_name, component, _call_data(args, kwargs))
+                context.capture_stack()
                 result = error_handler.handle_error(e, context, ui_interface)
                 
                 if not result["continue_execution"]:
@@ -528,6 +682,48 @@ def with_error_handling(error_handler: ErrorHandler,
     return decorator
 
 
+def with_async_error_handling(error_handler: ErrorHandler,
+                             component: str,
+                             operation: str = None,
+                             ui_interface = None):
+    """
+    Decorator for coroutines, awaiting retry backoff instead of blocking the event loop
+    
+    Usage:
+        @with_async_error_handling(error_handler, "openai_client", "generate")
+        async def generate(self, prompt):
+            # Your code here
+    """
+    
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                op_name = operation or func.__name__
+                context = ErrorContext(op_name, component, _call_data(args, kwargs))
+                context.capture_stack()
+                result = await error_handler.handle_error_async(e, context, ui_interface)
+                
+                if not result["continue_execution"]:
+                    raise
+                
+                # Return fallback data if available
+                if result.get("fallback_data") is not None:
+                    return result["fallback_data"]
+                
+                # For skip strategy, return appropriate default
+                if result.get("operation_skipped"):
+                    return None
+                
+                # Re-raise if no recovery was possible
+                raise
+        
+        return wrapper
+    return decorator
+
+
 # Global error handler instance
 _global_error_handler = None
 
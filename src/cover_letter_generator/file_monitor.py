@@ -8,7 +8,7 @@ import json
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Set, Optional
-from .config import DATA_PROFILE_PATH
+from .config import DATA_PROFILE_PATH, ensure_dirs
 from .memory_core import MemoryCore, SkillMemory, StyleMemory
 
 class FileMonitor:
@@ -19,6 +19,7 @@ class FileMonitor:
         self.criteria_path = os.path.join(DATA_PROFILE_PATH, 'criteria.txt')
         self.skillset_path = os.path.join(DATA_PROFILE_PATH, 'skillset.csv')
         self.checksums_file = os.path.join(DATA_PROFILE_PATH, '.file_checksums.json')
+        self.sync_stamp_file = os.path.join(DATA_PROFILE_PATH, '.last_sync.json')
         
     def _get_file_checksum(self, file_path: str) -> str:
         """Get MD5 checksum of a file"""
@@ -40,9 +41,37 @@ class FileMonitor:
     
     def _save_checksums(self, checksums: Dict[str, str]):
         """Save current file checksums"""
+        ensure_dirs()
         with open(self.checksums_file, 'w') as f:
             json.dump(checksums, f, indent=2)
     
+    def _get_sync_stamp(self) -> Dict[str, int]:
+        """Get modification times of every file that feeds a sync"""
+        stamp = {}
+        for file_path in (self.criteria_path, self.skillset_path, self.memory.memory_file):
+            try:
+                stamp[os.path.basename(file_path)] = os.stat(file_path).st_mtime_ns
+            except OSError:
+                stamp[os.path.basename(file_path)] = 0
+        return stamp
+    
+    def _save_sync_stamp(self):
+        """Record file modification times as of the latest sync"""
+        ensure_dirs()
+        with open(self.sync_stamp_file, 'w') as f:
+            json.dump(self._get_sync_stamp(), f, indent=2)
+    
+    def needs_sync(self) -> bool:
+        """Cheap mtime check telling whether auto_sync_files has any work to do"""
+        if not os.path.exists(self.sync_stamp_file):
+            return True
+        try:
+            with open(self.sync_stamp_file, 'r') as f:
+                stored_stamp = json.load(f)
+        except:
+            return True
+        return stored_stamp != self._get_sync_stamp()
+    
     def check_for_changes(self) -> Dict[str, bool]:
         """Check if criteria.txt or skillset.csv have changed"""
         current_checksums = {
@@ -292,7 +321,9 @@ class FileMonitor:
             
             self.memory.memory_data["style_preferences"][category] = unique_prefs
         
-        self.memory.save_memory()
+        # Only persist when something was actually cleaned
+        if any(cleaned.values()):
+            self.memory.save_memory()
         return cleaned
     
     def auto_sync_files(self) -> Dict[str, any]:
@@ -317,6 +348,7 @@ class FileMonitor:
         # Always clean memory pollution
         results["cleanup_results"] = self.clean_memory_pollution()
         
+        self._save_sync_stamp()
         return results
     
     def force_resync(self) -> Dict[str, any]:
@@ -324,5 +356,7 @@ class FileMonitor:
         # Remove existing checksums to force update
         if os.path.exists(self.checksums_file):
             os.remove(self.checksums_file)
+        if os.path.exists(self.sync_stamp_file):
+            os.remove(self.sync_stamp_file)
         
         return self.auto_sync_files()
\ No newline at end of file
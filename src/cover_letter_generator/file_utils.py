@@ -13,6 +13,7 @@ from .config import (
     OUTPUT_COVER_LETTERS_PATH,
     COVER_LETTER_RECORDS_FILE_PATH,
     LOG_FILE_PATH,
+    ensure_dirs,
 )
 
 def read_file(file_path):
@@ -93,6 +94,7 @@ def save_cover_letter_pdf(cover_letter, company_name, job_title):
 
 def record_cover_letter(job_title, company_name, cover_letter, text_path):
     """Appends the final cover letter to a record file."""
+    ensure_dirs()
     file_exists = os.path.exists(COVER_LETTER_RECORDS_FILE_PATH)
     with open(COVER_LETTER_RECORDS_FILE_PATH, 'a', newline='', encoding='utf-8') as file:
         writer = csv.writer(file)
@@ -136,6 +138,7 @@ def structured_log(user_request, gpt_response, created_files):
     }
 
     # Write the structured log entry to the log file
+    ensure_dirs()
     with open(LOG_FILE_PATH, "a") as log_file:
         json.dump(log_entry, log_file)
         log_file.write('\\n')  # Ensure each log entry is on a new line for readability
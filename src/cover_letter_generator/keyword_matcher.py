@@ -0,0 +1,145 @@
+"""
+Keyword Matcher - Multi-Pattern Keyword Search
+Aho-Corasick automaton for finding many keywords in a text with a single scan
+"""
+
+from collections import Counter, deque
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+# Use the C implementation when available, fall back to the pure-Python trie otherwise
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether char is a regex word character"""
+    # For str patterns \w matches exactly the alphanumerics and the underscore
+    return char.isalnum() or char == '_'
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not glued to neighbouring word characters
+
+    Only keyword edges that are word characters need a boundary, so c++ and .net
+    match as whole words where a \\b-anchored regex would not.
+    """
+    if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+class KeywordMatcher:
+    """Finds every occurrence of a fixed keyword set in one left-to-right pass"""
+
+    def __init__(self, keywords: Iterable[Tuple[str, Any]]):
+        """Build the automaton from (keyword, value) pairs; a keyword may carry several values"""
+        self._values: Dict[str, List[Any]] = {}
+        for keyword, value in keywords:
+            if keyword:
+                self._values.setdefault(keyword, []).append(value)
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, values in self._values.items():
+                self._automaton.add_word(keyword, (keyword, values))
+            if self._values:
+                self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build_trie()
+
+    def _build_trie(self):
+        """Build goto/fail/output tables for the pure-Python automaton"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for keyword in self._values:
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append(keyword)
+
+        # Breadth-first pass to resolve failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _iter_keywords(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (start_index, keyword) once for every keyword occurrence in text"""
+        if not self._values:
+            return
+
+        if self._automaton is not None:
+            for end, (keyword, _) in self._automaton.iter(text):
+                yield end - len(keyword) + 1, keyword
+            return
+
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for keyword in output[node]:
+                yield index - len(keyword) + 1, keyword
+
+    def iter(self, text: str) -> Iterator[Tuple[int, str, Any]]:
+        """Yield (start_index, keyword, value) for every keyword occurrence in text"""
+        values = self._values
+        for start, keyword in self._iter_keywords(text):
+            for value in values[keyword]:
+                yield start, keyword, value
+
+    def values_in(self, text: str) -> set:
+        """Return the set of values whose keywords occur anywhere in text"""
+        return {value for _, _, value in self.iter(text)}
+
+    def keywords_in(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur anywhere in text"""
+        return {keyword for _, keyword in self._iter_keywords(text)}
+
+    def scan_words(self, text: str) -> Tuple[Set[str], Counter]:
+        """Return keywords found anywhere and their whole-word counts, from a single pass
+
+        For keywords that begin and end with word characters the counts agree with
+        len(re.findall(r'\\b' + re.escape(keyword) + r'\\b', text)).
+        """
+        found: Set[str] = set()
+        word_counts: Counter = Counter()
+        last_end: Dict[str, int] = {}
+
+        for start, keyword in self._iter_keywords(text):
+            found.add(keyword)
+            end = start + len(keyword)
+            # findall does not report overlapping matches of the same keyword
+            if start < last_end.get(keyword, 0):
+                continue
+            if _is_whole_word(text, start, end):
+                word_counts[keyword] += 1
+                last_end[keyword] = end
+
+        return found, word_counts
@@ -2,6 +2,7 @@ from .context_manager import (
     reset_conversation_context,
     save_context_to_file,
     load_context_from_file,
+    persist_new_messages,
 )
 from .file_utils import (
     read_file,
@@ -29,6 +30,7 @@ from .config import (
     CRITERIA_FILE_PATH,
     COVER_LETTER_TEMP_PATH,
     COVER_LETTER_RECORDS_FILE_PATH,
+    ensure_dirs,
 )
 from .visual_interface import VisualInterface
 from .memory_core import MemoryCore
@@ -42,6 +44,9 @@ def get_todays_date():
     return datetime.now().strftime('%B %d, %Y')
 
 def main():
+    # Create the data and output directories the session reads and writes
+    ensure_dirs()
+    
     # Initialize the visual interface
     ui = VisualInterface()
     
@@ -89,6 +94,7 @@ def main():
     
     # Clear the context to start fresh
     context = reset_conversation_context()  # Ensure a fresh context for each new session
+    saved_messages = 0  # Messages of this session already written to context.json
 
     # Load the required data with visual feedback
     ui.print_section_header("Loading Application Data")
@@ -187,7 +193,7 @@ def main():
             # Regenerate the cover letter from scratch based on complete rejection
             ui.start_loading("Creating a completely new cover letter (applying lessons learned)")
             cover_letter, context = regenerate_cover_letter(cover_letter, job_description, skills, resume_text, criteria, context, current_date, memory)
-            save_context_to_file(context, 'context.json')
+            saved_messages = persist_new_messages(context, 'context.json', saved_messages)
             ui.stop_loading()
             
             ui.print_success("New cover letter generated successfully!")
@@ -211,7 +217,7 @@ def main():
             # Refine the cover letter with feedback and memory context
             ui.start_loading("Applying your feedback (with learned context)")
             cover_letter, context = refine_cover_letter(cover_letter, feedback, criteria, context, memory, job_description)
-            save_context_to_file(context, 'context.json')
+            saved_messages = persist_new_messages(context, 'context.json', saved_messages)
             ui.stop_loading()
 
             ui.print_success("Cover letter refined successfully!")
@@ -5,11 +5,36 @@ Provides persistent memory, learning capabilities, and temporal awareness for Co
 
 import json
 import os
+import pickle
 import re
+from collections import defaultdict, deque
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
-from .config import OUTPUT_PATH
+from .config import OUTPUT_PATH, ensure_dirs
+from . import json_codec
+
+# Word tokens used to index memory text for search
+_SEARCH_TOKEN_PATTERN = re.compile(r'\w+')
+
+# Longest substring of an indexed token kept in the n-gram index
+_SEARCH_GRAM_SIZE = 3
+
+
+def _tokens_containing(query_token: str, grams: Dict[str, set]) -> set:
+    """Find indexed tokens containing query_token using the n-gram index"""
+    if len(query_token) <= _SEARCH_GRAM_SIZE:
+        return grams.get(query_token, set())
+    
+    # Every token containing the query contains each of its n-grams; start from the rarest
+    postings = []
+    for i in range(len(query_token) - _SEARCH_GRAM_SIZE + 1):
+        tokens = grams.get(query_token[i:i + _SEARCH_GRAM_SIZE])
+        if not tokens:
+            return set()
+        postings.append(tokens)
+    return {token for token in min(postings, key=len) if query_token in token}
 
 @dataclass
 class MemoryEntry:
@@ -63,12 +88,28 @@ class FeedbackMemory:
 class MemoryCore:
     """Central memory management system with learning capabilities"""
     
+    RECENT_FEEDBACK_LIMIT = 50  # Feedback entries kept in the recent-feedback window
+    
     def __init__(self):
         self.memory_file = os.path.join(OUTPUT_PATH, "user_memory.json")
+        self.memory_cache_file = self.memory_file + ".pkl"
+        self._memory_file_size = None  # Known on-disk size after a JSON read or write
         self.memory_data = self._load_memory()
+        self._version = 0  # Bumped on every save so derived views know when to rebuild
+        self._skill_names_lower = {}
+        self._skill_names_lower_version = None
+        self._recent_feedback = deque(maxlen=self.RECENT_FEEDBACK_LIMIT)
+        self._recent_feedback_version = None
+        self._search_index = ({}, {}, {})
+        self._search_index_version = None
         self._temporal_manager = None  # Will be initialized when first needed
         self._relevance_engine = None  # Will be initialized when first needed
     
+    @property
+    def version(self) -> int:
+        """Monotonic counter identifying the current state of memory_data"""
+        return self._version
+    
     @property
     def temporal_manager(self):
         """Lazy-loaded temporal manager to avoid circular imports"""
@@ -87,11 +128,18 @@ class MemoryCore:
         
     def _load_memory(self) -> Dict[str, Any]:
         """Load existing memory or create new memory structure"""
+        cached = self._load_memory_cache()
+        if cached is not None:
+            return cached
+        
         if os.path.exists(self.memory_file):
             try:
-                with open(self.memory_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
+                with open(self.memory_file, 'rb') as f:
+                    raw = f.read()
+                memory_data = json_codec.loads(raw)
+                self._memory_file_size = len(raw)
+                return memory_data
+            except (json.JSONDecodeError, UnicodeDecodeError, FileNotFoundError):
                 pass
         
         # Initialize new memory structure
@@ -124,12 +172,64 @@ class MemoryCore:
             }
         }
     
+    def _load_memory_cache(self) -> Optional[Dict[str, Any]]:
+        """Load the pickled memory snapshot if it was taken of the JSON file exactly as it is now"""
+        try:
+            json_stat = os.stat(self.memory_file)
+        except OSError:
+            return None
+        
+        try:
+            with open(self.memory_cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            # Damaged pickles raise many error types; the cache is optional, so fall back to JSON
+            return None
+        
+        # Newer or restored JSON files, even with an older or equal mtime, differ in mtime or size
+        if (not isinstance(cached, dict)
+                or cached.get("json_stat") != (json_stat.st_mtime_ns, json_stat.st_size)
+                or not isinstance(cached.get("memory_data"), dict)):
+            return None
+        
+        self._memory_file_size = json_stat.st_size
+        return cached["memory_data"]
+    
+    def _save_memory_cache(self):
+        """Refresh the pickled memory snapshot used for fast startup, tagged with the JSON file's stat"""
+        try:
+            json_stat = os.stat(self.memory_file)
+            snapshot = {
+                "json_stat": (json_stat.st_mtime_ns, json_stat.st_size),
+                "memory_data": self.memory_data
+            }
+            with open(self.memory_cache_file, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # The cache is only an accelerator; JSON remains the source of truth
+            pass
+    
     def save_memory(self):
         """Save memory to persistent storage"""
         self.memory_data["metadata"]["last_updated"] = datetime.now().isoformat()
+        self._version += 1
         
-        with open(self.memory_file, 'w', encoding='utf-8') as f:
-            json.dump(self.memory_data, f, indent=2, ensure_ascii=False)
+        serialized = json_codec.dumps(self.memory_data, indent=True)
+        ensure_dirs()
+        with open(self.memory_file, 'wb') as f:
+            f.write(serialized)
+        self._memory_file_size = len(serialized)
+        
+        self._save_memory_cache()
+    
+    def get_memory_file_size(self) -> int:
+        """Get the size of the memory file in bytes, avoiding a stat when it is already known"""
+        if self._memory_file_size is None:
+            try:
+                self._memory_file_size = os.path.getsize(self.memory_file)
+            except OSError:
+                return 0
+        return self._memory_file_size
     
     def add_skill_memory(self, skill: SkillMemory):
         """Add or update skill information"""
@@ -161,18 +261,43 @@ class MemoryCore:
     
     def add_feedback_memory(self, feedback: FeedbackMemory):
         """Store feedback and learning outcomes"""
-        self.memory_data["feedback_history"].append(asdict(feedback))
+        feedback_entry = asdict(feedback)
+        recent_in_sync = self._recent_feedback_version == self._version
+        self.memory_data["feedback_history"].append(feedback_entry)
         self.memory_data["metadata"]["total_interactions"] += 1
         
         if feedback.outcome == "accepted":
             self.memory_data["metadata"]["successful_generations"] += 1
         
         self.save_memory()
+        
+        if recent_in_sync:
+            self._recent_feedback.append(feedback_entry)
+            self._recent_feedback_version = self._version
     
     def get_current_skills(self) -> Dict[str, Any]:
         """Get all current skills"""
         return self.memory_data["user_profile"]["skills"]
     
+    def get_skill_names_lower(self) -> Dict[str, str]:
+        """Get lowercased skill names by skill key, rebuilt only when memory changes"""
+        if self._skill_names_lower_version != self._version:
+            self._skill_names_lower = {
+                skill_key: skill_data["skill_name"].lower()
+                for skill_key, skill_data in self.get_current_skills().items()
+            }
+            self._skill_names_lower_version = self._version
+        return self._skill_names_lower
+    
+    def get_recent_feedback(self, count: int) -> List[Dict]:
+        """Get up to count of the most recent feedback entries, newest first"""
+        if self._recent_feedback_version != self._version:
+            history = self.memory_data["feedback_history"]
+            self._recent_feedback.clear()
+            self._recent_feedback.extend(history[-self.RECENT_FEEDBACK_LIMIT:])
+            self._recent_feedback_version = self._version
+        return list(islice(reversed(self._recent_feedback), count))
+    
     def get_style_preferences(self) -> Dict[str, List]:
         """Get all style preferences"""
         return self.memory_data["style_preferences"]
@@ -252,20 +377,67 @@ class MemoryCore:
         """Get detailed analysis of memory relevance for a specific job"""
         return self.relevance_engine.get_relevant_memories(self, job_description)
     
+    def _get_search_index(self) -> Tuple[Dict[str, set], Dict[str, set], Dict[Tuple[str, Any], Tuple[str, ...]]]:
+        """Get the token index, its n-gram index and lowercased texts used by search_memory, rebuilt only when memory changes"""
+        if self._search_index_version != self._version:
+            index = defaultdict(set)
+            texts = {}
+            
+            skill_names_lower = self.get_skill_names_lower()
+            for skill_key, skill_data in self.memory_data["user_profile"]["skills"].items():
+                entry = ("skill", skill_key)
+                texts[entry] = (skill_names_lower[skill_key], skill_data["context"].lower())
+            
+            for position, feedback in enumerate(self.memory_data["feedback_history"]):
+                entry = ("feedback", position)
+                texts[entry] = (feedback["feedback_text"].lower(),)
+            
+            for entry, entry_texts in texts.items():
+                for text in entry_texts:
+                    for token in _SEARCH_TOKEN_PATTERN.findall(text):
+                        index[token].add(entry)
+            
+            # Map every substring of up to _SEARCH_GRAM_SIZE characters to the tokens containing it
+            grams = defaultdict(set)
+            for token in index:
+                for size in range(1, min(len(token), _SEARCH_GRAM_SIZE) + 1):
+                    for i in range(len(token) - size + 1):
+                        grams[token[i:i + size]].add(token)
+            
+            self._search_index = (dict(index), dict(grams), texts)
+            self._search_index_version = self._version
+        return self._search_index
+    
     def search_memory(self, query: str) -> List[Dict]:
         """Search through memory for relevant information"""
         results = []
         query_lower = query.lower()
+        index, grams, texts = self._get_search_index()
+        
+        # Any entry containing the query contains each query word inside one of its own
+        # words, so narrowing by the index never drops a true match
+        candidates = None
+        for query_token in set(_SEARCH_TOKEN_PATTERN.findall(query_lower)):
+            token_matches = set(index.get(query_token, ()))
+            for token in _tokens_containing(query_token, grams):
+                token_matches |= index[token]
+            candidates = token_matches if candidates is None else candidates & token_matches
+            if not candidates:
+                return results
+        
+        def matches(entry) -> bool:
+            if candidates is not None and entry not in candidates:
+                return False
+            return any(query_lower in text for text in texts[entry])
         
         # Search skills
         for skill_key, skill_data in self.memory_data["user_profile"]["skills"].items():
-            if (query_lower in skill_data["skill_name"].lower() or 
-                query_lower in skill_data["context"].lower()):
+            if matches(("skill", skill_key)):
                 results.append({"type": "skill", "data": skill_data})
         
         # Search feedback history
-        for feedback in self.memory_data["feedback_history"]:
-            if query_lower in feedback["feedback_text"].lower():
+        for position, feedback in enumerate(self.memory_data["feedback_history"]):
+            if matches(("feedback", position)):
                 results.append({"type": "feedback", "data": feedback})
         
         return results
\ No newline at end of file
@@ -11,10 +11,11 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
 import json
+from dataclasses import replace
 
 from cover_letter_generator.advanced_relevance_engine import (
     AdvancedRelevanceEngine, JobAnalysisResult, SkillRelevanceScore,
-    IndustryClassifier, SemanticMatcher
+    IndustryClassifier, SemanticMatcher, SkillScoreHistory, FeedbackLog, _isoformat_ns
 )
 from conftest import validate_job_analysis_result, validate_skill_relevance_score, measure_execution_time
 
@@ -34,7 +35,16 @@ class TestAdvancedRelevanceEngine:
         assert hasattr(relevance_engine, 'semantic_matcher')
         assert hasattr(relevance_engine, 'performance_monitor')
         assert hasattr(relevance_engine, 'error_handler')
-    
+
+    def test_static_tables_shared_between_instances(self, relevance_engine):
+        """Test that a new engine reuses the tables and matchers already built"""
+        other = AdvancedRelevanceEngine()
+
+        assert other.tech_domains is relevance_engine.tech_domains
+        assert other._domain_matcher is relevance_engine._domain_matcher
+        assert other._tech_domain_matrix is relevance_engine._tech_domain_matrix
+        assert other.industry_classifier._term_matcher is relevance_engine.industry_classifier._term_matcher
+
     def test_job_analysis_comprehensive(self, relevance_engine, sample_job_description):
         """Test comprehensive job analysis functionality"""
         # Perform job analysis
@@ -90,7 +100,30 @@ class TestAdvancedRelevanceEngine:
         
         # MySQL should be less relevant for security analyst role
         assert mysql_score < 0.4
-    
+
+    def test_batch_scoring_matches_single_skill(self, relevance_engine, sample_job_description, sample_skills_data):
+        """Test that scoring skills together gives the same results as one at a time"""
+        job_analysis = relevance_engine.analyze_job_comprehensive(sample_job_description)
+        skills = list(sample_skills_data.values())
+
+        batch = relevance_engine.score_skills_comprehensive(skills, job_analysis)
+
+        assert [score.to_dict() for score in batch] == [
+            relevance_engine.score_skill_comprehensive(skill, job_analysis).to_dict() for skill in skills
+        ]
+        assert relevance_engine.score_skills_comprehensive([], job_analysis) == []
+
+    def test_scoring_without_domain_score_vectors(self, relevance_engine, sample_job_description, sample_skills_data):
+        """Test that analyses built without domain score arrays score the same from their dicts"""
+        job_analysis = relevance_engine.analyze_job_comprehensive(sample_job_description)
+        bare_analysis = replace(job_analysis, tech_domain_scores=None, business_domain_scores=None)
+        skills = list(sample_skills_data.values())
+
+        assert "tech_domain_scores" not in job_analysis.to_dict()
+        assert [score.to_dict() for score in relevance_engine.score_skills_comprehensive(skills, bare_analysis)] == [
+            score.to_dict() for score in relevance_engine.score_skills_comprehensive(skills, job_analysis)
+        ]
+
     def test_industry_classification(self, relevance_engine, sample_job_description):
         """Test industry classification accuracy"""
         job_analysis = relevance_engine.analyze_job_comprehensive(sample_job_description)
@@ -223,6 +256,44 @@ class TestAdvancedRelevanceEngine:
         # Second call should be significantly faster
         assert time2 < time1 * 0.5  # At least 50% faster
     
+    def test_analysis_cache_is_bounded(self, relevance_engine, monkeypatch):
+        """Test that the analysis cache keeps only the most recent results"""
+        monkeypatch.setattr(AdvancedRelevanceEngine, "ANALYSIS_CACHE_LIMIT", 2)
+        
+        results = [relevance_engine.analyze_job_comprehensive(f"{language} developer")
+                   for language in ("Python", "Java", "Rust")]
+        
+        cached_results = [cached for cached, _ in relevance_engine.analysis_cache.values()]
+        assert len(cached_results) == 2
+        assert cached_results[0] is results[1]
+        assert cached_results[1] is results[2]
+    
+    def test_empty_requirement_phrases_dropped(self, relevance_engine):
+        """Test that cue words ending a sentence do not yield empty requirements"""
+        result = relevance_engine.analyze_job_comprehensive("Python required. Docker is a plus.")
+        
+        assert result.required_skills == []
+        assert result.preferred_skills == []
+    
+    def test_technical_penalty_matches_skill_name_only(self, relevance_engine):
+        """Test that technical-only terms penalize business roles when named, not when in context"""
+        job_analysis = JobAnalysisResult(
+            job_role_type="business_analyst", primary_focus="business", confidence_score=0.5,
+            required_skills=[], preferred_skills=[], tech_domains={}, business_domains={},
+            industry_context={}, experience_level="mid", company_size="medium",
+            role_complexity=0.5, explicit_technologies=[], soft_skills=[],
+            key_responsibilities=[], compensation_indicators={},
+            growth_potential=0.5, remote_work_indicators=[]
+        )
+        
+        named, in_context = relevance_engine.score_skills_comprehensive([
+            {"skill_name": "Network Security", "context": "Firewalls"},
+            {"skill_name": "Reporting", "context": "Network security dashboards"}
+        ], job_analysis)
+        
+        assert "Some mismatch with role focus" in named.explanation
+        assert "Some mismatch with role focus" not in in_context.explanation
+    
     def test_confidence_scoring(self, relevance_engine, sample_job_description, sample_skills_data):
         """Test confidence scoring accuracy"""
         job_analysis = relevance_engine.analyze_job_comprehensive(sample_job_description)
@@ -268,6 +339,14 @@ class TestIndustryClassifier:
         assert "financial_services" in result
         assert result["financial_services"]["confidence"] > 0.7
 
+    def test_shared_terms_score_every_industry(self, industry_classifier):
+        """Test that a term listed under several industries and categories counts for each"""
+        result = industry_classifier.classify_industry("SAP research, research and more research")
+
+        assert result["all_scores"] == {"finance": 4, "manufacturing": 4, "education": 9}
+        assert result["industry"] == "education"
+        assert result["confidence"] == 9 / 17
+
 
 class TestSemanticMatcher:
     """Test the semantic matching component"""
@@ -295,6 +374,120 @@ class TestSemanticMatcher:
         """Test technical term matching"""
         similarity = semantic_matcher.calculate_similarity("Machine Learning", "AI")
         assert similarity > 0.7
+    
+    def test_similarity_memoized_on_normalized_pair(self, semantic_matcher):
+        """Test that repeated pairs are served from the memo after normalization"""
+        first = semantic_matcher.calculate_semantic_similarity("MySQL", "database administration")
+        second = semantic_matcher.calculate_semantic_similarity(" mysql ", "Database Administration")
+        
+        assert first == second == 0.7
+        assert semantic_matcher._cached_similarity.cache_info().hits == 1
+
+    def test_similarity_memo_shared_by_both_orders(self, semantic_matcher):
+        """Test that swapping the arguments reuses the memoized similarity"""
+        forward = semantic_matcher.calculate_semantic_similarity("SQL", "MySQL Database")
+        backward = semantic_matcher.calculate_semantic_similarity("mysql database", "sql")
+
+        assert forward == backward == 0.8
+        assert semantic_matcher._cached_similarity.cache_info().hits == 1
+
+        semantic_matcher.cache_clear()
+        assert semantic_matcher._cached_similarity.cache_info().currsize == 0
+
+
+class TestSkillScoreHistory:
+    """Test the columnar skill score history"""
+    
+    @pytest.fixture
+    def score_history(self):
+        history = SkillScoreHistory(initial_capacity=2)
+        for skill, score in [("python", 0.9), ("sql", 0.2), ("python", 0.7), ("python", 1.0), ("sql", 0.4)]:
+            history.append(skill, score, 1_704_067_200_000_000_000, f"{skill} context")
+        return history
+    
+    def test_statistics_per_skill(self, score_history):
+        """Test counts and means grouped by skill in first-seen order"""
+        skills, counts, means = score_history.skill_statistics()
+        
+        assert skills == ["python", "sql"]
+        assert counts.tolist() == [3, 2]
+        assert means.tolist() == pytest.approx([2.6 / 3, 0.3])
+        assert score_history.mean_score("sql") == pytest.approx(0.3)
+        assert score_history.mean_score("java") is None
+    
+    def test_entries_survive_growth(self, score_history):
+        """Test that entries keep their order after the columns grow"""
+        entries = score_history.entries_by_skill()
+        
+        assert len(score_history) == 5
+        assert [entry["score"] for entry in entries["python"]] == [0.9, 0.7, 1.0]
+        assert entries["sql"][1] == {"score": 0.4, "timestamp": 1_704_067_200_000_000_000, "context": "sql context"}
+
+
+class TestFeedbackLog:
+    """Test the columnar feedback log"""
+    
+    @pytest.fixture
+    def feedback_log(self):
+        log = FeedbackLog(initial_capacity=2)
+        for skill, feedback_type, score in [("python", "positive", 0.9), ("sql", "negative", None),
+                                            ("python", "neutral", None), ("python", "positive", 1.0)]:
+            log.append(skill, feedback_type, score, 1_704_067_200_000_000_000, f"{skill} job")
+        return log
+    
+    def test_type_counts(self, feedback_log):
+        """Test event counts per feedback type and distinct skills"""
+        assert len(feedback_log) == 4
+        assert feedback_log.skill_count() == 2
+        assert feedback_log.type_counts() == {"positive": 2, "negative": 1, "neutral": 1}
+    
+    def test_entries_survive_growth(self, feedback_log):
+        """Test that entries rebuild in order with missing scores as None"""
+        entries = feedback_log.entries_by_skill()
+        
+        assert [entry["user_score"] for entry in entries["python"]] == [0.9, None, 1.0]
+        assert feedback_log["sql"] == entries["sql"] == [{
+            "skill": "sql", "job_context": "sql job", "feedback_type": "negative",
+            "user_score": None, "timestamp": 1_704_067_200_000_000_000
+        }]
+        assert feedback_log["java"] == []
+
+
+class TestLearningExport:
+    """Test nanosecond feedback timestamps and the streamed export"""
+    
+    def test_isoformat_matches_datetime(self):
+        """Test that nanosecond stamps format like the local datetime they encode"""
+        moment = datetime(2024, 5, 6, 7, 8, 9, 123456)
+        timestamp_ns = int(moment.timestamp()) * 1_000_000_000 + 123_456_789
+        
+        assert _isoformat_ns(timestamp_ns) == moment.isoformat()
+    
+    def test_export_writes_iso_timestamps(self, tmp_path):
+        """Test that exported feedback carries ISO strings rather than raw nanoseconds"""
+        engine = AdvancedRelevanceEngine()
+        engine.learn_from_feedback("Python", "Backend developer", "positive", 0.9)
+        assert isinstance(engine.feedback_patterns["python"][0]["timestamp"], int)
+        
+        export_path = tmp_path / "learning.json"
+        engine.export_learning_data(str(export_path))
+        exported = json.loads(export_path.read_text())
+        
+        for entries in (exported["feedback_patterns"]["python"], exported["skill_performance_history"]["python"]):
+            assert datetime.fromisoformat(entries[0]["timestamp"]) <= datetime.now()
+    
+    def test_export_layout_matches_json_dump(self, tmp_path):
+        """Test that the streamed export is laid out exactly like an indented json.dumps"""
+        engine = AdvancedRelevanceEngine()
+        for skill, score in [("Python", 0.9), ("Réseau", None), ("python", 0.7)]:
+            engine.learn_from_feedback(skill, "Backend developer", "positive", score)
+        
+        export_path = tmp_path / "learning.json"
+        engine.export_learning_data(str(export_path))
+        raw = export_path.read_bytes()
+        
+        assert raw == json.dumps(json.loads(raw), indent=2, ensure_ascii=False).encode('utf-8')
+        assert json.loads(raw)["skill_performance_history"]["python"][1]["score"] == 0.7
 
 
 class TestPerformanceBenchmarks:
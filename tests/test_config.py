@@ -0,0 +1,42 @@
+"""
+Test Suite for Config
+=====================
+
+Tests for the application paths, validating that directories are created
+lazily on the first write instead of at import time.
+
+"""
+
+import os
+import pytest
+
+from cover_letter_generator import config
+
+
+@pytest.fixture
+def config_dirs(tmp_path, monkeypatch):
+    """Point the application directories at an isolated root"""
+    names = ["DATA_PROFILE_PATH", "DATA_INPUT_PATH", "TEMP_PATH",
+             "OUTPUT_PATH", "OUTPUT_LOGS_PATH", "OUTPUT_COVER_LETTERS_PATH"]
+    for name in names:
+        monkeypatch.setattr(config, name, str(tmp_path / name.lower()))
+    monkeypatch.setattr(config, "_DIRS_READY", False)
+    return [getattr(config, name) for name in names]
+
+
+class TestEnsureDirs:
+    """Test lazy directory creation"""
+
+    def test_creates_directories(self, config_dirs):
+        """Test that every application directory exists afterwards"""
+        config.ensure_dirs()
+
+        assert all(os.path.isdir(path) for path in config_dirs)
+
+    def test_runs_once_per_process(self, config_dirs):
+        """Test that later calls skip the filesystem"""
+        config.ensure_dirs()
+        os.rmdir(config_dirs[0])
+        config.ensure_dirs()
+
+        assert not os.path.exists(config_dirs[0])
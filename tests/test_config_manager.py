@@ -12,13 +12,15 @@ import json
 import yaml
 import tempfile
 import os
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 from datetime import datetime
 
+from cover_letter_generator import config_manager as config_manager_module
 from cover_letter_generator.config_manager import (
     ConfigurationManager, ApplicationConfig, Environment,
-    ConfigSource, ConfigValue, ConfigurationValidator
+    ConfigSource, ConfigValue, ConfigurationValidator, _parse_config_file
 )
 
 
@@ -82,6 +84,19 @@ class TestConfigurationManager:
         assert config_manager.config.performance.cache_size == 500
         assert config_manager.config.logging.log_level == "DEBUG"
     
+    def test_unchanged_config_file_not_reparsed(self, temp_config_file):
+        """Test that reloading an unchanged file reuses the cached parse"""
+        config_manager = ConfigurationManager(temp_config_file, Environment.TESTING)
+        hits = _parse_config_file.cache_info().hits
+        
+        config_manager.reload_configuration()
+        assert _parse_config_file.cache_info().hits == hits + 1
+        assert config_manager.config.openai.model == "gpt-4"
+        
+        # Mutating the loaded dict must not leak into the cache
+        config_manager._load_config_file()["openai"]["model"] = "mutated"
+        assert config_manager._load_config_file()["openai"]["model"] == "gpt-4"
+    
     def test_environment_variable_overrides(self, temp_config_file):
         """Test environment variable overrides"""
         env_vars = {
@@ -102,6 +117,44 @@ class TestConfigurationManager:
             assert config_manager.config.debug_mode is True
             assert config_manager.config.logging.log_level == "INFO"
     
+    def test_merge_only_sets_section_fields(self, temp_config_file):
+        """Test that file keys outside the section schemas are ignored"""
+        config_manager = ConfigurationManager(temp_config_file, Environment.TESTING)
+        file_config = {
+            "openai": {"model": "gpt-4o", "__post_init__": "ignored", "unknown": 1},
+            "app_name": {"upper": "ignored"},
+            "missing_section": {"model": "ignored"}
+        }
+        
+        config = config_manager._merge_configs(ApplicationConfig(), file_config)
+        
+        assert config.openai.model == "gpt-4o"
+        assert "__post_init__" not in vars(config.openai)
+        assert config.app_name == "Cover Letter GPT"
+        assert config_manager.get_config_value("openai.unknown") is None
+    
+    def test_reload_uses_one_timestamp(self, temp_config_file):
+        """Test that every value tracked by one reload shares its timestamp"""
+        with patch.dict(os.environ, {'OPENAI_MODEL': 'env-model'}):
+            config_manager = ConfigurationManager(temp_config_file, Environment.TESTING)
+        
+        timestamps = {value.last_updated for value in config_manager.config_values.values()}
+        assert len(config_manager.config_values) > 1
+        assert len(timestamps) == 1
+    
+    def test_environment_override_conversion(self):
+        """Test that overrides are converted to each field's type and tracked"""
+        config_manager = ConfigurationManager(environment=Environment.TESTING)
+        env_vars = {'CACHE_SIZE': '250', 'DEBUG_MODE': 'off', 'OPENAI_API_KEY': 'secret-test-key'}
+        
+        with patch.dict(os.environ, env_vars):
+            config = config_manager._apply_environment_overrides(ApplicationConfig())
+        
+        assert config.performance.cache_size == 250
+        assert config.debug_mode is False
+        assert config_manager.get_config_value("debug_mode").source == ConfigSource.ENVIRONMENT_VARIABLE
+        assert config_manager.get_config_value("openai.api_key").is_sensitive is True
+    
     def test_environment_specific_settings(self):
         """Test environment-specific configuration settings"""
         # Test production environment
@@ -149,6 +202,18 @@ class TestConfigurationManager:
         with pytest.raises(ValueError):
             config_manager.set_config_value("performance", "cache_size", -1)
     
+    def test_rejected_update_names_broken_rule(self, temp_config_file):
+        """Test that a rolled back update reports its own rule alongside existing problems"""
+        config_manager = ConfigurationManager(temp_config_file, Environment.TESTING)
+        config_manager.config.environment = Environment.PRODUCTION
+        config_manager.config.openai.api_key = ""
+        original = config_manager.config.relevance.max_skills_returned
+        
+        with pytest.raises(ValueError, match="relevance.max_skills_returned"):
+            config_manager.set_config_value("relevance", "max_skills_returned", 500)
+        
+        assert config_manager.config.relevance.max_skills_returned == original
+    
     def test_configuration_change_notifications(self, temp_config_file):
         """Test configuration change notification system"""
         config_manager = ConfigurationManager(temp_config_file, Environment.TESTING)
@@ -169,6 +234,23 @@ class TestConfigurationManager:
         # Remove listener
         config_manager.remove_change_listener(change_listener)
     
+    def test_config_differences_by_leaf(self, temp_config_file):
+        """Test that differences are reported per dotted leaf key"""
+        config_manager = ConfigurationManager(temp_config_file, Environment.TESTING)
+        old_config = config_manager.config
+        new_config = ApplicationConfig()
+        new_config.environment = old_config.environment
+        new_config.openai = old_config.openai
+        new_config.file_monitor.watched_extensions.append('.md')
+        
+        changes = config_manager._find_config_differences(new_config, new_config)
+        assert changes == {}
+        
+        changes = config_manager._find_config_differences(old_config, new_config)
+        assert "file_monitor.watched_extensions" in changes
+        assert "openai.model" not in changes
+        assert changes["file_monitor.watched_extensions"]["new_value"] is not new_config.file_monitor.watched_extensions
+    
     def test_configuration_export(self, temp_config_file, temp_directory):
         """Test configuration export functionality"""
         config_manager = ConfigurationManager(temp_config_file, Environment.TESTING)
@@ -186,6 +268,7 @@ class TestConfigurationManager:
         assert "configuration" in exported_data
         assert "environment" in exported_data
         assert exported_data["environment"] == "testing"
+        assert exported_data["configuration"]["environment"] == "testing"
         
         # Verify sensitive data is hidden
         if "openai" in exported_data["configuration"]:
@@ -211,6 +294,10 @@ class TestConfigurationManager:
         assert summary["environment"] == "testing"
         assert summary["file_exists"] is True
         assert summary["total_config_values"] > 0
+        assert sum(summary["sources_breakdown"].values()) == summary["total_config_values"]
+        
+        newest = max(value.last_updated for value in config_manager.config_values.values())
+        assert summary["last_reload"] == newest.isoformat()
     
     def test_file_watching_functionality(self, temp_config_file):
         """Test configuration file watching"""
@@ -225,6 +312,31 @@ class TestConfigurationManager:
         # Verify stopped
         if config_manager._file_watch_thread:
             assert not config_manager._file_watch_thread.is_alive()
+    
+    def test_file_watching_skips_unchanged_content(self, temp_config_file):
+        """Test that a watcher event only reloads when file contents change"""
+        config_manager = ConfigurationManager(temp_config_file, Environment.DEVELOPMENT)
+        config_manager.stop_file_watching()
+        
+        with patch.object(config_manager, "reload_configuration") as reload:
+            Path(temp_config_file).touch()
+            config_manager._reload_if_content_changed()
+            reload.assert_not_called()
+            
+            with open(temp_config_file, 'a') as f:
+                f.write("app_name: Edited\n")
+            config_manager._reload_if_content_changed()
+            reload.assert_called_once()
+    
+    @pytest.mark.skipif(not config_manager_module.WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_file_watching_uses_observer(self, temp_config_file):
+        """Test that file notifications replace polling when watchdog is installed"""
+        config_manager = ConfigurationManager(temp_config_file, Environment.DEVELOPMENT)
+        
+        assert isinstance(config_manager._file_watch_thread, config_manager_module.Observer)
+        
+        config_manager.stop_file_watching()
+        assert not config_manager._file_watch_thread.is_alive()
 
 
 class TestConfigurationValidator:
@@ -288,24 +400,77 @@ class TestConfigurationValidator:
         cache_errors = [error for error in errors if "cache_size" in error]
         assert len(cache_errors) == 0
     
-    def test_flatten_dict_functionality(self, validator):
-        """Test dictionary flattening for validation"""
-        nested_dict = {
-            "level1": {
-                "level2": {
-                    "level3": "value"
-                },
-                "simple": "value"
-            },
-            "root": "value"
-        }
+    def test_validation_results_cached_by_rule_inputs(self, validator):
+        """Test that rules only re-run when a value they read changes"""
+        config = ApplicationConfig()
+        rule_calls = []
+        validator.validation_rules["memory.max_skills"].append(lambda x: rule_calls.append(x) or True)
+        
+        first = validator.validate_config(config)
+        first.append("caller mutation")
+        assert validator.validate_config(config) == first[:-1]
+        assert len(rule_calls) == 1
+        
+        config.app_name = "Not a rule input"
+        validator.validate_config(config)
+        assert len(rule_calls) == 1
+        
+        config.memory.max_skills = 5
+        errors = validator.validate_config(config)
+        assert len(rule_calls) == 2
+        assert any("memory.max_skills" in error for error in errors)
+    
+    def test_fail_fast_validation(self, validator):
+        """Test that fail-fast validation stops at the likeliest error"""
+        config = ApplicationConfig()
+        config.environment = Environment.PRODUCTION
+        config.debug_mode = True
+        
+        errors = validator.validate_config(config, fail_fast=True)
+        assert errors == ["OpenAI API key is required in production"]
+        assert len(validator.validate_config(config)) > 1
         
-        flattened = validator._flatten_dict(nested_dict)
+        # Rules that failed before are checked ahead of the others
+        config.environment = Environment.DEVELOPMENT
+        config.performance.cache_size = 100
+        config.memory.max_skills = 200000
+        assert "memory.max_skills" in validator.validate_config(config, fail_fast=True)[0]
+        config.performance.cache_size = 5
+        assert "memory.max_skills" in validator.validate_config(config, fail_fast=True)[0]
+    
+    def test_rule_failures_counted_across_threads(self, validator):
+        """Test that concurrent validations record every rule failure"""
+        config = ApplicationConfig()
+        config.memory.max_skills = 1
+        
+        def validate_repeatedly():
+            for _ in range(200):
+                # Bypass the result cache so every pass evaluates the rules
+                list(validator._iter_errors(config))
+        
+        threads = [threading.Thread(target=validate_repeatedly) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert validator._rule_fail_hits["memory.max_skills"] == 800
+    
+    def test_rules_added_after_construction(self, validator):
+        """Test that rule keys added later are resolved and unknown keys skipped"""
+        config = ApplicationConfig()
+        validator.validation_rules["openai.timeout"] = [lambda x: x < 10]
+        validator.validation_rules["openai.missing"] = [lambda x: False]
+        
+        validator.clear_cache()
+        
+        errors = validator.validate_config(config)
+        assert "Validation failed for openai.timeout: 30" in errors
+        assert not any("openai.missing" in error for error in errors)
         
-        assert "level1.level2.level3" in flattened
-        assert flattened["level1.level2.level3"] == "value"
-        assert "level1.simple" in flattened
-        assert "root" in flattened
+        # The new rule's input is part of the cache key once the cache is cleared
+        config.openai.timeout = 5
+        assert not any("openai.timeout" in error for error in validator.validate_config(config))
 
 
 class TestConfigValue:
@@ -0,0 +1,69 @@
+"""
+Test Suite for Context Manager
+==============================
+
+Tests for persisting conversation context as append-only JSON Lines,
+including files saved in the earlier JSON array format.
+
+"""
+
+import json
+
+from cover_letter_generator.context_manager import (
+    save_context_to_file, load_context_from_file, append_message_to_file,
+    persist_new_messages, update_context
+)
+
+
+class TestContextPersistence:
+    """Test saving and loading conversation context"""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test that messages with newlines and unicode survive a round trip"""
+        path = tmp_path / "context.json"
+        context = [{"role": "user", "content": "Line one\nLine two"}, {"role": "assistant", "content": "café ✓"}]
+
+        save_context_to_file(context, str(path))
+
+        assert load_context_from_file(str(path)) == context
+        assert len(path.read_bytes().splitlines()) == 2
+
+    def test_persist_appends_after_first_save(self, tmp_path):
+        """Test that the first save replaces the file and later saves only append"""
+        path = str(tmp_path / "context.json")
+        save_context_to_file([{"role": "user", "content": "previous session"}], path)
+        context = [{"role": "system", "content": "a"}]
+
+        saved = persist_new_messages(context, path, 0)
+        context.extend([{"role": "user", "content": "b"}, {"role": "assistant", "content": "c"}])
+        saved = persist_new_messages(context, path, saved)
+
+        assert saved == 3
+        assert load_context_from_file(path) == context
+
+    def test_update_context_appends_to_file(self, tmp_path):
+        """Test that update_context keeps the file in step when given a path"""
+        path = str(tmp_path / "context.json")
+        context = []
+
+        update_context(context, {"role": "user", "content": "hello"}, path)
+        append_message_to_file({"role": "assistant", "content": "hi"}, path)
+
+        assert load_context_from_file(path) == [{"role": "user", "content": "hello"},
+                                                {"role": "assistant", "content": "hi"}]
+
+    def test_load_legacy_json_array(self, tmp_path):
+        """Test that contexts saved as one indented JSON array still load"""
+        path = tmp_path / "context.json"
+        context = [{"role": "user", "content": "old format"}]
+        path.write_text(json.dumps(context, indent=2), encoding="utf-8")
+
+        assert load_context_from_file(str(path)) == context
+
+    def test_missing_and_cleared_files(self, tmp_path):
+        """Test that missing or emptied context files load as an empty context"""
+        path = tmp_path / "context.json"
+        assert load_context_from_file(str(path)) == []
+
+        path.write_text("", encoding="utf-8")
+        assert load_context_from_file(str(path)) == []
@@ -7,14 +7,18 @@ validating intelligent recovery, graceful degradation, and error analytics.
 
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 import json
+import logging
+import logging.handlers
+from collections import deque
 from datetime import datetime
 
 from cover_letter_generator.error_handler import (
     ErrorHandler, ErrorContext, ErrorSeverity, RecoveryStrategy,
-    with_error_handling
+    with_error_handling, with_async_error_handling
 )
 
 
@@ -480,3 +484,382 @@ class TestErrorIntegration:
         
         # Should have varied error types
         assert len(analytics["error_types_breakdown"]) >= 3
+
+
+class TestLazyErrorContext:
+    """Test that error context details are only gathered when an error occurs"""
+    
+    @pytest.fixture
+    def error_handler(self):
+        return ErrorHandler()
+    
+    def test_stack_not_captured_on_construction(self):
+        """Test that a new context holds no stack frames"""
+        context = ErrorContext("test_operation", "test_component")
+        
+        assert context.stack_trace is None
+        assert context.to_dict()["stack_trace"] == []
+    
+    def test_capture_stack_keeps_last_frames(self):
+        """Test that capture_stack records at most 5 frames ending at the caller"""
+        context = ErrorContext("test_operation", "test_component")
+        frames = context.capture_stack()
+        
+        assert 0 < len(frames) <= 5
+        assert "test_capture_stack_keeps_last_frames" in frames[-1]
+        assert context.to_dict()["stack_trace"] == frames
+    
+    def test_handle_error_captures_missing_stack(self, error_handler):
+        """Test that handling an error records the caller's frames, not the handler's"""
+        context = ErrorContext("test_operation", "test_component")
+        error_handler.handle_error(ValueError("bad value"), context)
+        
+        frames = error_handler.error_log[-1]["context"]["stack_trace"]
+        assert len(frames) == 5
+        assert "test_handle_error_captures_missing_stack" in frames[-1]
+        assert not any("_process_error" in frame or "in handle_error" in frame for frame in frames)
+    
+    def test_decorator_success_path_builds_no_context(self, error_handler):
+        """Test that successful decorated calls never create an ErrorContext"""
+        @with_error_handling(error_handler, "test_component", "test_operation")
+        def succeed():
+            return "ok"
+        
+        with patch("cover_letter_generator.error_handler.ErrorContext") as context_class:
+            assert succeed() == "ok"
+        
+        context_class.assert_not_called()
+    
+    def test_decorator_failure_records_stack(self, error_handler):
+        """Test that a failing decorated call records where it failed"""
+        @with_error_handling(error_handler, "test_component", "load_skills")
+        def fail():
+            raise KeyError("missing")
+        
+        assert fail() == []
+        
+        record = error_handler.error_log[-1]
+        frames = record["context"]["stack_trace"]
+        assert record["context"]["operation"] == "load_skills"
+        assert len(frames) == 5
+        assert "in wrapper" in frames[-1]
+        assert "test_decorator_failure_records_stack" in frames[-2]
+        assert not any("_process_error" in frame or "in handle_error" in frame for frame in frames)
+    
+    def test_decorator_truncates_call_data(self, error_handler):
+        """Test that large arguments are cut short in the error record"""
+        @with_error_handling(error_handler, "test_component", "load_skills")
+        def fail(skills, **options):
+            raise KeyError("missing")
+        
+        fail(["skill"] * 1000, verbose="x" * 1000)
+        
+        data = error_handler.error_log[-1]["context"]["data"]
+        assert data["args"].startswith("(['skill', ")
+        assert len(data["args"]) == 512
+        assert len(data["kwargs"]) == 512
+
+
+class TestPerformanceMetrics:
+    """Test per-component recovery metrics"""
+    
+    @pytest.fixture
+    def error_handler(self):
+        return ErrorHandler()
+    
+    def test_success_rate_tracks_recoveries(self, error_handler):
+        """Test that success rate counts successful recoveries per component"""
+        error_handler.handle_error(ValueError("skip me"), ErrorContext("parse", "parser"))
+        error_handler.handle_error(PermissionError("denied"), ErrorContext("parse", "parser"))
+        error_handler.handle_error(PermissionError("denied"), ErrorContext("read", "reader"))
+        
+        parser = error_handler.performance_impact["parser"]
+        assert parser["error_count"] == 2
+        assert parser["successful_recoveries"] == 1
+        assert parser["success_rate"] == 0.5
+        assert error_handler.performance_impact["reader"]["success_rate"] == 0.0
+    
+    def test_metrics_do_not_rescan_error_log(self, error_handler):
+        """Test that updating metrics leaves the error log untouched"""
+        error_handler.handle_error(ValueError("skip me"), ErrorContext("parse", "parser"))
+        error_handler.error_log = None
+        error_handler._update_performance_metrics({"context": {"component": "parser"}, "recovery_successful": True})
+        
+        assert error_handler.performance_impact["parser"]["success_rate"] == 1.0
+
+
+class TestBoundedErrorLog:
+    """Test that the error log is capped while analytics keep full totals"""
+    
+    @pytest.fixture
+    def error_handler(self):
+        handler = ErrorHandler()
+        handler.error_log = deque(maxlen=3)
+        return handler
+    
+    def test_error_log_keeps_most_recent_records(self, error_handler):
+        """Test that old records are evicted once the log is full"""
+        for i in range(5):
+            error_handler.handle_error(ValueError(f"error {i}"), ErrorContext("parse", "parser"))
+        
+        assert [record["id"] for record in error_handler.error_log] == [3, 4, 5]
+        assert error_handler.error_log[-1]["error_message"] == "error 4"
+    
+    def test_analytics_count_evicted_errors(self, error_handler):
+        """Test that analytics include errors no longer in the log"""
+        for _ in range(4):
+            error_handler.handle_error(ValueError("bad value"), ErrorContext("parse", "parser"))
+        error_handler.handle_error(PermissionError("denied"), ErrorContext("read", "reader"))
+        
+        analytics = error_handler.get_error_analytics()
+        
+        assert analytics["total_errors"] == 5
+        assert analytics["recovery_success_rate"] == 80.0
+        assert analytics["errors_by_severity"] == {ErrorSeverity.MEDIUM: 4, ErrorSeverity.HIGH: 1}
+        assert analytics["errors_by_component"] == {"parser": 4, "reader": 1}
+        assert analytics["most_problematic_component"] == "parser"
+    
+    def test_no_errors_analytics(self):
+        """Test analytics before any error is handled"""
+        assert ErrorHandler().get_error_analytics() == {"status": "no_errors", "total_errors": 0}
+
+
+class TestErrorLogging:
+    """Test that errors are logged at the level matching their severity"""
+    
+    @pytest.mark.parametrize("severity, level", [
+        (ErrorSeverity.CRITICAL, "CRITICAL"),
+        (ErrorSeverity.HIGH, "ERROR"),
+        (ErrorSeverity.MEDIUM, "WARNING"),
+        (ErrorSeverity.LOW, "INFO"),
+        ("UNKNOWN", "INFO"),
+    ])
+    def test_log_level_by_severity(self, caplog, severity, level):
+        """Test severity to log level dispatch"""
+        error_handler = ErrorHandler()
+        record = {"error_type": "ValueError", "error_message": "bad value",
+                  "context": {"component": "parser", "operation": "parse"}}
+        
+        error_handler.logger.addHandler(caplog.handler)
+        try:
+            error_handler._log_error(record, {"severity": severity})
+        finally:
+            error_handler.logger.removeHandler(caplog.handler)
+        
+        assert caplog.records[-1].levelname == level
+        assert caplog.records[-1].getMessage() == "ValueError: bad value in parser.parse"
+    
+    def test_disabled_levels_skip_formatting(self):
+        """Test that messages below the logger level are never formatted"""
+        error_handler = ErrorHandler()
+        message = MagicMock()
+        error_handler.logger.setLevel(logging.ERROR)
+        try:
+            error_handler._log_error({"error_type": "ValueError", "error_message": message,
+                                      "context": {"component": "parser", "operation": "parse"}},
+                                     {"severity": ErrorSeverity.MEDIUM})
+        finally:
+            error_handler.logger.setLevel(logging.DEBUG)
+        
+        message.__str__.assert_not_called()
+
+
+class TestErrorTimestamps:
+    """Test nanosecond timestamps and their conversion"""
+    
+    def test_context_timestamp_converts_on_access(self):
+        """Test that the context keeps a raw reading and converts it exactly"""
+        with patch("cover_letter_generator.error_handler.time.time_ns", return_value=1_700_000_000_123_456_789):
+            context = ErrorContext("test_operation", "test_component")
+        
+        expected = datetime.fromtimestamp(1_700_000_000).replace(microsecond=123456)
+        assert context.timestamp_ns == 1_700_000_000_123_456_789
+        assert context.timestamp == expected
+        assert context.to_dict()["timestamp"] == expected.isoformat()
+    
+    def test_error_record_keeps_raw_timestamp(self):
+        """Test that handling an error stores nanoseconds without formatting any datetime"""
+        error_handler = ErrorHandler()
+        context = ErrorContext("parse", "parser")
+        with patch("cover_letter_generator.error_handler._datetime_from_ns") as convert:
+            error_handler.handle_error(ValueError("bad value"), context)
+        
+        record = error_handler.error_log[-1]
+        convert.assert_not_called()
+        assert record["timestamp_ns"] == context.timestamp_ns
+        assert record["context"]["timestamp_ns"] == context.timestamp_ns
+        assert "timestamp" not in record
+        assert "timestamp" not in record["context"]
+    
+    def test_export_formats_timestamps(self):
+        """Test that exported records carry ISO timestamps and leave error_log raw"""
+        error_handler = ErrorHandler()
+        context = ErrorContext("parse", "parser")
+        error_handler.handle_error(ValueError("bad value"), context)
+        
+        exported = error_handler.export_error_log()
+        
+        assert exported[0]["timestamp"] == context.timestamp.isoformat()
+        assert exported[0]["context"]["timestamp"] == context.timestamp.isoformat()
+        assert "timestamp_ns" not in exported[0]
+        assert "timestamp_ns" not in exported[0]["context"]
+        assert "timestamp_ns" in error_handler.error_log[0]["context"]
+
+
+class TestUntrackedErrors:
+    """Test the fast path for skipped errors below the tracked severity"""
+    
+    @pytest.fixture
+    def error_handler(self):
+        return ErrorHandler(min_tracked_severity=ErrorSeverity.HIGH)
+    
+    def test_skipped_low_severity_error_is_not_recorded(self, error_handler):
+        """Test that a skippable error below the threshold leaves no trace"""
+        context = ErrorContext("parse", "parser")
+        result = error_handler.handle_error(ValueError("bad value"), context)
+        
+        assert result["continue_execution"] is True
+        assert result["recovery_successful"] is True
+        assert result["severity"] == ErrorSeverity.MEDIUM
+        assert len(error_handler.error_log) == 0
+        assert error_handler.get_error_analytics()["total_errors"] == 0
+        assert context.stack_trace is None
+    
+    def test_untracked_result_is_shared_and_read_only(self, error_handler):
+        """Test that repeated untracked errors reuse one immutable result"""
+        first = error_handler.handle_error(ValueError("one"), ErrorContext("parse", "parser"))
+        second = error_handler.handle_error(ValueError("two"), ErrorContext("parse", "parser"))
+        
+        assert first is second
+        with pytest.raises(TypeError):
+            first["continue_execution"] = False
+    
+    def test_other_strategies_are_still_tracked(self, error_handler):
+        """Test that non-skip errors below the threshold are still handled fully"""
+        error_handler.handle_error(KeyError("missing"), ErrorContext("parse", "parser"))
+        
+        assert len(error_handler.error_log) == 1
+    
+    def test_default_tracks_everything(self):
+        """Test that every error is recorded by default"""
+        error_handler = ErrorHandler()
+        error_handler.handle_error(ValueError("bad value"), ErrorContext("parse", "parser"))
+        
+        assert len(error_handler.error_log) == 1
+
+
+class TestRetryBackoff:
+    """Test retry delays on the blocking and asynchronous paths"""
+    
+    @pytest.fixture
+    def error_handler(self):
+        return ErrorHandler()
+    
+    def test_sync_retry_sleeps_constant_delay(self, error_handler):
+        """Test that the blocking path waits the rule's fixed delay on each retry"""
+        with patch("cover_letter_generator.error_handler.time.sleep") as sleep:
+            for _ in range(4):
+                error_handler.handle_error(ConnectionError("down"), ErrorContext("api_call", "openai_client"))
+        
+        assert [call.args[0] for call in sleep.call_args_list] == [2.0, 2.0, 2.0]
+        assert error_handler.error_log[-1]["retry_attempts_exhausted"] is True
+    
+    def test_async_retry_awaits_without_blocking(self, error_handler):
+        """Test that handle_error_async awaits an exponential backoff instead of sleeping"""
+        delays = []
+        
+        async def fake_sleep(delay):
+            delays.append(delay)
+        
+        async def handle_twice():
+            for _ in range(2):
+                result = await error_handler.handle_error_async(TimeoutError("slow"), ErrorContext("api_call", "openai_client"))
+            return result
+        
+        with patch("cover_letter_generator.error_handler.asyncio.sleep", fake_sleep), \
+                patch("cover_letter_generator.error_handler.time.sleep") as blocking_sleep:
+            result = asyncio.run(handle_twice())
+        
+        assert delays == [5.0, 10.0]
+        assert result["recovery_successful"] is True
+        blocking_sleep.assert_not_called()
+    
+    def test_async_decorator_returns_fallback(self, error_handler):
+        """Test that the coroutine decorator passes results and fallbacks through"""
+        @with_async_error_handling(error_handler, "test_component", "load_skills")
+        async def load(fail):
+            if fail:
+                raise KeyError("missing")
+            return ["python"]
+        
+        assert asyncio.run(load(False)) == ["python"]
+        assert asyncio.run(load(True)) == []
+        assert error_handler.error_log[-1]["context"]["operation"] == "load_skills"
+    
+    def test_async_decorator_reraises_when_halting(self, error_handler):
+        """Test that the coroutine decorator re-raises errors that stop execution"""
+        @with_async_error_handling(error_handler, "test_component")
+        async def read():
+            raise PermissionError("denied")
+        
+        with pytest.raises(PermissionError):
+            asyncio.run(read())
+
+
+class TestLoggingSetup:
+    """Test the handlers installed on the shared error logger"""
+    
+    def test_handlers_replaced_not_accumulated(self):
+        """Test that creating several handlers keeps a single console handler"""
+        for _ in range(3):
+            error_handler = ErrorHandler()
+        
+        installed = [h for h in error_handler.logger.handlers if getattr(h, "_installed_by_error_handler", False)]
+        assert len(installed) == 1
+        assert error_handler.logger.propagate is False
+        assert error_handler.logger.level == logging.INFO
+    
+    def test_log_file_uses_rotating_handler(self, tmp_path):
+        """Test that a log file gets a size-bounded rotating handler at debug level"""
+        error_handler = ErrorHandler(log_file=str(tmp_path / "errors.log"))
+        try:
+            file_handlers = [h for h in error_handler.logger.handlers
+                             if isinstance(h, logging.handlers.RotatingFileHandler)]
+            
+            assert len(file_handlers) == 1
+            assert file_handlers[0].maxBytes == ErrorHandler.LOG_FILE_MAX_BYTES
+            assert file_handlers[0].backupCount == ErrorHandler.LOG_FILE_BACKUPS
+            assert error_handler.logger.level == logging.DEBUG
+        finally:
+            # Restore the console-only setup, closing the file handler
+            ErrorHandler()
+
+
+class TestErrorRuleLookup:
+    """Test error rule resolution and its per-type cache"""
+    
+    @pytest.fixture
+    def error_handler(self):
+        return ErrorHandler()
+    
+    def test_subclass_resolves_to_parent_rule(self, error_handler):
+        """Test that subclasses use their nearest registered rule"""
+        assert error_handler._get_error_rule(ConnectionResetError) is error_handler.error_rules[ConnectionError]
+        assert error_handler._get_error_rule(LookupError) is error_handler.error_rules[Exception]
+    
+    def test_rule_resolved_once_per_type(self, error_handler):
+        """Test that repeated lookups for a type skip the rule scan"""
+        with patch.object(error_handler, "_resolve_error_rule", wraps=error_handler._resolve_error_rule) as resolve:
+            for _ in range(3):
+                error_handler._get_error_rule(ConnectionResetError)
+        
+        assert resolve.call_count == 1
+    
+    def test_clear_rule_cache_picks_up_new_rules(self, error_handler):
+        """Test that rules added later apply once the cache is cleared"""
+        error_handler._get_error_rule(ZeroDivisionError)
+        custom_rule = {"severity": ErrorSeverity.LOW, "strategy": RecoveryStrategy.SKIP}
+        error_handler.error_rules[ZeroDivisionError] = custom_rule
+        error_handler.clear_rule_cache()
+        
+        assert error_handler._get_error_rule(ZeroDivisionError) is custom_rule
@@ -0,0 +1,56 @@
+"""
+Test Suite for JSON Codec
+=========================
+
+Tests for the JSON helpers, validating that the orjson and standard
+library backends produce interchangeable output.
+
+"""
+
+import json
+import pytest
+
+from cover_letter_generator import json_codec
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    """Run each test against both JSON backends"""
+    if request.param and not json_codec.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    if not request.param:
+        monkeypatch.setattr(json_codec, "ORJSON_AVAILABLE", False)
+    return json_codec
+
+
+SAMPLE = {
+    "skills": {"python": {"skill_name": "Python", "examples": [], "score": 0.75}},
+    "unicode": "Réseau — sécurité",
+    "flags": [True, False, None],
+}
+
+
+class TestJsonCodec:
+    """Test JSON encoding and decoding"""
+
+    def test_round_trip(self, codec):
+        """Test that dumps output parses back to the same object"""
+        assert codec.loads(codec.dumps(SAMPLE)) == SAMPLE
+
+    def test_indented_output_matches_stdlib(self, codec):
+        """Test that indented output matches json.dumps(indent=2)"""
+        expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode('utf-8')
+        assert codec.dumps(SAMPLE, indent=True) == expected
+
+    def test_loads_accepts_str(self, codec):
+        """Test that text input is accepted as well as bytes"""
+        assert codec.loads('{"a": 1}') == {"a": 1}
+
+    def test_default_hook(self, codec):
+        """Test that unsupported types go through the default hook"""
+        assert codec.loads(codec.dumps({"value": object()}, default=lambda o: "obj")) == {"value": "obj"}
+
+    def test_decode_error_type(self, codec):
+        """Test that malformed input raises json.JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"{not json")
@@ -0,0 +1,97 @@
+"""
+Test Suite for Keyword Matcher
+==============================
+
+Tests for the Aho-Corasick keyword matcher, validating that a single scan
+finds the same keywords as repeated substring checks.
+
+"""
+
+import re
+import pytest
+
+from cover_letter_generator import keyword_matcher
+from cover_letter_generator.keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture(params=[True, False], ids=["native", "pure_python"])
+def matcher_factory(request, monkeypatch):
+    """Build matchers with and without the optional C automaton"""
+    if request.param and not keyword_matcher.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    if not request.param:
+        monkeypatch.setattr(keyword_matcher, "AHOCORASICK_AVAILABLE", False)
+    return KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test multi-keyword matching"""
+
+    def test_finds_all_occurrences(self, matcher_factory):
+        """Test that every occurrence is reported with its start index"""
+        matcher = matcher_factory([("sql", "db"), ("mysql", "db"), ("python", "code")])
+        hits = sorted(matcher.iter("python and mysql"))
+
+        assert hits == [(0, "python", "code"), (11, "mysql", "db"), (13, "sql", "db")]
+
+    def test_overlapping_keywords(self, matcher_factory):
+        """Test keywords that are suffixes of other keywords"""
+        matcher = matcher_factory([("he", 1), ("she", 2), ("hers", 3), ("his", 4)])
+        keywords = sorted(keyword for _, keyword, _ in matcher.iter("ushers"))
+
+        assert keywords == ["he", "hers", "she"]
+
+    def test_shared_keyword_values(self, matcher_factory):
+        """Test that a keyword registered twice yields both values"""
+        matcher = matcher_factory([("security", "network"), ("security", "compliance")])
+
+        assert matcher.values_in("network security") == {"network", "compliance"}
+
+    def test_matches_substring_semantics(self, matcher_factory):
+        """Test agreement with plain substring checks"""
+        terms = ["ip", "vpn", "tcp", "network", "data", "database", "bi"]
+        matcher = matcher_factory((term, term) for term in terms)
+
+        for text in ["tcp/ip networking", "business intelligence", "vpn", "databases", "none"]:
+            assert matcher.values_in(text) == {term for term in terms if term in text}
+
+    def test_keywords_in(self, matcher_factory):
+        """Test that keywords are reported once however many values they carry"""
+        matcher = matcher_factory([("security", "network"), ("security", "compliance"), ("sql", "db")])
+
+        assert matcher.keywords_in("security and more security") == {"security"}
+
+    def test_empty_matcher(self, matcher_factory):
+        """Test that a matcher without keywords finds nothing"""
+        matcher = matcher_factory([])
+
+        assert len(matcher) == 0
+        assert list(matcher.iter("anything")) == []
+
+    def test_scan_words_matches_findall(self, matcher_factory):
+        """Test that whole-word counts agree with \\b-anchored findall"""
+        terms = ["lead", "team lead", "sql", "supply chain", "ci/cd", "aa"]
+        matcher = matcher_factory((term, term) for term in terms)
+
+        for text in ["team lead, leader, lead", "mysql sql_server sql", "supply chain supply chains",
+                     "ci/cd ci/cdx", "aaa aa aa aa", ""]:
+            found, counts = matcher.scan_words(text)
+            assert found == {term for term in terms if term in text}
+            for term in terms:
+                assert counts[term] == len(re.findall(r'\b' + re.escape(term) + r'\b', text))
+
+    def test_scan_words_punctuation_edges(self, matcher_factory):
+        """Test that punctuation at a keyword edge needs no word boundary"""
+        matcher = matcher_factory([("c++", "c++"), (".net", ".net")])
+        _, counts = matcher.scan_words("c++, .net and asp.net; not c or cc++ or .network")
+
+        assert counts == {"c++": 1, ".net": 2}
+
+
+class TestWordCharacters:
+    """Test the word-character check used for whole-word counting"""
+
+    def test_agrees_with_regex(self):
+        """Test agreement with \\w on ASCII, accented, digit and symbol characters"""
+        for char in "aZ09_ é ß ٣ ² Ⅳ 中 - . + / \t ’ ·":
+            assert keyword_matcher._is_word_char(char) == (re.match(r'\w', char) is not None)
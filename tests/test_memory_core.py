@@ -0,0 +1,261 @@
+"""
+Test Suite for Memory Core
+==========================
+
+Tests for persistent memory storage, validating load/save round trips
+and the startup cache that sits in front of the JSON memory file.
+
+"""
+
+import os
+import json
+import pytest
+from datetime import datetime
+
+from cover_letter_generator import memory_core
+from cover_letter_generator.memory_core import MemoryCore, SkillMemory, FeedbackMemory
+
+
+@pytest.fixture
+def memory_dir(tmp_path, monkeypatch):
+    """Point MemoryCore at an isolated output directory"""
+    monkeypatch.setattr(memory_core, "OUTPUT_PATH", str(tmp_path))
+    return tmp_path
+
+
+def make_skill(name, context="Test context"):
+    """Build a skill memory entry"""
+    return SkillMemory(
+        skill_name=name,
+        proficiency_level="Advanced",
+        context=context,
+        examples=[],
+        last_updated=datetime.now().isoformat()
+    )
+
+
+def make_feedback(text, outcome="accepted"):
+    """Build a feedback memory entry"""
+    return FeedbackMemory(
+        feedback_text=text,
+        cover_letter_context="Test letter",
+        outcome=outcome,
+        extracted_insights=[],
+        applied_changes=[],
+        effectiveness_score=0.8
+    )
+
+
+class TestMemoryPersistence:
+    """Test memory load and save behavior"""
+
+    def test_round_trip(self, memory_dir):
+        """Test that saved memory is visible to a new instance"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting"))
+
+        reloaded = MemoryCore()
+        assert "python_scripting" in reloaded.get_current_skills()
+
+    def test_cache_written_on_save(self, memory_dir):
+        """Test that saving refreshes the startup cache"""
+        memory = MemoryCore()
+        memory.save_memory()
+
+        assert os.path.exists(memory.memory_cache_file)
+
+    def test_stale_cache_ignored(self, memory_dir):
+        """Test that a hand-edited JSON file wins over an older cache"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting"))
+
+        with open(memory.memory_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["user_profile"]["skills"] = {}
+        with open(memory.memory_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        cache_mtime = os.stat(memory.memory_cache_file).st_mtime_ns
+        os.utime(memory.memory_file, ns=(cache_mtime + 10**9, cache_mtime + 10**9))
+
+        assert MemoryCore().get_current_skills() == {}
+
+    def test_matching_cache_used(self, memory_dir, monkeypatch):
+        """Test that a snapshot of the current JSON file is loaded without parsing JSON"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting"))
+
+        def fail_parse(raw):
+            raise AssertionError("JSON parsed despite a matching cache")
+
+        monkeypatch.setattr(memory_core.json_codec, "loads", fail_parse)
+        assert "python_scripting" in MemoryCore().get_current_skills()
+
+    def test_restored_older_json_wins(self, memory_dir):
+        """Test that a JSON file restored with an older preserved mtime is not shadowed by the cache"""
+        memory = MemoryCore()
+        memory.save_memory()
+        with open(memory.memory_file, 'rb') as f:
+            backup = f.read()
+        backup_mtime = os.stat(memory.memory_file).st_mtime_ns - 10**9
+        memory.add_skill_memory(make_skill("Python Scripting"))
+
+        with open(memory.memory_file, 'wb') as f:
+            f.write(backup)
+        os.utime(memory.memory_file, ns=(backup_mtime, backup_mtime))
+
+        assert MemoryCore().get_current_skills() == {}
+
+    def test_same_tick_json_write_wins(self, memory_dir):
+        """Test that a JSON rewrite keeping the snapshot's mtime is detected by its size"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting"))
+        json_mtime = os.stat(memory.memory_file).st_mtime_ns
+
+        with open(memory.memory_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["user_profile"]["skills"] = {}
+        with open(memory.memory_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.utime(memory.memory_file, ns=(json_mtime, json_mtime))
+
+        assert MemoryCore().get_current_skills() == {}
+
+    def test_corrupt_cache_falls_back_to_json(self, memory_dir):
+        """Test that an unreadable cache does not break loading"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting"))
+
+        with open(memory.memory_cache_file, 'wb') as f:
+            f.write(b"not a pickle")
+
+        assert "python_scripting" in MemoryCore().get_current_skills()
+
+    @pytest.mark.parametrize("payload", [
+        b"cno_such_module_for_memory_cache\nthing\n.",  # ModuleNotFoundError
+        b"\x80\x04\x95\x00\x00\x00\x00\x00\x00\x00\xa6N.",  # OverflowError
+        b"(lp0\nI1\nag0\nR.",  # TypeError
+    ])
+    def test_damaged_cache_errors_fall_back_to_json(self, memory_dir, payload):
+        """Test that any error raised while unpickling falls back to the JSON file"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting"))
+
+        with open(memory.memory_cache_file, 'wb') as f:
+            f.write(payload)
+
+        assert "python_scripting" in MemoryCore().get_current_skills()
+
+
+class TestMemoryVersion:
+    """Test the mutation counter used to invalidate derived views"""
+
+    def test_version_bumps_on_save(self, memory_dir):
+        """Test that every mutation advances the version"""
+        memory = MemoryCore()
+        start = memory.version
+
+        memory.add_skill_memory(make_skill("Python Scripting"))
+        memory.add_feedback_memory(make_feedback("Looks good"))
+
+        assert memory.version == start + 2
+
+    def test_accessors_return_live_views(self, memory_dir):
+        """Test that accessors hand out the stored dicts without copying"""
+        memory = MemoryCore()
+
+        assert memory.get_current_skills() is memory.memory_data["user_profile"]["skills"]
+        assert memory.get_style_preferences() is memory.memory_data["style_preferences"]
+
+
+class TestDerivedViews:
+    """Test views computed from memory and cached per version"""
+
+    def test_skill_names_lower_tracks_changes(self, memory_dir):
+        """Test that lowercased names refresh after a mutation"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting"))
+        assert memory.get_skill_names_lower() == {"python_scripting": "python scripting"}
+
+        memory.add_skill_memory(make_skill("SQL Server"))
+        assert memory.get_skill_names_lower()["sql_server"] == "sql server"
+
+    def test_memory_file_size_matches_disk(self, memory_dir):
+        """Test that the tracked file size agrees with the file on disk"""
+        memory = MemoryCore()
+        assert memory.get_memory_file_size() == 0
+
+        memory.add_skill_memory(make_skill("Réseau Sécurité"))
+        assert memory.get_memory_file_size() == os.path.getsize(memory.memory_file)
+
+    def test_recent_feedback_newest_first(self, memory_dir):
+        """Test that recent feedback follows appends and history resets"""
+        memory = MemoryCore()
+        for i in range(5):
+            memory.add_feedback_memory(make_feedback(f"Feedback {i}"))
+
+        recent = memory.get_recent_feedback(3)
+        assert [f["feedback_text"] for f in recent] == ["Feedback 4", "Feedback 3", "Feedback 2"]
+
+        memory.add_feedback_memory(make_feedback("Feedback 5"))
+        assert memory.get_recent_feedback(1)[0]["feedback_text"] == "Feedback 5"
+
+        memory.memory_data["feedback_history"] = []
+        memory.save_memory()
+        assert memory.get_recent_feedback(3) == []
+
+
+class ScanGuardDict(dict):
+    """Dict that fails the test if it is iterated"""
+
+    def items(self):
+        raise AssertionError("token index scanned")
+
+    def __iter__(self):
+        raise AssertionError("token index scanned")
+
+
+class TestMemorySearch:
+    """Test indexed memory search"""
+
+    @pytest.fixture
+    def populated_memory(self, memory_dir):
+        """Memory with a few skills and feedback entries"""
+        memory = MemoryCore()
+        memory.add_skill_memory(make_skill("Python Scripting", "Automation of TCP/IP checks"))
+        memory.add_skill_memory(make_skill("MySQL Database", "Reporting"))
+        memory.add_feedback_memory(make_feedback("Mention Python earlier"))
+        return memory
+
+    def test_whole_word_query(self, populated_memory):
+        """Test that a word query finds skills and feedback"""
+        results = populated_memory.search_memory("Python")
+        assert [r["type"] for r in results] == ["skill", "feedback"]
+
+    def test_partial_word_query(self, populated_memory):
+        """Test that substring queries still match inside words"""
+        results = populated_memory.search_memory("sql data")
+        assert [r["data"]["skill_name"] for r in results] == ["MySQL Database"]
+
+    def test_mid_word_queries(self, populated_memory):
+        """Test substrings shorter and longer than the n-gram size inside words"""
+        assert [r["type"] for r in populated_memory.search_memory("ytho")] == ["skill", "feedback"]
+        assert [r["data"]["skill_name"] for r in populated_memory.search_memory("ql")] == ["MySQL Database"]
+        assert populated_memory.search_memory("pythonic") == []
+
+    def test_vocabulary_not_scanned(self, populated_memory):
+        """Test that lookups go through the n-gram index instead of every token"""
+        index, grams, texts = populated_memory._get_search_index()
+        populated_memory._search_index = (ScanGuardDict(index), grams, texts)
+
+        assert len(populated_memory.search_memory("scripting")) == 1
+
+    def test_punctuation_query(self, populated_memory):
+        """Test queries without word characters fall back to a full scan"""
+        assert len(populated_memory.search_memory("/")) == 1
+
+    def test_index_refreshes_after_mutation(self, populated_memory):
+        """Test that newly added entries are searchable"""
+        assert populated_memory.search_memory("kubernetes") == []
+
+        populated_memory.add_skill_memory(make_skill("Kubernetes"))
+        assert len(populated_memory.search_memory("kubernetes")) == 1